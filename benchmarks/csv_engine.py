@@ -0,0 +1,94 @@
+"""Compares writing a csv file with the pandas and pyarrow engines of to_csv.
+
+The frame is written in chunks the way to_csv writes a file read with a chunksize. Each engine
+runs in a fresh subprocess and prints the sha256 of the file it wrote so the outputs can be checked
+to be identical.
+
+Usage: python benchmarks/csv_engine.py [--rows 10000000] [--chunksize 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from sas7bdat_converter.converter import _ArrowCsvWriter, _CsvWriter
+
+
+def build_chunk(seed: int, rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(10):
+        values = rng.normal(0, 1_000, rows).round(rng.integers(0, 6))
+        values[rng.random(rows) < 0.05] = np.nan
+        data[f"num_{i}"] = values
+    words = np.array(["plain", 'with "quotes"', "with, comma", "ünïcödé", ""], dtype=object)
+    for i in range(5):
+        data[f"str_{i}"] = pd.array(words[rng.integers(0, len(words), rows)], dtype="str")
+    days = rng.integers(-3_650, 20_000, rows)
+    data["date"] = pd.to_datetime(days, unit="D", origin="1960-01-01").astype("datetime64[s]")
+    seconds = days * 86_400 + rng.integers(0, 86_400, rows)
+    data["datetime"] = pd.to_datetime(seconds, unit="s", origin="1960-01-01")
+    return pd.DataFrame(data)
+
+
+def run(impl: str, rows: int, chunksize: int) -> None:
+    chunks = [
+        build_chunk(seed, min(chunksize, rows - start))
+        for seed, start in enumerate(range(0, rows, chunksize))
+    ]
+    writer_class = _ArrowCsvWriter if impl == "pyarrow" else _CsvWriter
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        export_file = Path(tmp_dir) / "export.csv"
+        start = time.perf_counter()
+        with writer_class(export_file) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        elapsed = time.perf_counter() - start
+        size = export_file.stat().st_size / 1024**2
+        # The file is hashed as it is read, the 10 million row file is larger than some test boxes
+        # have memory to spare.
+        with open(export_file, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()[:16]
+
+    print(f"{impl:>10}: {elapsed:8.3f}s  {size / elapsed:8.1f} MiB/s  sha256 {digest}")  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--impl", choices=["pandas", "pyarrow"])
+    args = parser.parse_args()
+
+    if args.impl:
+        run(args.impl, args.rows, args.chunksize)
+        return
+
+    print(f"{args.rows} rows x 17 columns in chunks of {args.chunksize}")  # noqa: T201
+    for impl in ("pandas", "pyarrow"):
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--impl",
+                impl,
+                "--rows",
+                str(args.rows),
+                "--chunksize",
+                str(args.chunksize),
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
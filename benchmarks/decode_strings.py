@@ -0,0 +1,84 @@
+"""Compares the old stack/unstack string decoding with the per-column decoding in to_dataframe.
+
+Each implementation runs in a fresh subprocess so the reported peak RSS is not polluted by the
+other run.
+
+Usage: python benchmarks/decode_strings.py [--rows 50000] [--columns 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sas7bdat_converter.converter import _decode_strings
+
+
+def stack_unstack_decode(df: pd.DataFrame) -> pd.DataFrame:
+    str_df = df.select_dtypes(include="object")
+    if len(str_df.columns) > 0:
+        str_df = str_df.stack().str.decode("utf-8").unstack()
+
+        for col in str_df:
+            df[col] = str_df[col]
+
+    return df
+
+
+def build_frame(rows: int, columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    words = np.array([f"value {i}".encode() for i in range(1_000)], dtype=object)
+    data = {f"str_{i}": words[rng.integers(0, len(words), rows)] for i in range(columns)}
+    data["num"] = rng.random(rows)
+    return pd.DataFrame(data)
+
+
+def run(impl: str, rows: int, columns: int) -> None:
+    df = build_frame(rows, columns)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    decode = stack_unstack_decode if impl == "stack" else _decode_strings
+    start = time.perf_counter()
+    decode(df)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    if sys.platform == "darwin":  # ru_maxrss is reported in bytes on macOS and KiB on Linux
+        peak //= 1024
+    print(f"{impl:>10}: {elapsed:8.3f}s  peak RSS increase {peak / 1024:8.1f} MiB")  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--impl", choices=["stack", "per-column"])
+    args = parser.parse_args()
+
+    if args.impl:
+        run(args.impl, args.rows, args.columns)
+        return
+
+    print(f"{args.rows} rows x {args.columns} string columns")  # noqa: T201
+    for impl in ("stack", "per-column"):
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--impl",
+                impl,
+                "--rows",
+                str(args.rows),
+                "--columns",
+                str(args.columns),
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
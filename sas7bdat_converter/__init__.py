@@ -1,34 +1,122 @@
+from sas7bdat_converter.aio import (  # noqa: F401
+    abatch_convert,
+    abatch_to_csv,
+    abatch_to_excel,
+    abatch_to_feather,
+    abatch_to_json,
+    abatch_to_parquet,
+    abatch_to_xml,
+    aconvert,
+    adir_convert,
+    adir_to_csv,
+    adir_to_excel,
+    adir_to_feather,
+    adir_to_json,
+    adir_to_parquet,
+    adir_to_xml,
+    aiter_dataframes,
+    aread_metadata,
+    ato_csv,
+    ato_dataframe,
+    ato_excel,
+    ato_feather,
+    ato_json,
+    ato_parquet,
+    ato_xml,
+)
 from sas7bdat_converter.converter import (  # noqa: F401
+    ConversionResult,
+    FileMetadata,
+    MetricsCollector,
+    MetricsSink,
+    batch_convert,
     batch_to_csv,
     batch_to_excel,
+    batch_to_feather,
     batch_to_json,
+    batch_to_parquet,
     batch_to_xml,
+    clear_cache,
+    convert,
+    dir_convert,
     dir_to_csv,
     dir_to_excel,
+    dir_to_feather,
     dir_to_json,
+    dir_to_parquet,
     dir_to_xml,
+    iter_dataframes,
+    read_metadata,
+    set_cache_size,
+    set_disk_cache,
+    set_metrics_sink,
     to_csv,
     to_dataframe,
     to_excel,
+    to_feather,
     to_json,
+    to_parquet,
     to_xml,
 )
 
 __version__ = "4.0.0"
 
 __all__ = [
+    "ConversionResult",
+    "FileMetadata",
+    "MetricsCollector",
+    "MetricsSink",
+    "abatch_convert",
+    "abatch_to_csv",
+    "abatch_to_excel",
+    "abatch_to_feather",
+    "abatch_to_json",
+    "abatch_to_parquet",
+    "abatch_to_xml",
+    "aconvert",
+    "adir_convert",
+    "adir_to_csv",
+    "adir_to_excel",
+    "adir_to_feather",
+    "adir_to_json",
+    "adir_to_parquet",
+    "adir_to_xml",
+    "aiter_dataframes",
+    "aread_metadata",
+    "ato_csv",
+    "ato_dataframe",
+    "ato_excel",
+    "ato_feather",
+    "ato_json",
+    "ato_parquet",
+    "ato_xml",
+    "batch_convert",
     "batch_to_csv",
     "batch_to_excel",
+    "batch_to_feather",
     "batch_to_json",
+    "batch_to_parquet",
     "batch_to_xml",
+    "clear_cache",
+    "convert",
+    "dir_convert",
     "dir_to_csv",
     "dir_to_excel",
+    "dir_to_feather",
     "dir_to_json",
+    "dir_to_parquet",
     "dir_to_xml",
+    "iter_dataframes",
+    "read_metadata",
+    "set_cache_size",
+    "set_disk_cache",
+    "set_metrics_sink",
     "to_csv",
     "to_dataframe",
     "to_excel",
+    "to_feather",
     "to_json",
+    "to_parquet",
     "to_xml",
 ]
 
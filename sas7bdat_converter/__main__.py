@@ -0,0 +1,5 @@
+import sys
+
+from sas7bdat_converter.cli import main
+
+sys.exit(main())
@@ -0,0 +1,798 @@
+"""Async versions of the conversion functions for use in asyncio applications.
+
+The files are read and written on an executor so the event loop is not blocked. Each function
+takes the same arguments as the function of the same name without the leading "a", plus:
+
+    executor: The concurrent.futures executor to run the work on. Default = None, which uses the
+        default executor of the running event loop.
+
+When the task awaiting a function is cancelled the conversion stops before the next chunk is
+read, the same way as when reading the file fails, and the CancelledError is raised once the
+conversion has stopped. A conversion that is not read in chunks, or that has already started in
+a process pool, can not be stopped and runs to the end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from sas7bdat_converter.converter import (
+    _DEFAULT_CHUNKSIZE,
+    ConversionResult,
+    FileMetadata,
+    _batch_convert_tasks,
+    _batch_tasks,
+    _batch_xml_tasks,
+    _call_cancellable,
+    _conversion_results,
+    _convert,
+    _dir_tasks,
+    _export_paths,
+    _ExportFile,
+    _raise_on_invalid_convert_extensions,
+    _SasSource,
+    _Task,
+    convert,
+    iter_dataframes,
+    read_metadata,
+    to_csv,
+    to_dataframe,
+    to_excel,
+    to_feather,
+    to_json,
+    to_parquet,
+    to_xml,
+)
+
+
+async def abatch_convert(
+    file_dicts: list[dict[str, Any]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files into several export formats at once.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each export file.
+    """
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    tasks = _batch_convert_tasks(file_dicts, options)
+
+    return await _run_conversions(tasks, continue_on_error, verbose, limit, executor)
+
+
+async def abatch_to_csv(
+    file_dicts: list[dict[str, str | Path]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    compression: str | None = "infer",
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files to csv files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    options = {
+        "chunksize": chunksize,
+        "columns": columns,
+        "where": where,
+        "compression": compression,
+    }
+    tasks = _batch_tasks("csv", file_dicts, options)
+
+    return await _run_conversions(tasks, continue_on_error, verbose, limit, executor)
+
+
+async def abatch_to_excel(
+    file_dicts: list[dict[str, str | Path]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files to xlsx files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    tasks = _batch_tasks("xlsx", file_dicts, options)
+
+    return await _run_conversions(tasks, continue_on_error, verbose, limit, executor)
+
+
+async def abatch_to_feather(
+    file_dicts: list[dict[str, str | Path]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files to feather files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    tasks = _batch_tasks("feather", file_dicts, options)
+
+    return await _run_conversions(tasks, continue_on_error, verbose, limit, executor)
+
+
+async def abatch_to_json(
+    file_dicts: list[dict[str, str | Path]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    lines: bool = False,
+    compression: str | None = "infer",
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files to json files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    options = {
+        "chunksize": chunksize,
+        "columns": columns,
+        "where": where,
+        "compression": compression,
+    }
+    tasks = _batch_tasks("jsonl" if lines else "json", file_dicts, options)
+
+    return await _run_conversions(tasks, continue_on_error, verbose, limit, executor)
+
+
+async def abatch_to_parquet(
+    file_dicts: list[dict[str, str | Path]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files to parquet files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    tasks = _batch_tasks("parquet", file_dicts, options)
+
+    return await _run_conversions(tasks, continue_on_error, verbose, limit, executor)
+
+
+async def abatch_to_xml(
+    file_dicts: list[dict[str, str | Path]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    compression: str | None = "infer",
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files to xml files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    options = {
+        "chunksize": chunksize,
+        "columns": columns,
+        "where": where,
+        "compression": compression,
+    }
+    tasks = _batch_xml_tasks(file_dicts, options)
+
+    return await _run_conversions(tasks, continue_on_error, verbose, limit, executor)
+
+
+async def aconvert(
+    sas7bdat_file: str | Path,
+    outputs: list[str | Path],
+    *,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into several export formats at once."""
+    await _run(executor, convert, sas7bdat_file, outputs, **kwargs)
+
+
+async def adir_convert(
+    dir_path: str | Path,
+    formats: list[str],
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into several export formats at once.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each export file.
+    """
+    extensions = [extension.lstrip(".") for extension in formats]
+    _raise_on_invalid_convert_extensions([f"file.{extension}" for extension in extensions])
+
+    return await _walk_dir(
+        "convert",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        limit=limit,
+        executor=executor,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+        formats=extensions,
+    )
+
+
+async def adir_to_csv(
+    dir_path: str | Path,
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+    compression: str | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into csv files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    return await _walk_dir(
+        "csv",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        limit=limit,
+        executor=executor,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+        compression=compression,
+    )
+
+
+async def adir_to_excel(
+    dir_path: str | Path,
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into xlsx files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    return await _walk_dir(
+        "xlsx",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        limit=limit,
+        executor=executor,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+    )
+
+
+async def adir_to_feather(
+    dir_path: str | Path,
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into feather files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    return await _walk_dir(
+        "feather",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        limit=limit,
+        executor=executor,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+    )
+
+
+async def adir_to_json(
+    dir_path: str | Path,
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    lines: bool = False,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+    compression: str | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into json files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    return await _walk_dir(
+        "jsonl" if lines else "json",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        limit=limit,
+        executor=executor,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+        compression=compression,
+    )
+
+
+async def adir_to_parquet(
+    dir_path: str | Path,
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into parquet files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    return await _walk_dir(
+        "parquet",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        limit=limit,
+        executor=executor,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+    )
+
+
+async def adir_to_xml(
+    dir_path: str | Path,
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+    compression: str | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into xml files.
+
+    args:
+        limit: The number of files converted at the same time. Default = None, which leaves the
+            limit to the number of workers in the executor.
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    return await _walk_dir(
+        "xml",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        limit=limit,
+        executor=executor,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+        compression=compression,
+    )
+
+
+async def aiter_dataframes(
+    sas7bdat_file: _SasSource,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+    *,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> AsyncIterator[pd.DataFrame]:
+    """Reads a sas7bdat and/or xpt file as a series of pandas dataframes.
+
+    Each chunk is read on the executor and handed back as soon as it is ready. The executor has to
+    run in this process, so a process pool can not be used.
+
+    return:
+        An async generator of pandas dataframes containing the data from the sas7bdat file.
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        raise ValueError("aiter_dataframes can not be run on a process pool")
+
+    loop = asyncio.get_running_loop()
+    chunks = iter_dataframes(sas7bdat_file, chunksize, **kwargs)
+    event = threading.Event()
+    future: asyncio.Future | None = None
+    try:
+        while True:
+            future = loop.run_in_executor(executor, _call_cancellable, event, next, chunks, None)
+            # The read is shielded so a cancelled read is left to finish before the file is closed.
+            chunk = await asyncio.shield(future)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        event.set()
+        if future is not None and not future.done():
+            future.add_done_callback(lambda _: chunks.close())
+        else:
+            chunks.close()
+
+
+async def aread_metadata(
+    sas7bdat_file: _SasSource, *, executor: Executor | None = None
+) -> FileMetadata:
+    """Reads the row count and column information from a sas7bdat and/or xpt file."""
+    return await _run(executor, read_metadata, sas7bdat_file)
+
+
+async def ato_csv(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a csv file."""
+    await _run(executor, to_csv, sas7bdat_file, export_file, **kwargs)
+
+
+async def ato_dataframe(
+    sas7bdat_file: _SasSource, *, executor: Executor | None = None, **kwargs: Any
+) -> pd.DataFrame:
+    """Converts a sas7bdat and/or xpt file into a pandas dataframe."""
+    return await _run(executor, to_dataframe, sas7bdat_file, **kwargs)
+
+
+async def ato_excel(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a xlsx file."""
+    await _run(executor, to_excel, sas7bdat_file, export_file, **kwargs)
+
+
+async def ato_feather(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a feather file."""
+    await _run(executor, to_feather, sas7bdat_file, export_file, **kwargs)
+
+
+async def ato_json(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a json file."""
+    await _run(executor, to_json, sas7bdat_file, export_file, **kwargs)
+
+
+async def ato_parquet(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a parquet file."""
+    await _run(executor, to_parquet, sas7bdat_file, export_file, **kwargs)
+
+
+async def ato_xml(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a xml file."""
+    await _run(executor, to_xml, sas7bdat_file, export_file, **kwargs)
+
+
+async def _run(
+    executor: Executor | None, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    if isinstance(executor, ProcessPoolExecutor):
+        return await loop.run_in_executor(executor, call)
+
+    event = threading.Event()
+    future = loop.run_in_executor(executor, _call_cancellable, event, call)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # Stop the conversion at the next chunk and wait for it so the export file is closed.
+        event.set()
+        with contextlib.suppress(Exception):
+            await future
+        raise
+
+
+async def _run_conversions(
+    tasks: list[_Task],
+    continue_on_error: bool,
+    verbose: bool,
+    limit: int | None,
+    executor: Executor | None,
+) -> list[ConversionResult]:
+    semaphore = asyncio.Semaphore(limit) if limit else None
+    # Conversions that write the same export file run one after the other.
+    writing: dict[str, asyncio.Lock] = {}
+
+    async def run(task: _Task) -> list[ConversionResult]:
+        _, sas7bdat_file, export_file, _ = task
+        async with contextlib.AsyncExitStack() as stack:
+            for export_path in sorted(_export_paths(export_file)):
+                await stack.enter_async_context(writing.setdefault(export_path, asyncio.Lock()))
+            await stack.enter_async_context(semaphore or contextlib.nullcontext())
+            try:
+                stats = await _run(executor, _convert, *task)
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                if verbose:
+                    print(f"Error converting {sas7bdat_file}")  # noqa: T201
+                return _conversion_results(sas7bdat_file, export_file, "failed", e)
+
+        return _conversion_results(sas7bdat_file, export_file, "converted", stats=stats)
+
+    runs = [asyncio.ensure_future(run(task)) for task in tasks]
+    try:
+        completed = await asyncio.gather(*runs)
+    except BaseException:
+        # Stop the other conversions before the error is raised.
+        for conversion in runs:
+            conversion.cancel()
+        await asyncio.gather(*runs, return_exceptions=True)
+        raise
+
+    return [result for results in completed for result in results]
+
+
+async def _walk_dir(
+    file_type: str,
+    dir_path: str | Path,
+    export_path: str | Path | None = None,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    limit: int | None = None,
+    executor: Executor | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+    formats: list[str] | None = None,
+    compression: str | None = None,
+) -> list[ConversionResult]:
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    if compression is not None:
+        options["compression"] = compression
+    scanned, tasks = _dir_tasks(
+        file_type,
+        dir_path,
+        export_path,
+        continue_on_error,
+        verbose,
+        options,
+        incremental,
+        recursive,
+        include,
+        exclude,
+        formats,
+    )
+    # Scanning the directory also touches the disk so it is not done on the event loop.
+    task_list = await asyncio.get_running_loop().run_in_executor(None, list, tasks)
+    results = await _run_conversions(task_list, continue_on_error, verbose, limit, executor)
+    return scanned + results
@@ -0,0 +1,323 @@
+"""The sas7bdat-converter command.
+
+    sas7bdat-converter convert file.sas7bdat file.csv [file.parquet ...]
+    sas7bdat-converter dir /path/to/sas7bdat_files [/path/to/export] --format csv --jobs 0
+    sas7bdat-converter batch manifest.csv --jobs 8
+
+Progress and errors are written to stderr so the converted file can be written to stdout. The exit
+status is 1 if any file failed to convert.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from sas7bdat_converter import __version__
+from sas7bdat_converter.converter import (
+    _COMPRESSIBLE_EXTENSIONS,
+    _COMPRESSION_EXTENSIONS,
+    ConversionResult,
+    _batch_convert_tasks,
+    _compression_extension,
+    _convert_file,
+    _run_conversions,
+    _walk_dir,
+    convert,
+)
+
+# The export formats, named after the extension of the files they write. jsonl writes JSON Lines.
+_FORMATS = ["csv", "feather", "json", "jsonl", "parquet", "xlsx", "xml"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the sas7bdat-converter command and returns the exit status.
+
+    args:
+        argv: The command line arguments, without the program name. Default = None, which uses
+            sys.argv.
+
+    return:
+        0 if every file was converted or skipped, otherwise 1.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.run(parser, args)
+    except BrokenPipeError:
+        # The command reading stdout, such as head, exited before the whole file was written.
+        # stdout is pointed at devnull so Python does not fail again flushing it on exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except Exception as e:
+        _echo(f"error: {e}")
+        return 1
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument(
+        "--chunksize",
+        type=int,
+        help="Read and write this many rows at a time instead of loading whole files into memory",
+    )
+    options.add_argument(
+        "--columns",
+        type=_split_columns,
+        help="A comma separated list of the columns to export, such as id,name,age",
+    )
+    options.add_argument("--where", help='A query string used to select rows, such as "age > 30"')
+    options.add_argument(
+        "-q", "--quiet", action="store_true", help="Only write errors, without progress"
+    )
+
+    jobs = argparse.ArgumentParser(add_help=False)
+    jobs.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of files to convert in parallel, 0 uses one per CPU. Default = 1",
+    )
+    jobs.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first file that fails instead of converting the rest",
+    )
+
+    compression = argparse.ArgumentParser(add_help=False)
+    compression.add_argument(
+        "--compression",
+        choices=sorted(_COMPRESSION_EXTENSIONS.values()),
+        help="Compress csv, json and xml export files",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="sas7bdat-converter",
+        description="Convert sas7bdat and xport files into other formats.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    commands = parser.add_subparsers(title="commands", required=True)
+
+    convert_parser = commands.add_parser(
+        "convert",
+        parents=[options, compression],
+        help="Convert one file into one or more formats",
+        description="Convert one file, reading it once for all of the export files. The format "
+        "of each export file is taken from its extension unless --format is given. Use - to read "
+        "from stdin or, with --format, to write to stdout.",
+    )
+    convert_parser.add_argument("sas7bdat_file")
+    convert_parser.add_argument("export_files", nargs="+", metavar="export_file")
+    convert_parser.add_argument("-f", "--format", choices=_FORMATS)
+    convert_parser.set_defaults(run=_run_convert)
+
+    dir_parser = commands.add_parser(
+        "dir",
+        parents=[options, jobs, compression],
+        help="Convert all files in a directory",
+        description="Convert every sas7bdat and xport file in a directory, including compressed "
+        "files and files in zip files, into each of the formats.",
+    )
+    dir_parser.add_argument("dir_path")
+    dir_parser.add_argument("export_path", nargs="?")
+    dir_parser.add_argument(
+        "-f",
+        "--format",
+        dest="formats",
+        action="append",
+        required=True,
+        choices=_FORMATS,
+        help="The format to convert into, can be given more than once",
+    )
+    dir_parser.add_argument("-r", "--recursive", action="store_true")
+    dir_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip files whose export files are newer than the sas7bdat file",
+    )
+    dir_parser.add_argument("--include", action="append", help="A glob of the files to convert")
+    dir_parser.add_argument("--exclude", action="append", help="A glob of the files to skip")
+    dir_parser.set_defaults(run=_run_dir)
+
+    batch_parser = commands.add_parser(
+        "batch",
+        parents=[options, jobs],
+        help="Convert the files listed in a manifest",
+        description="Convert the files listed in a json or csv manifest. A json manifest is a "
+        "list of objects and a csv manifest has a header row, both with sas7bdat_file and "
+        "export_file, and optionally root_node and first_node for xml files. The format is taken "
+        "from the extension of each export file and relative paths are relative to the manifest.",
+    )
+    batch_parser.add_argument("manifest")
+    batch_parser.set_defaults(run=_run_batch)
+
+    return parser
+
+
+def _echo(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)  # noqa: T201
+
+
+def _file_options(args: argparse.Namespace) -> dict[str, Any]:
+    return {"chunksize": args.chunksize, "columns": args.columns, "where": args.where}
+
+
+def _format_result(result: ConversionResult) -> str:
+    message = f"{result.status} {result.sas7bdat_file} -> {result.export_file}"
+    if result.status == "converted":
+        return f"{message} ({result.rows} rows, {result.bytes_written} bytes)"
+    if result.status == "failed":
+        return f"{message}: {type(result.error).__name__}: {result.error}"
+
+    return message
+
+
+def _read_manifest(manifest: str) -> list[dict[str, Any]]:
+    path = Path(manifest)
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = json.load(f) if path.suffix.lower() == ".json" else list(csv.DictReader(f))
+    if not isinstance(rows, list):
+        raise ValueError(f"{manifest} has to contain a list of files to convert")
+
+    file_dicts = []
+    for row in rows:
+        file_dict = {key: value for key, value in row.items() if value not in (None, "")}
+        for key in ("sas7bdat_file", "export_file"):
+            if key not in file_dict:
+                raise KeyError(f"{key} is missing from a file in {manifest}")
+            file_dict[key] = path.parent.joinpath(file_dict[key])
+        file_dict["export_files"] = [file_dict.pop("export_file")]
+        file_dicts.append(file_dict)
+
+    return file_dicts
+
+
+def _reporter(quiet: bool, total: int | None = None) -> Callable[[ConversionResult], None]:
+    done = 0
+
+    def report(result: ConversionResult) -> None:
+        nonlocal done
+        done += 1
+        if quiet and result.status != "failed":
+            return
+        count = f"{done}/{total}" if total is not None else str(done)
+        _echo(f"[{count}] {_format_result(result)}")
+
+    return report
+
+
+def _run_batch(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    file_dicts = _read_manifest(args.manifest)
+    tasks = _batch_convert_tasks(file_dicts, _file_options(args))
+    start = time.perf_counter()
+    results = _run_conversions(
+        tasks,
+        not args.fail_fast,
+        False,
+        _workers(args.jobs),
+        None,
+        on_result=_reporter(args.quiet, len(tasks)),
+    )
+    return _summarize(results, start, args.quiet)
+
+
+def _run_convert(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    sas7bdat_file: Any = sys.stdin.buffer if args.sas7bdat_file == "-" else args.sas7bdat_file
+    options = _file_options(args)
+    if args.format is None:
+        if "-" in args.export_files:
+            parser.error("--format is required to write to stdout")
+        if args.compression is not None:
+            parser.error("--compression requires --format, use an extension such as .csv.gz")
+        convert(sas7bdat_file, args.export_files, **options)
+    else:
+        if len(args.export_files) > 1:
+            parser.error("only one export file can be given with --format")
+        if args.compression is not None:
+            if f".{args.format}" not in _COMPRESSIBLE_EXTENSIONS:
+                parser.error(f"{args.format} files can not be compressed")
+            options["compression"] = args.compression
+        export_file = args.export_files[0]
+        _convert_file(
+            args.format, sas7bdat_file, sys.stdout if export_file == "-" else export_file, options
+        )
+
+    if not args.quiet:
+        _echo(f"converted {args.sas7bdat_file} -> {', '.join(args.export_files)}")
+    return 0
+
+
+def _run_dir(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    options = _file_options(args)
+    compression = args.compression
+    formats = list(dict.fromkeys(args.formats))
+    if compression is not None and not any(
+        f".{file_format}" in _COMPRESSIBLE_EXTENSIONS for file_format in formats
+    ):
+        parser.error(f"{', '.join(formats)} files can not be compressed")
+
+    if len(formats) == 1:
+        file_type = formats[0]
+        if f".{file_type}" not in _COMPRESSIBLE_EXTENSIONS:
+            compression = None
+        extensions = None
+    else:
+        # Several formats are written by convert, which takes the compression from the extension.
+        file_type = "convert"
+        extensions = [
+            f"{file_format}{_compression_extension(compression)}"
+            if f".{file_format}" in _COMPRESSIBLE_EXTENSIONS
+            else file_format
+            for file_format in formats
+        ]
+        compression = None
+
+    start = time.perf_counter()
+    results = _walk_dir(
+        file_type,
+        args.dir_path,
+        args.export_path,
+        continue_on_error=not args.fail_fast,
+        verbose=False,
+        workers=_workers(args.jobs),
+        incremental=args.incremental,
+        recursive=args.recursive,
+        include=args.include,
+        exclude=args.exclude,
+        formats=extensions,
+        compression=compression,
+        on_result=_reporter(args.quiet),
+        **options,
+    )
+    if not args.quiet:
+        for result in results:
+            if result.status == "skipped":
+                _echo(_format_result(result))
+    return _summarize(results, start, args.quiet)
+
+
+def _split_columns(value: str) -> list[str]:
+    return [column.strip() for column in value.split(",") if column.strip()]
+
+
+def _summarize(results: list[ConversionResult], start: float, quiet: bool) -> int:
+    counts = {status: 0 for status in ("converted", "skipped", "failed")}
+    for result in results:
+        counts[result.status] += 1
+    if not quiet:
+        summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+        _echo(f"{summary} in {time.perf_counter() - start:.1f}s")
+
+    return 1 if counts["failed"] else 0
+
+
+def _workers(jobs: int) -> int:
+    return jobs if jobs > 0 else os.cpu_count() or 1
@@ -1,10 +1,80 @@
 from __future__ import annotations
 
+import bz2
+import codecs
+import contextlib
 import csv
+import fnmatch
+import gzip
+import hashlib
+import heapq
+import io
+import itertools
+import lzma
+import os
+import queue
+import re
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
 from pathlib import Path
+from typing import IO, Any, TextIO
 from xml.sax.saxutils import escape
 
+import numpy as np
 import pandas as pd
+from pandas.io.sas.sas_xport import XportReader
+
+_DEFAULT_CHUNKSIZE = 100_000
+_XML_WRITE_ROWS = 10_000
+_EXCEL_MAX_ROWS = 1_048_576
+_DISCOVERY_POLL_SECONDS = 0.05
+_DEFAULT_CACHE_BYTES = 1024**3
+_DEFAULT_DISK_CACHE_BYTES = 10 * 1024**3
+
+_CONVERT_EXTENSIONS = (
+    ".csv",
+    ".json",
+    ".jsonl",
+    ".ndjson",
+    ".xlsx",
+    ".feather",
+    ".arrow",
+    ".parquet",
+    ".xml",
+)
+
+# The export formats that are written as a stream and can be compressed as a whole.
+_COMPRESSIBLE_EXTENSIONS = (".csv", ".json", ".jsonl", ".ndjson", ".xml")
+
+_COMPRESSION_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+
+_SAS_EXTENSIONS = (".sas7bdat", ".xpt")
+
+# file type, sas7bdat file, export file (or list of export files for convert), options
+_Task = tuple[str, str, str | list[str], dict[str, Any]]
+
+# A sas7bdat file given by name, as a readable binary file object or as the bytes of the file.
+_SasSource = str | Path | IO[bytes] | bytes | bytearray | memoryview
+
+# An export file given by name or as a writable binary or text file object.
+_ExportFile = str | Path | IO[Any]
+
+# The first bytes of every xport file, used to tell the format of a file that has no name.
+_XPORT_HEADER = b"HEADER RECORD*******LIBRARY HEADER RECORD!!!!!!!"
 
 _FILE_DICT_REQUIRED_KEYS = [
     "sas7bdat_file",
@@ -12,12 +82,201 @@ _FILE_DICT_REQUIRED_KEYS = [
 ]
 
 
+@dataclass
+class ConversionResult:
+    """The outcome of converting one file in a batch or directory conversion.
+
+    attributes:
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat.
+        export_file: The name, including the path, for the export file. For a zip file that could
+            not be read it is the directory the files in it would have been exported to.
+        status: "converted" if the file was converted, "failed" if there was an error, or
+            "skipped" if the export file was already up to date.
+        error: The exception raised when the conversion failed, otherwise None.
+        rows: The number of rows written to the export file.
+        columns: The number of columns written to the export file.
+        bytes_read: The size of the sas7bdat file in bytes.
+        bytes_written: The size of the export file in bytes.
+        read_seconds: The time spent reading the sas7bdat file.
+        decode_seconds: The time spent decoding the text columns.
+        transform_seconds: The time spent selecting columns and rows.
+        write_seconds: The time spent writing the export file.
+
+        The rows, columns, sizes and times are only set for files that were converted. When one
+        sas7bdat file is converted into several export files the read and decode times are for
+        all of them, and the write time is the total for every export file.
+    """
+
+    sas7bdat_file: str
+    export_file: str
+    status: str
+    error: BaseException | None = None
+    rows: int | None = None
+    columns: int | None = None
+    bytes_read: int | None = None
+    bytes_written: int | None = None
+    read_seconds: float | None = None
+    decode_seconds: float | None = None
+    transform_seconds: float | None = None
+    write_seconds: float | None = None
+
+
+@dataclass
+class FileMetadata:
+    """The header information for a sas7bdat or xpt file.
+
+    attributes:
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat.
+        file_format: "sas7bdat" or "xport".
+        row_count: The number of rows in the file.
+        column_names: The names of the columns in the file.
+        column_types: "numeric" or "char" for each column.
+        column_labels: The label for each column, or an empty string if there is no label.
+        column_formats: The SAS format for each column, or an empty string if there is no format.
+        encoding: The character encoding stored in the file header, or None if the file does not
+            record one.
+    """
+
+    sas7bdat_file: str
+    file_format: str
+    row_count: int
+    column_names: list[str]
+    column_types: list[str]
+    column_labels: list[str]
+    column_formats: list[str]
+    encoding: str | None = None
+
+
+class MetricsSink:
+    """Receives the timings and counters from reading and converting files.
+
+    The methods do nothing, subclass this and override them to send the metrics to a monitoring
+    system, then install it with set_metrics_sink. The methods are called from the thread doing
+    the conversion so they should be quick and thread safe.
+    """
+
+    def timing(self, stage: str, seconds: float) -> None:
+        """Called each time a stage finishes.
+
+        args:
+            stage: "read" for reading the sas7bdat file, "decode" for decoding the text columns,
+                "transform" for selecting columns and rows, or "write" for writing an export file.
+            seconds: The time the stage took.
+        """
+
+    def count(self, name: str, value: int) -> None:
+        """Called to add to a counter.
+
+        args:
+            name: "rows_read" for each chunk read from a sas7bdat file, or "rows_written" for each
+                chunk written to the export files.
+            value: The amount to add to the counter.
+        """
+
+
+class MetricsCollector(MetricsSink):
+    """A metrics sink that keeps the totals in memory.
+
+    attributes:
+        timings: The total seconds spent in each stage.
+        counts: The total for each counter.
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def timing(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+
+    def count(self, name: str, value: int) -> None:
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + value
+
+    def reset(self) -> None:
+        """Sets all of the totals back to zero."""
+        with self._lock:
+            self.timings.clear()
+            self.counts.clear()
+
+
+def batch_convert(
+    file_dicts: list[dict[str, Any]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files into several export formats at once.
+
+    Each sas7bdat file is only read once and every chunk is written to all of its export files.
+
+    Args:
+        file_dicts: A list dictionaries containing the files to convert. The dictionary should
+            contain the keys 'sas7bdat_file' (containing the path and name to the sas7bdat
+            file) and 'export_files' (containing a list of the paths and names of the export
+            files). The format of each export file is taken from its extension, and csv, json
+            and xml files are compressed when the extension ends with .gz, .bz2, .xz or .zst, such
+            as .csv.gz. Optionally the dictionary can also contain 'root_node' and 'first_node'
+            for xml export files.
+            Example: file_dict = [{'sas7bdat_file': 'sas_file1.sas7bdat',
+                                   'export_files': ['converted_file1.csv',
+                                                    'converted_file1.parquet']}]
+        continue_on_error: If set to true processing of files in a batch will continue if there is
+            a file conversion error instead of raising an exception. Default = False
+        verbose: Increases the output. Default = True
+        chunksize: The number of rows read at a time. Each chunk is written to every export file
+            before the next one is read. Default = 100000
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+
+    return:
+        A list of ConversionResult, one for each export file.
+    """
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    tasks = _batch_convert_tasks(file_dicts, options)
+
+    return _run_conversions(tasks, continue_on_error, verbose, workers, executor, memory_budget)
+
+
 def batch_to_csv(
     file_dicts: list[dict[str, str | Path]],
     *,
     continue_on_error: bool = False,
     verbose: bool = True,
-) -> None:
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    compression: str | None = "infer",
+) -> list[ConversionResult]:
     """Converts a batch of sas7bdat and/or xpt files to csv files.
 
     Args:
@@ -35,21 +294,41 @@ def batch_to_csv(
         continue_on_error: If set to true processing of files in a batch will continue if there is
             a file conversion error instead of raising an exception. Default = False
         verbose: Increases the output. Default = True
+        chunksize: If set the files are read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        compression: The compression to use for the export files, one of "gzip", "bz2", "xz" or
+            "zstd". If "infer" the compression of each file is taken from its extension, such as
+            .csv.gz, and None writes uncompressed files. zstd compresses on several threads and
+            requires zstandard. Default = "infer"
+
+    return:
+        A list of ConversionResult, one for each file.
     """
-    for file_dict in file_dicts:
-        _rise_on_invalid_file_dict(file_dict)
+    options = {
+        "chunksize": chunksize,
+        "columns": columns,
+        "where": where,
+        "compression": compression,
+    }
+    tasks = _batch_tasks("csv", file_dicts, options)
 
-        sas7bdat = _format_path(file_dict["sas7bdat_file"])
-        export = _format_path(file_dict["export_file"])
-        try:
-            to_csv(sas7bdat_file=sas7bdat, export_file=export)
-        except:  # noqa: E722
-            if continue_on_error and verbose:
-                print(f"Error converting {sas7bdat}")  # noqa: T201
-            elif continue_on_error:
-                pass
-            else:
-                raise
+    return _run_conversions(tasks, continue_on_error, verbose, workers, executor, memory_budget)
 
 
 def batch_to_excel(
@@ -57,7 +336,13 @@ def batch_to_excel(
     *,
     continue_on_error: bool = False,
     verbose: bool = True,
-) -> None:
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+) -> list[ConversionResult]:
     """Converts a batch of sas7bdat and/or xpt files to xlsx files.
 
     Args:
@@ -75,21 +360,90 @@ def batch_to_excel(
         continue_on_error: If set to true processing of files in a batch will continue if there is
             a file conversion error instead of raising an exception. Default = False
         verbose: Increases the output. Default = True
+        chunksize: If set the files are read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+
+    return:
+        A list of ConversionResult, one for each file.
     """
-    for file_dict in file_dicts:
-        _rise_on_invalid_file_dict(file_dict)
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    tasks = _batch_tasks("xlsx", file_dicts, options)
 
-        sas7bdat = _format_path(file_dict["sas7bdat_file"])
-        export = _format_path(file_dict["export_file"])
-        try:
-            to_excel(sas7bdat_file=sas7bdat, export_file=export)
-        except:  # noqa: E722
-            if continue_on_error and verbose:
-                print(f"Error converting {sas7bdat}")  # noqa: T201
-            elif continue_on_error:
-                pass
-            else:
-                raise
+    return _run_conversions(tasks, continue_on_error, verbose, workers, executor, memory_budget)
+
+
+def batch_to_feather(
+    file_dicts: list[dict[str, str | Path]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files to feather files.
+
+    Args:
+        file_dicts: A list dictionaries containing the files to convert. The dictionary should
+            contain the keys 'sas7bdat_file' (containing the path and name to the sas7bdat
+            file) and 'export_file' containing the path and name of the export feather).
+            Example: file_dict = [{
+                                      'sas7bdat_file': 'sas_file1.sas7bdat',
+                                      'export_file': 'converted_file1.feather',
+                                  },
+                                  {
+                                      'sas7bdat_file': 'sas_file2.sas7bdat',
+                                      'export_file': 'converted_file2.feather',
+                                  }]
+        continue_on_error: If set to true processing of files in a batch will continue if there is
+            a file conversion error instead of raising an exception. Default = False
+        verbose: Increases the output. Default = True
+        chunksize: If set the files are read this many rows at a time and each chunk is written
+            as a separate record batch instead of loading the whole file into memory.
+            Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    tasks = _batch_tasks("feather", file_dicts, options)
+
+    return _run_conversions(tasks, continue_on_error, verbose, workers, executor, memory_budget)
 
 
 def batch_to_json(
@@ -97,7 +451,15 @@ def batch_to_json(
     *,
     continue_on_error: bool = False,
     verbose: bool = True,
-) -> None:
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    lines: bool = False,
+    compression: str | None = "infer",
+) -> list[ConversionResult]:
     """Converts a batch of sas7bdat and/or xpt files to json files.
 
     Args:
@@ -115,21 +477,102 @@ def batch_to_json(
         continue_on_error: If set to true processing of files in a batch will continue if there is
             a file conversion error instead of raising an exception. Default = False
         verbose: Increases the output. Default = True
+        chunksize: If set the files are read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        lines: If set to true the files are written as JSON Lines, one json record per row,
+            instead of a single column oriented json document. JSON Lines files are written in
+            chunks so memory use stays flat regardless of the number of rows. Default = False
+        compression: The compression to use for the export files, one of "gzip", "bz2", "xz" or
+            "zstd". If "infer" the compression of each file is taken from its extension, such as
+            .json.gz, and None writes uncompressed files. zstd compresses on several threads and
+            requires zstandard. Default = "infer"
+
+    return:
+        A list of ConversionResult, one for each file.
     """
-    for file_dict in file_dicts:
-        _rise_on_invalid_file_dict(file_dict)
+    options = {
+        "chunksize": chunksize,
+        "columns": columns,
+        "where": where,
+        "compression": compression,
+    }
+    tasks = _batch_tasks("jsonl" if lines else "json", file_dicts, options)
+
+    return _run_conversions(tasks, continue_on_error, verbose, workers, executor, memory_budget)
 
-        sas7bdat = _format_path(file_dict["sas7bdat_file"])
-        export = _format_path(file_dict["export_file"])
-        try:
-            to_json(sas7bdat_file=sas7bdat, export_file=export)
-        except:  # noqa: E722
-            if continue_on_error and verbose:
-                print(f"Error converting {sas7bdat}")  # noqa: T201
-            elif continue_on_error:
-                pass
-            else:
-                raise
+
+def batch_to_parquet(
+    file_dicts: list[dict[str, str | Path]],
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+) -> list[ConversionResult]:
+    """Converts a batch of sas7bdat and/or xpt files to parquet files.
+
+    Args:
+        file_dicts: A list dictionaries containing the files to convert. The dictionary should
+            contain the keys 'sas7bdat_file' (containing the path and name to the sas7bdat
+            file) and 'export_file' containing the path and name of the export parquet).
+            Example: file_dict = [{
+                                      'sas7bdat_file': 'sas_file1.sas7bdat',
+                                      'export_file': 'converted_file1.parquet',
+                                  },
+                                  {
+                                      'sas7bdat_file': 'sas_file2.sas7bdat',
+                                      'export_file': 'converted_file2.parquet',
+                                  }]
+        continue_on_error: If set to true processing of files in a batch will continue if there is
+            a file conversion error instead of raising an exception. Default = False
+        verbose: Increases the output. Default = True
+        chunksize: If set the files are read this many rows at a time and each chunk is written
+            as a separate row group instead of loading the whole file into memory.
+            Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    tasks = _batch_tasks("parquet", file_dicts, options)
+
+    return _run_conversions(tasks, continue_on_error, verbose, workers, executor, memory_budget)
 
 
 def batch_to_xml(
@@ -137,7 +580,14 @@ def batch_to_xml(
     *,
     continue_on_error: bool = False,
     verbose: bool = True,
-) -> None:
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    compression: str | None = "infer",
+) -> list[ConversionResult]:
     """Converts a batch of sas7bdat and/or xpt files to xml files.
 
     Args:
@@ -163,60 +613,177 @@ def batch_to_xml(
         continue_on_error: If set to true processing of files in a batch will continue if there is
             a file conversion error instead of raising an exception. Default = False
         verbose: Increases the output. Default = True
+        chunksize: If set the files are read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        compression: The compression to use for the export files, one of "gzip", "bz2", "xz" or
+            "zstd". If "infer" the compression of each file is taken from its extension, such as
+            .xml.gz, and None writes uncompressed files. zstd compresses on several threads and
+            requires zstandard. Default = "infer"
+
+    return:
+        A list of ConversionResult, one for each file.
     """
-    optional_keys = [
-        "root_node",
-        "first_node",
-    ]
-    for file_dict in file_dicts:
-        error = False
-        if len(set(file_dict).intersection(_FILE_DICT_REQUIRED_KEYS)) != len(
-            _FILE_DICT_REQUIRED_KEYS
-        ) or len(set(file_dict).intersection(_FILE_DICT_REQUIRED_KEYS)) > len(
-            _FILE_DICT_REQUIRED_KEYS
-        ) + len(optional_keys):
-            error = True
-        elif len(set(file_dict).intersection(optional_keys)) != len(file_dict) - len(
-            _FILE_DICT_REQUIRED_KEYS
-        ):
-            error = True
+    options = {
+        "chunksize": chunksize,
+        "columns": columns,
+        "where": where,
+        "compression": compression,
+    }
+    tasks = _batch_xml_tasks(file_dicts, options)
 
-        if error:
-            message = _invalid_key_exception_message(
-                required_keys=_FILE_DICT_REQUIRED_KEYS, optional_keys=optional_keys
-            )
-            raise KeyError(message)
+    return _run_conversions(tasks, continue_on_error, verbose, workers, executor, memory_budget)
 
-        sas7bdat = _format_path(file_dict["sas7bdat_file"])
-        export = _format_path(file_dict["export_file"])
-        root_node = None
-        first_node = None
-        if "root_node" in file_dict:
-            root_node = file_dict["root_node"]
-        if "first_node" in file_dict:
-            first_node = file_dict["first_node"]
 
-        try:
-            if root_node and first_node:
-                to_xml(
-                    sas7bdat_file=sas7bdat,
-                    export_file=export,
-                    root_node=str(root_node),
-                    first_node=str(first_node),
-                )
-            elif root_node:
-                to_xml(sas7bdat_file=sas7bdat, export_file=export, root_node=str(root_node))
-            elif first_node:
-                to_xml(sas7bdat_file=sas7bdat, export_file=export, first_node=str(first_node))
-            else:
-                to_xml(sas7bdat_file=sas7bdat, export_file=export)
-        except:  # noqa: E722
-            if continue_on_error and verbose:
-                print(f"Error converting {sas7bdat}")  # noqa: T201
-            elif continue_on_error:
-                pass
-            else:
-                raise
+def clear_cache() -> None:
+    """Removes all dataframes from the to_dataframe cache."""
+    _dataframe_cache.clear()
+
+
+def convert(
+    sas7bdat_file: str | Path,
+    outputs: list[str | Path],
+    *,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    root_node: str = "root",
+    first_node: str = "item",
+) -> None:
+    """Converts a sas7bdat and/or xpt file into several export formats at once.
+
+    The file is only read and decoded once. Each chunk is written to every export file before the
+    next one is read.
+
+    args:
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat.
+        outputs: A list of the names, including the paths, for the export files. The format of
+            each file is taken from its extension: .csv, .json, .jsonl or .ndjson (JSON Lines),
+            .xlsx, .feather or .arrow, .parquet, or .xml. csv, json and xml files are compressed
+            when .gz, .bz2, .xz or .zst is added to the extension, such as .csv.gz.
+        chunksize: The number of rows read at a time. Default = 100000
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. Default = None
+        root_node: The name to use for the root node in xml files. Default = "root"
+        first_node: The name to use for the fist node in xml files. Default = "item"
+    """
+    _raise_on_invalid_convert_extensions(outputs)
+
+    chunks = _read_chunks(sas7bdat_file, chunksize or _DEFAULT_CHUNKSIZE, columns, where)
+    with contextlib.ExitStack() as stack:
+        writers = [
+            stack.enter_context(_open_writer(export_file, root_node, first_node))
+            for export_file in outputs
+        ]
+        _write_chunks(chunks, writers)
+
+
+def dir_convert(
+    dir_path: str | Path,
+    formats: list[str],
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into several export formats at once.
+
+    args:
+        dir_path: The path to the directory that contains the sas7bdat files
+            for conversion.
+        formats: A list of the extensions of the files to create for each sas7bdat file, for
+            example ["csv", "parquet"]. Valid formats are csv, json, jsonl, ndjson, xlsx,
+            feather, arrow, parquet and xml. csv, json and xml files are compressed when gz, bz2,
+            xz or zst is added to the format, such as "csv.gz".
+        export_path (optional): If used this can specify a new directory to create
+            the converted files into. If not supplied then the files will be
+            created into the same directory as dir_path. Default = None
+        continue_on_error: If set to true processing of files in a batch will continue if there is
+            a file conversion error instead of raising an exception. Default = False
+        verbose: Increases the output. Default = True
+        chunksize: The number of rows read at a time. Each chunk is written to every export file
+            before the next one is read. Default = 100000
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        incremental: If set to true files are only converted when one of the export files does
+            not exist or is older than the sas7bdat file. Files that are skipped are returned with
+            a status of "skipped". Default = False
+        recursive: If set to true sas7bdat files in sub-directories are also converted, and the
+            directory structure is recreated under export_path. Default = False
+        include: A glob pattern, or list of patterns, that files must match to be converted.
+            Patterns containing a "/" are matched against the path relative to dir_path, other
+            patterns against the file name. Default = None
+        exclude: A glob pattern, or list of patterns, for files that should not be converted.
+            Patterns are matched the same way as include. Default = None
+
+    return:
+        A list of ConversionResult, one for each export file.
+    """
+    extensions = [extension.lstrip(".") for extension in formats]
+    _raise_on_invalid_convert_extensions([f"file.{extension}" for extension in extensions])
+
+    return _walk_dir(
+        "convert",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        workers=workers,
+        executor=executor,
+        memory_budget=memory_budget,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+        formats=extensions,
+    )
 
 
 def dir_to_csv(
@@ -225,7 +792,18 @@ def dir_to_csv(
     *,
     continue_on_error: bool = False,
     verbose: bool = True,
-) -> None:
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+    compression: str | None = None,
+) -> list[ConversionResult]:
     """Converts all sas7bdat and/or xpt files in a directory into csv files.
 
     args:
@@ -237,8 +815,60 @@ def dir_to_csv(
         continue_on_error: If set to true processing of files in a batch will continue if there is
             a file conversion error instead of raising an exception. Default = False
         verbose: Increases the output. Default = True
+        chunksize: If set the files are read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        incremental: If set to true files are only converted when the export file does not exist
+            or is older than the sas7bdat file. Files that are skipped are returned with a status
+            of "skipped". Default = False
+        recursive: If set to true sas7bdat files in sub-directories are also converted, and the
+            directory structure is recreated under export_path. Default = False
+        include: A glob pattern, or list of patterns, that files must match to be converted.
+            Patterns containing a "/" are matched against the path relative to dir_path, other
+            patterns against the file name. Default = None
+        exclude: A glob pattern, or list of patterns, for files that should not be converted.
+            Patterns are matched the same way as include. Default = None
+        compression: The compression to use for the export files, one of "gzip", "bz2", "xz" or
+            "zstd". The extension of the compression, such as .gz, is added to the names of the
+            export files. zstd compresses on several threads and requires zstandard.
+            Default = None
+
+    return:
+        A list of ConversionResult, one for each file.
     """
-    _walk_dir("csv", dir_path, export_path, continue_on_error, verbose)
+    return _walk_dir(
+        "csv",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        workers=workers,
+        executor=executor,
+        memory_budget=memory_budget,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+        compression=compression,
+    )
 
 
 def dir_to_excel(
@@ -247,7 +877,17 @@ def dir_to_excel(
     *,
     continue_on_error: bool = False,
     verbose: bool = True,
-) -> None:
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+) -> list[ConversionResult]:
     """Converts all sas7bdat and/or xpt files in a directory into xlsx files.
 
     args:
@@ -259,8 +899,135 @@ def dir_to_excel(
         continue_on_error: If set to true processing of files in a batch will continue if there is
             a file conversion error instead of raising an exception. Default = False
         verbose: Increases the output. Default = True
+        chunksize: If set the files are read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        incremental: If set to true files are only converted when the export file does not exist
+            or is older than the sas7bdat file. Files that are skipped are returned with a status
+            of "skipped". Default = False
+        recursive: If set to true sas7bdat files in sub-directories are also converted, and the
+            directory structure is recreated under export_path. Default = False
+        include: A glob pattern, or list of patterns, that files must match to be converted.
+            Patterns containing a "/" are matched against the path relative to dir_path, other
+            patterns against the file name. Default = None
+        exclude: A glob pattern, or list of patterns, for files that should not be converted.
+            Patterns are matched the same way as include. Default = None
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    return _walk_dir(
+        "xlsx",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        workers=workers,
+        executor=executor,
+        memory_budget=memory_budget,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+    )
+
+
+def dir_to_feather(
+    dir_path: str | Path,
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into feather files.
+
+    args:
+        dir_path: The path to the directory that contains the sas7bdat files
+            for conversion.
+        export_path (optional): If used this can specify a new directory to create
+            the converted files into. If not supplied then the files will be
+            created into the same directory as dir_path. Default = None
+        continue_on_error: If set to true processing of files in a batch will continue if there is
+            a file conversion error instead of raising an exception. Default = False
+        verbose: Increases the output. Default = True
+        chunksize: If set the files are read this many rows at a time and each chunk is written
+            as a separate record batch instead of loading the whole file into memory.
+            Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        incremental: If set to true files are only converted when the export file does not exist
+            or is older than the sas7bdat file. Files that are skipped are returned with a status
+            of "skipped". Default = False
+        recursive: If set to true sas7bdat files in sub-directories are also converted, and the
+            directory structure is recreated under export_path. Default = False
+        include: A glob pattern, or list of patterns, that files must match to be converted.
+            Patterns containing a "/" are matched against the path relative to dir_path, other
+            patterns against the file name. Default = None
+        exclude: A glob pattern, or list of patterns, for files that should not be converted.
+            Patterns are matched the same way as include. Default = None
+
+    return:
+        A list of ConversionResult, one for each file.
     """
-    _walk_dir("xlsx", dir_path, export_path, continue_on_error, verbose)
+    return _walk_dir(
+        "feather",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        workers=workers,
+        executor=executor,
+        memory_budget=memory_budget,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+    )
 
 
 def dir_to_json(
@@ -269,7 +1036,19 @@ def dir_to_json(
     *,
     continue_on_error: bool = False,
     verbose: bool = True,
-) -> None:
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    lines: bool = False,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+    compression: str | None = None,
+) -> list[ConversionResult]:
     """Converts all sas7bdat and/or xpt files in a directory into json files.
 
     args:
@@ -281,8 +1060,142 @@ def dir_to_json(
         continue_on_error: If set to true processing of files in a batch will continue if there is
             a file conversion error instead of raising an exception. Default = False
         verbose: Increases the output. Default = True
+        chunksize: If set the files are read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        lines: If set to true the files are written as JSON Lines with a .jsonl extension instead
+            of a single column oriented json document. Default = False
+        incremental: If set to true files are only converted when the export file does not exist
+            or is older than the sas7bdat file. Files that are skipped are returned with a status
+            of "skipped". Default = False
+        recursive: If set to true sas7bdat files in sub-directories are also converted, and the
+            directory structure is recreated under export_path. Default = False
+        include: A glob pattern, or list of patterns, that files must match to be converted.
+            Patterns containing a "/" are matched against the path relative to dir_path, other
+            patterns against the file name. Default = None
+        exclude: A glob pattern, or list of patterns, for files that should not be converted.
+            Patterns are matched the same way as include. Default = None
+        compression: The compression to use for the export files, one of "gzip", "bz2", "xz" or
+            "zstd". The extension of the compression, such as .gz, is added to the names of the
+            export files. zstd compresses on several threads and requires zstandard.
+            Default = None
+
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    return _walk_dir(
+        "jsonl" if lines else "json",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        workers=workers,
+        executor=executor,
+        memory_budget=memory_budget,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+        compression=compression,
+    )
+
+
+def dir_to_parquet(
+    dir_path: str | Path,
+    export_path: str | Path | None = None,
+    *,
+    continue_on_error: bool = False,
+    verbose: bool = True,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+) -> list[ConversionResult]:
+    """Converts all sas7bdat and/or xpt files in a directory into parquet files.
+
+    args:
+        dir_path: The path to the directory that contains the sas7bdat files
+            for conversion.
+        export_path (optional): If used this can specify a new directory to create
+            the converted files into. If not supplied then the files will be
+            created into the same directory as dir_path. Default = None
+        continue_on_error: If set to true processing of files in a batch will continue if there is
+            a file conversion error instead of raising an exception. Default = False
+        verbose: Increases the output. Default = True
+        chunksize: If set the files are read this many rows at a time and each chunk is written
+            as a separate row group instead of loading the whole file into memory.
+            Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        incremental: If set to true files are only converted when the export file does not exist
+            or is older than the sas7bdat file. Files that are skipped are returned with a status
+            of "skipped". Default = False
+        recursive: If set to true sas7bdat files in sub-directories are also converted, and the
+            directory structure is recreated under export_path. Default = False
+        include: A glob pattern, or list of patterns, that files must match to be converted.
+            Patterns containing a "/" are matched against the path relative to dir_path, other
+            patterns against the file name. Default = None
+        exclude: A glob pattern, or list of patterns, for files that should not be converted.
+            Patterns are matched the same way as include. Default = None
+
+    return:
+        A list of ConversionResult, one for each file.
     """
-    _walk_dir("json", dir_path, export_path, continue_on_error, verbose)
+    return _walk_dir(
+        "parquet",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        workers=workers,
+        executor=executor,
+        memory_budget=memory_budget,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+    )
 
 
 def dir_to_xml(
@@ -291,7 +1204,18 @@ def dir_to_xml(
     *,
     continue_on_error: bool = False,
     verbose: bool = True,
-) -> None:
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+    compression: str | None = None,
+) -> list[ConversionResult]:
     """Converts all sas7bdat and/or xpt files in a directory into xml files.
 
     args:
@@ -303,131 +1227,964 @@ def dir_to_xml(
         continue_on_error: If set to true processing of files in a batch will continue if there is
             a file conversion error instead of raising an exception. Default = False
         verbose: Increases the output. Default = True
-    """
-    _walk_dir("xml", dir_path, export_path, continue_on_error, verbose)
+        chunksize: If set the files are read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. A function has to be
+            picklable, such as a module level function, when workers is used. Default = None
+        workers: If set to more than 1 the files are converted in parallel in a process pool with
+            this many worker processes. The largest files are started first. Default = None
+        executor: An existing concurrent.futures executor to run the conversions on instead of
+            creating a process pool. The executor is not shut down when the conversions finish.
+            If workers is also set it limits how many files are given to the executor at a time,
+            otherwise the number of CPUs is used. Default = None
+        memory_budget: The number of bytes of sas7bdat data allowed to be converted at the same
+            time when the files are converted in parallel. The amount needed for each file is
+            estimated from its size, or the part of it that is read at once when chunksize is
+            set. A file larger than the budget is converted on its own. Default = None
+        incremental: If set to true files are only converted when the export file does not exist
+            or is older than the sas7bdat file. Files that are skipped are returned with a status
+            of "skipped". Default = False
+        recursive: If set to true sas7bdat files in sub-directories are also converted, and the
+            directory structure is recreated under export_path. Default = False
+        include: A glob pattern, or list of patterns, that files must match to be converted.
+            Patterns containing a "/" are matched against the path relative to dir_path, other
+            patterns against the file name. Default = None
+        exclude: A glob pattern, or list of patterns, for files that should not be converted.
+            Patterns are matched the same way as include. Default = None
+        compression: The compression to use for the export files, one of "gzip", "bz2", "xz" or
+            "zstd". The extension of the compression, such as .gz, is added to the names of the
+            export files. zstd compresses on several threads and requires zstandard.
+            Default = None
 
+    return:
+        A list of ConversionResult, one for each file.
+    """
+    return _walk_dir(
+        "xml",
+        dir_path,
+        export_path,
+        continue_on_error=continue_on_error,
+        verbose=verbose,
+        chunksize=chunksize,
+        columns=columns,
+        where=where,
+        workers=workers,
+        executor=executor,
+        memory_budget=memory_budget,
+        incremental=incremental,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+        compression=compression,
+    )
+
+
+def iter_dataframes(
+    sas7bdat_file: _SasSource,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+    *,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Reads a sas7bdat and/or xpt file as a series of pandas dataframes.
 
-def to_csv(sas7bdat_file: str | Path, export_file: str | Path) -> None:
-    """Converts a sas7bdat and/or xpt file into a csv file.
+    Only one chunk is held in memory at a time so this can be used for files that are too large
+    to fit into memory.
 
     args:
-        sas7bdat_file: The name, including the path, for the sas7bdat file.
-        export_file: The name, including the path, for the export file.
-    """
-    valid_extensions = (".csv",)
-    file_extension = Path(export_file).suffix
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat. A binary file object, or the bytes of the file, can be given
+            instead of a name, in which case the file can not be compressed.
+        chunksize: The number of rows to include in each dataframe. Default = 100000
+        columns: A list of the columns to include. Only these columns are decoded and kept in
+            each dataframe. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. Default = None
 
-    if not _is_valid_extension(valid_extensions, file_extension):
-        error_message = _file_extension_exception_message("to_csv", valid_extensions)
-        raise AttributeError(error_message)
+    return:
+        A generator of pandas dataframes containing the data from the sas7bdat file.
+    """
+    with _open_sas(sas7bdat_file, chunksize=chunksize) as reader:
+        for chunk in _timed_chunks(reader):
+            _raise_if_cancelled()
+            yield _prepare_chunk(chunk, sas7bdat_file, columns, where)
 
-    df = to_dataframe(sas7bdat_file)
-    df.to_csv(export_file, quoting=csv.QUOTE_NONNUMERIC, index=False)
 
+def read_metadata(sas7bdat_file: _SasSource) -> FileMetadata:
+    """Reads the row count and column information from a sas7bdat and/or xpt file.
 
-def to_dataframe(sas7bdat_file: str | Path) -> pd.DataFrame:
-    """Converts a sas7bdat and/or xpt file into a pandas dataframe.
+    Only the file header is parsed, none of the rows are read, so this is fast even for very large
+    files.
 
     args:
-        sas7bdat_file: The name, including the path, for the sas7bdat file.
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat. A binary file object, or the bytes of the file, can be given
+            instead of a name, in which case the file can not be compressed.
 
     return:
-        A pandas dataframe containing the data from the sas7bdat file.
+        A FileMetadata with the information from the file header.
     """
-    df = pd.read_sas(sas7bdat_file)
+    with contextlib.ExitStack() as stack:
+        kwargs: dict[str, Any] = {}
+        source = _open_source(stack, sas7bdat_file, kwargs)
+        reader = stack.enter_context(pd.read_sas(source, iterator=True, **kwargs))
+        if isinstance(reader, XportReader):
+            fields = reader.fields
+            return FileMetadata(
+                sas7bdat_file=_format_path(sas7bdat_file),
+                file_format="xport",
+                row_count=reader.nobs,
+                column_names=list(reader.columns),
+                column_types=[field["ntype"] for field in fields],
+                column_labels=[_decode_header_text(field["label"]) for field in fields],
+                column_formats=[_decode_header_text(field["nform"]) for field in fields],
+            )
 
-    # convert binary strings to utf-8
-    str_df = df.select_dtypes(include="object")
-    if len(str_df.columns) > 0:
-        str_df = str_df.stack().str.decode("utf-8").unstack()
+        return FileMetadata(
+            sas7bdat_file=_format_path(sas7bdat_file),
+            file_format="sas7bdat",
+            row_count=reader.row_count,
+            column_names=list(reader.column_names),
+            column_types=["char" if col.ctype == b"s" else "numeric" for col in reader.columns],
+            column_labels=[col.label for col in reader.columns],
+            column_formats=[col.format for col in reader.columns],
+            encoding=reader.inferred_encoding,
+        )
 
-        for col in str_df:
-            df[col] = str_df[col]
-    # end conversion to utf-8
 
-    return df
+def set_cache_size(max_bytes: int) -> None:
+    """Sets the most memory the to_dataframe cache can use.
 
+    The least recently used dataframes are removed when the cache is larger than this.
 
-def to_excel(sas7bdat_file: str | Path, export_file: str | Path) -> None:
-    """Converts a sas7bdat and/or xpt file into a xlsx file.
+    args:
+        max_bytes: The maximum number of bytes of dataframes to keep in the cache. Default = 1 GiB
+    """
+    _dataframe_cache.resize(max_bytes)
+
+
+def set_disk_cache(
+    cache_dir: str | Path | None, max_bytes: int = _DEFAULT_DISK_CACHE_BYTES
+) -> None:
+    """Sets a directory for to_dataframe to keep decoded copies of files in.
+
+    When to_dataframe is called with cache set to true a file that is not in the memory cache is
+    read from an Arrow IPC copy in this directory if there is one, instead of parsing the sas7bdat
+    file again. The copies are found by a hash of the file's contents, so a file that is changed in
+    place is never read from an out of date copy. The optional dependency pyarrow is required.
 
     args:
-        sas7bdat_file: The name, including the path, for the sas7bdat file.
-        export_file: The name, including the path, for the export file.
+        cache_dir: The directory to keep the copies in. It is created if it does not exist. None
+            stops using the disk cache.
+        max_bytes: The largest the directory is allowed to grow to. The least recently used
+            copies are removed when it is larger than this. Default = 10 GiB
     """
-    valid_extensions = (".xlsx",)
-    file_extension = Path(export_file).suffix
+    global _disk_cache
 
-    if not _is_valid_extension(valid_extensions, file_extension):
-        error_message = _file_extension_exception_message("to_excel", valid_extensions)
-        raise AttributeError(error_message)
+    if cache_dir is None:
+        _disk_cache = None
+        return
 
-    df = to_dataframe(sas7bdat_file)
     try:
-        df.to_excel(export_file, index=False)
+        _disk_cache = _DiskCache(Path(cache_dir), max_bytes)
     except ModuleNotFoundError as e:
         raise ModuleNotFoundError(
-            "The optional dependency openpyxl is required in order to convert to an Excel file"
+            "The optional dependency pyarrow is required in order to use a disk cache"
         ) from e
 
 
-def to_json(sas7bdat_file: str | Path, export_file: str | Path) -> None:
-    """Converts a sas7bdat and/or xpt file into a json file.
+def set_metrics_sink(sink: MetricsSink | None) -> None:
+    """Sets where the timings and counters from reading and converting files are sent.
+
+    Files converted in a process pool report to the sink of the worker process, not this one.
 
     args:
-        sas7bdat_file: The name, including the path, for the sas7bdat file.
-        export_file: The name, including the path, for the export file.
+        sink: A MetricsSink, such as a MetricsCollector, or None to stop sending metrics.
+            Default = None
     """
-    valid_extensions = (".json",)
-    file_extension = Path(export_file).suffix
+    global _metrics_sink
+    _metrics_sink = sink
 
-    if not _is_valid_extension(valid_extensions, file_extension):
+
+def to_csv(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    engine: str = "pandas",
+    compression: str | None = "infer",
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a csv file.
+
+    args:
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat. A binary file object, or the bytes of the file, can be given
+            instead of a name, in which case the file can not be compressed.
+        export_file: The name, including the path, for the export file, or a writable file object
+            such as sys.stdout.
+        chunksize: If set the file is read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. Default = None
+        engine: The library used to format the values, either "pandas" or "pyarrow". The pyarrow
+            engine writes the same file several times faster for large files, with any column it
+            can not format written by pandas, and requires pyarrow. Default = "pandas"
+        compression: The compression to use for the export file, one of "gzip", "bz2", "xz" or
+            "zstd". If "infer" the compression is taken from the extension of the export file,
+            such as .csv.gz, and None writes an uncompressed file. zstd compresses on several
+            threads and requires zstandard. Default = "infer"
+    """
+    if engine not in ("pandas", "pyarrow"):
+        raise ValueError(f'engine must be "pandas" or "pyarrow", got "{engine}"')
+
+    valid_extensions = (".csv",)
+
+    if _is_path(export_file) and not _is_valid_extension(
+        valid_extensions, _file_extension(export_file), allow_compression=True
+    ):
+        error_message = _file_extension_exception_message("to_csv", valid_extensions)
+        raise AttributeError(error_message)
+
+    compression = _infer_compression(export_file, compression)
+    chunks = _read_chunks(sas7bdat_file, chunksize, columns, where)
+    writer_class = _ArrowCsvWriter if engine == "pyarrow" else _CsvWriter
+    with writer_class(export_file, compression) as writer:
+        _write_chunks(chunks, [writer])
+
+
+def to_dataframe(
+    sas7bdat_file: _SasSource,
+    *,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    cache: bool = False,
+) -> pd.DataFrame:
+    """Converts a sas7bdat and/or xpt file into a pandas dataframe.
+
+    args:
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat. A binary file object, or the bytes of the file, can be given
+            instead of a name, in which case the file can not be compressed.
+        columns: A list of the columns to include. The file is read in chunks and only these
+            columns are decoded and kept, so memory use depends on the selected columns rather
+            than the full width of the file. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. Default = None
+        cache: If set to true the dataframe is kept in an in memory cache and returned again if
+            the file is read with the same options while its path, modification time and size
+            are unchanged. Changes made to the returned dataframe do not change the cached copy.
+            A where function, and a file object or bytes, can not be cached. Default = False
+
+    return:
+        A pandas dataframe containing the data from the sas7bdat file.
+    """
+    if cache and not callable(where) and _is_path(sas7bdat_file):
+        stat = _source_stat(sas7bdat_file)
+        key = (
+            str(Path(sas7bdat_file).resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            None if columns is None else tuple(columns),
+            where,
+        )
+        df = _dataframe_cache.get(key)
+        if df is None:
+            if _disk_cache is not None:
+                df = _read_disk_cache(_disk_cache, sas7bdat_file, columns, where)
+            else:
+                df = to_dataframe(sas7bdat_file, columns=columns, where=where)
+            _dataframe_cache.put(key, df)
+
+        # With copy-on-write the shallow copy shares the cached data until one of them is changed.
+        return df.copy(deep=False)
+
+    if columns is None and where is None:
+        with _open_sas(sas7bdat_file) as df:
+            return _decode_strings(df)
+
+    chunks = list(iter_dataframes(sas7bdat_file, _DEFAULT_CHUNKSIZE, columns=columns, where=where))
+    if not chunks:
+        with _open_sas(sas7bdat_file) as df:
+            return _prepare_chunk(df, sas7bdat_file, columns, where)
+
+    return pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+
+
+def to_excel(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a xlsx file.
+
+    args:
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat. A binary file object, or the bytes of the file, can be given
+            instead of a name, in which case the file can not be compressed.
+        export_file: The name, including the path, for the export file, or a writable binary file
+            object such as sys.stdout.buffer.
+        chunksize: If set the file is read this many rows at a time and streamed into a write-only
+            workbook instead of loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. Default = None
+
+    Excel sheets are limited to 1,048,576 rows. Files with more rows than that are split across
+    multiple sheets, each with its own header row.
+    """
+    valid_extensions = (".xlsx",)
+    if _is_path(export_file) and not _is_valid_extension(
+        valid_extensions, Path(export_file).suffix
+    ):
+        error_message = _file_extension_exception_message("to_excel", valid_extensions)
+        raise AttributeError(error_message)
+
+    chunks = _read_chunks(sas7bdat_file, chunksize, columns, where)
+    try:
+        if chunksize is None:
+            df = next(chunks)
+            if len(df) < _EXCEL_MAX_ROWS:
+                _count_rows(df)
+                with (
+                    _timed("write"),
+                    _remove_on_error(export_file),
+                    contextlib.ExitStack() as stack,
+                ):
+                    if not _is_path(export_file):
+                        export_file = stack.enter_context(
+                            _BorrowedFile(_binary_stream(export_file))
+                        )
+                    df.to_excel(export_file, index=False)
+                return
+            chunks = iter([df])
+
+        with _ExcelWriter(export_file) as writer:
+            _write_chunks(chunks, [writer])
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "The optional dependency openpyxl is required in order to convert to an Excel file"
+        ) from e
+
+
+def to_feather(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a feather (Arrow IPC) file.
+
+    args:
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat. A binary file object, or the bytes of the file, can be given
+            instead of a name, in which case the file can not be compressed.
+        export_file: The name, including the path, for the export file, or a writable binary file
+            object such as sys.stdout.buffer.
+        chunksize: If set the file is read this many rows at a time and each chunk is written as a
+            separate record batch instead of loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. Default = None
+    """
+    valid_extensions = (".feather", ".arrow")
+    if _is_path(export_file) and not _is_valid_extension(
+        valid_extensions, Path(export_file).suffix
+    ):
+        error_message = _file_extension_exception_message("to_feather", valid_extensions)
+        raise AttributeError(error_message)
+
+    chunks = _read_chunks(sas7bdat_file, chunksize, columns, where)
+    with _ArrowWriter(export_file, "feather") as writer:
+        _write_chunks(chunks, [writer])
+
+
+def to_json(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    lines: bool = False,
+    compression: str | None = "infer",
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a json file.
+
+    args:
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat. A binary file object, or the bytes of the file, can be given
+            instead of a name, in which case the file can not be compressed.
+        export_file: The name, including the path, for the export file, or a writable file object
+            such as sys.stdout.
+        chunksize: If set the file is read this many rows at a time instead of loading the whole
+            file into memory. The chunks are staged in a temporary file so the output is the same
+            as when the whole file is converted at once. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. Default = None
+        lines: If set to true the file is written as JSON Lines, one json record per row, instead
+            of a single column oriented json document. The rows are always read and written in
+            chunks in this mode, using chunksize if it is set. Default = False
+        compression: The compression to use for the export file, one of "gzip", "bz2", "xz" or
+            "zstd". If "infer" the compression is taken from the extension of the export file,
+            such as .json.gz, and None writes an uncompressed file. zstd compresses on several
+            threads and requires zstandard. Default = "infer"
+    """
+    valid_extensions = (".json", ".jsonl", ".ndjson")
+
+    if _is_path(export_file) and not _is_valid_extension(
+        valid_extensions, _file_extension(export_file), allow_compression=True
+    ):
         error_message = _file_extension_exception_message("to_json", valid_extensions)
         raise AttributeError(error_message)
 
-    df = to_dataframe(sas7bdat_file)
-    df.to_json(export_file, date_format="iso")
+    compression = _infer_compression(export_file, compression)
+    if lines:
+        chunks = _read_chunks(sas7bdat_file, chunksize or _DEFAULT_CHUNKSIZE, columns, where)
+        with _JsonLinesWriter(export_file, compression) as writer:
+            _write_chunks(chunks, [writer])
+        return
+
+    if chunksize is None:
+        df = to_dataframe(sas7bdat_file, columns=columns, where=where)
+        _count_rows(df)
+        with (
+            _timed("write"),
+            _remove_on_error(export_file),
+            _open_export(export_file, "w", compression, encoding="utf-8") as f,
+        ):
+            df.to_json(f, date_format="iso")
+        return
+
+    chunks = _read_chunks(sas7bdat_file, chunksize, columns, where)
+    with _JsonWriter(export_file, compression) as writer:
+        _write_chunks(chunks, [writer])
+
+
+def to_parquet(
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
+    *,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+) -> None:
+    """Converts a sas7bdat and/or xpt file into a parquet file.
+
+    args:
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat. A binary file object, or the bytes of the file, can be given
+            instead of a name, in which case the file can not be compressed.
+        export_file: The name, including the path, for the export file, or a writable binary file
+            object such as sys.stdout.buffer.
+        chunksize: If set the file is read this many rows at a time and each chunk is written as a
+            separate row group instead of loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. Default = None
+    """
+    valid_extensions = (".parquet",)
+    if _is_path(export_file) and not _is_valid_extension(
+        valid_extensions, Path(export_file).suffix
+    ):
+        error_message = _file_extension_exception_message("to_parquet", valid_extensions)
+        raise AttributeError(error_message)
+
+    chunks = _read_chunks(sas7bdat_file, chunksize, columns, where)
+    with _ArrowWriter(export_file, "parquet") as writer:
+        _write_chunks(chunks, [writer])
 
 
 def to_xml(
-    sas7bdat_file: str | Path,
-    export_file: str | Path,
+    sas7bdat_file: _SasSource,
+    export_file: _ExportFile,
     root_node: str = "root",
     first_node: str = "item",
+    *,
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    compression: str | None = "infer",
 ) -> None:
     """Converts a sas7bdat and/or xpt file into a xml file.
 
     args:
-        sas7bdat_file: The name, including the path, for the sas7bdat file.
-        export_file: The name, including the path, for the export file.
+        sas7bdat_file: The name, including the path, for the sas7bdat file. The file can be
+            compressed, such as file.sas7bdat.gz, or in a zip file, such as
+            bundle.zip/file.sas7bdat. A binary file object, or the bytes of the file, can be given
+            instead of a name, in which case the file can not be compressed.
+        export_file: The name, including the path, for the export file, or a writable file object
+            such as sys.stdout.
         root_node: The name to use for the root node in the xml file.
         first_node: The name to use for the fist node in the xml file.
+        chunksize: If set the file is read and written this many rows at a time instead of
+            loading the whole file into memory. Default = None
+        columns: A list of the columns to include. Only these columns are decoded and
+            exported. Default = None
+        where: A function that takes a dataframe and returns a boolean mask, or a query string
+            such as "age > 30", used to select the rows to include. It is applied to each chunk
+            as the file is read so rows that do not match are never kept. Default = None
+        compression: The compression to use for the export file, one of "gzip", "bz2", "xz" or
+            "zstd". If "infer" the compression is taken from the extension of the export file,
+            such as .xml.gz, and None writes an uncompressed file. zstd compresses on several
+            threads and requires zstandard. Default = "infer"
     """
     valid_extensions = (".xml",)
-    file_extension = Path(export_file).suffix
 
-    if not _is_valid_extension(valid_extensions, file_extension):
+    if _is_path(export_file) and not _is_valid_extension(
+        valid_extensions, _file_extension(export_file), allow_compression=True
+    ):
         error_message = _file_extension_exception_message("to_xml", valid_extensions)
         raise AttributeError(error_message)
 
-    df = to_dataframe(sas7bdat_file)
+    compression = _infer_compression(export_file, compression)
+    chunks = _read_chunks(sas7bdat_file, chunksize, columns, where)
+    with _XmlWriter(export_file, root_node, first_node, compression) as writer:
+        _write_chunks(chunks, [writer])
+
+
+def _batch_convert_tasks(file_dicts: list[dict[str, Any]], options: dict[str, Any]) -> list[_Task]:
+    required_keys = ["sas7bdat_file", "export_files"]
+    optional_keys = ["root_node", "first_node"]
+    for file_dict in file_dicts:
+        if not set(required_keys).issubset(file_dict) or not set(file_dict).issubset(
+            required_keys + optional_keys
+        ):
+            message = _invalid_key_exception_message(
+                required_keys=required_keys, optional_keys=optional_keys
+            )
+            raise KeyError(message)
+        _raise_on_invalid_convert_extensions(file_dict["export_files"])
+
+    tasks: list[_Task] = []
+    for file_dict in file_dicts:
+        file_options = dict(options)
+        for key in optional_keys:
+            if file_dict.get(key):
+                file_options[key] = str(file_dict[key])
+
+        tasks.append(
+            (
+                "convert",
+                _format_path(file_dict["sas7bdat_file"]),
+                [_format_path(export_file) for export_file in file_dict["export_files"]],
+                file_options,
+            )
+        )
+
+    return tasks
+
+
+def _batch_tasks(
+    file_type: str, file_dicts: list[dict[str, str | Path]], options: dict[str, Any]
+) -> list[_Task]:
+    for file_dict in file_dicts:
+        _rise_on_invalid_file_dict(file_dict)
+
+    return [
+        (
+            file_type,
+            _format_path(file_dict["sas7bdat_file"]),
+            _format_path(file_dict["export_file"]),
+            options,
+        )
+        for file_dict in file_dicts
+    ]
+
+
+def _batch_xml_tasks(
+    file_dicts: list[dict[str, str | Path]], options: dict[str, Any]
+) -> list[_Task]:
+    optional_keys = [
+        "root_node",
+        "first_node",
+    ]
+    for file_dict in file_dicts:
+        error = False
+        if len(set(file_dict).intersection(_FILE_DICT_REQUIRED_KEYS)) != len(
+            _FILE_DICT_REQUIRED_KEYS
+        ) or len(set(file_dict).intersection(_FILE_DICT_REQUIRED_KEYS)) > len(
+            _FILE_DICT_REQUIRED_KEYS
+        ) + len(optional_keys):
+            error = True
+        elif len(set(file_dict).intersection(optional_keys)) != len(file_dict) - len(
+            _FILE_DICT_REQUIRED_KEYS
+        ):
+            error = True
+
+        if error:
+            message = _invalid_key_exception_message(
+                required_keys=_FILE_DICT_REQUIRED_KEYS, optional_keys=optional_keys
+            )
+            raise KeyError(message)
+
+    tasks: list[_Task] = []
+    for file_dict in file_dicts:
+        file_options = dict(options)
+        for key in optional_keys:
+            if file_dict.get(key):
+                file_options[key] = str(file_dict[key])
+
+        tasks.append(
+            (
+                "xml",
+                _format_path(file_dict["sas7bdat_file"]),
+                _format_path(file_dict["export_file"]),
+                file_options,
+            )
+        )
+
+    return tasks
+
+
+def _binary_stream(f: IO[Any]) -> IO[bytes]:
+    if not isinstance(f, io.TextIOBase):
+        return f
+
+    buffer = getattr(f, "buffer", None)
+    if buffer is None:
+        raise TypeError(
+            f"Unable to write bytes to {_format_path(f)}, use a binary file object such as BytesIO"
+        )
+    # Anything already written as text has to reach the buffer before the bytes do.
+    f.flush()
+    return buffer
+
+
+def _call_cancellable(event: threading.Event, func: Callable[..., Any], *args: Any) -> Any:
+    _cancellation.event = event
+    try:
+        _raise_if_cancelled()
+        return func(*args)
+    finally:
+        _cancellation.event = None
+
+
+def _compression_extension(compression: str | None) -> str:
+    if compression in (None, "infer"):
+        return ""
+    for extension, name in _COMPRESSION_EXTENSIONS.items():
+        if name == compression:
+            return extension
+
+    raise ValueError(_compression_exception_message(compression))
+
+
+def _compression_exception_message(compression: str | None) -> str:
+    return f'compression must be one of "infer", "gzip", "bz2", "xz", "zstd" or None, got "{compression}"'
+
+
+def _count_rows(df: pd.DataFrame) -> None:
+    stats = getattr(_conversion_stats, "current", None)
+    if stats is not None:
+        stats.rows += len(df)
+        stats.columns = len(df.columns)
+    if _metrics_sink is not None:
+        _metrics_sink.count("rows_written", len(df))
+
+
+def _convert(
+    file_type: str, sas7bdat_file: str, export_file: str | list[str], options: dict[str, Any]
+) -> _ConversionStats:
+    stats = _ConversionStats(bytes_read=_file_size(sas7bdat_file))
+    _conversion_stats.current = stats
+    try:
+        _convert_file(file_type, sas7bdat_file, export_file, options)
+    finally:
+        _conversion_stats.current = None
+
+    return stats
+
+
+def _convert_file(
+    file_type: str, sas7bdat_file: str, export_file: str | list[str], options: dict[str, Any]
+) -> None:
+    if file_type == "convert":
+        convert(sas7bdat_file, export_file, **options)
+    elif file_type == "csv":
+        to_csv(sas7bdat_file, export_file, **options)
+    elif file_type == "json":
+        to_json(sas7bdat_file, export_file, **options)
+    elif file_type == "jsonl":
+        to_json(sas7bdat_file, export_file, lines=True, **options)
+    elif file_type == "xlsx":
+        to_excel(sas7bdat_file, export_file, **options)
+    elif file_type == "feather":
+        to_feather(sas7bdat_file, export_file, **options)
+    elif file_type == "parquet":
+        to_parquet(sas7bdat_file, export_file, **options)
+    elif file_type == "xml":
+        to_xml(sas7bdat_file, export_file, **options)
+
+
+def _decode_strings(df: pd.DataFrame) -> pd.DataFrame:
+    # convert binary strings to utf-8 one column at a time so the string data is only copied once
+    with _timed("decode"):
+        for col in df.select_dtypes(include="object").columns:
+            df[col] = df[col].str.decode("utf-8")
+
+    return df
+
+
+def _conversion_results(
+    sas7bdat_file: str,
+    export_file: str | list[str],
+    status: str,
+    error: BaseException | None = None,
+    stats: _ConversionStats | None = None,
+) -> list[ConversionResult]:
+    export_files = export_file if isinstance(export_file, list) else [export_file]
+    if stats is None:
+        return [ConversionResult(sas7bdat_file, f, status, error) for f in export_files]
+
+    return [
+        ConversionResult(
+            sas7bdat_file,
+            f,
+            status,
+            error,
+            rows=stats.rows,
+            columns=stats.columns,
+            bytes_read=stats.bytes_read,
+            bytes_written=os.path.getsize(f),
+            read_seconds=stats.read_seconds,
+            decode_seconds=stats.decode_seconds,
+            transform_seconds=stats.transform_seconds,
+            write_seconds=stats.write_seconds,
+        )
+        for f in export_files
+    ]
+
+
+def _data_size(sas7bdat_file: str | Path) -> int:
+    """Returns the size of a sas7bdat file once it is decompressed."""
+    zip_path = _split_zip_path(sas7bdat_file)
+    if zip_path is not None:
+        with zipfile.ZipFile(zip_path[0]) as archive:
+            return archive.getinfo(zip_path[1]).file_size
+
+    size = os.path.getsize(sas7bdat_file)
+    compression = _COMPRESSION_EXTENSIONS.get(Path(sas7bdat_file).suffix.lower())
+    if compression is None:
+        return size
+
+    with open(sas7bdat_file, "rb") as f:
+        if compression == "gzip":
+            # A gzip file ends with the decompressed size modulo 2**32. Deflate adds no more than a
+            # few bytes to each 64 KiB block, so a size well under the file size has wrapped.
+            f.seek(-4, os.SEEK_END)
+            data_size = int.from_bytes(f.read(4), "little")
+            while size - data_size > size // 1000 + 64:
+                data_size += 2**32
+            return data_size
+        if compression == "zstd":
+            data_size = _zstandard().frame_content_size(f.read(18))
+            if data_size >= 0:
+                return data_size
+            f.seek(0)
+
+        # bz2 and xz files, and zstd files written as a stream, do not record the decompressed
+        # size, so it is counted by decompressing the file.
+        opener = {"bz2": bz2.open, "xz": lzma.open, "zstd": lambda f: _zstandard().open(f, "rb")}
+        data_size = 0
+        with opener[compression](f) as decompressed:
+            while chunk := decompressed.read(1 << 20):
+                data_size += len(chunk)
+        return data_size
+
+
+def _decode_header_text(value: bytes) -> str:
+    return value.decode("latin-1").strip()
+
+
+def _dir_tasks(
+    file_type: str,
+    dir_path: str | Path,
+    export_path: str | Path | None,
+    continue_on_error: bool,
+    verbose: bool,
+    options: dict[str, Any],
+    incremental: bool,
+    recursive: bool,
+    include: str | list[str] | None,
+    exclude: str | list[str] | None,
+    formats: list[str] | None,
+) -> tuple[list[ConversionResult], Iterator[_Task]]:
+    # The skipped files, zip files that can not be read and files that would overwrite the export
+    # file of another file are only added to the list as the tasks are iterated.
+    path = dir_path if isinstance(dir_path, Path) else Path(dir_path)
+    extensions = (
+        formats
+        if formats is not None
+        else [file_type + _compression_extension(options.get("compression"))]
+    )
+    export_root = Path(export_path) if export_path else path
+    includes = [include] if isinstance(include, str) else include
+    excludes = [exclude] if isinstance(exclude, str) else exclude
+    scanned: list[ConversionResult] = []
+    # Export files that are already taken, mapped to the file exporting to them. file1.sas7bdat,
+    # file1.sas7bdat.gz and file1.sas7bdat in a zip file are all exported to file1.csv, so only
+    # the first one found is converted.
+    exporting: dict[str, Path] = {}
+
+    def zip_error(archive: Path, error: Exception) -> None:
+        if not continue_on_error:
+            raise error
+        if verbose:
+            print(f"Error reading {archive}")  # noqa: T201
+        export_dir = export_root.joinpath(archive.parent.relative_to(path))
+        scanned.append(ConversionResult(str(archive), str(export_dir), "failed", error))
+
+    def tasks() -> Iterator[_Task]:
+        for sas7bdat_file in _scan_dir(path, recursive, zip_error):
+            relative_path = sas7bdat_file.relative_to(path)
+            if includes and not _matches_patterns(relative_path, includes):
+                continue
+            if excludes and _matches_patterns(relative_path, excludes):
+                continue
+
+            export_dir = relative_path.parent
+            zip_path = _split_zip_path(sas7bdat_file)
+            if zip_path is not None:
+                # Files in a zip file are exported next to it, not into a directory named after it.
+                archive = Path(zip_path[0]).relative_to(path)
+                export_dir = archive.parent.joinpath(Path(zip_path[1]).parent)
+
+            stem = _sas_stem(sas7bdat_file)
+            export_files = [
+                export_root.joinpath(export_dir, f"{stem}.{extension}") for extension in extensions
+            ]
+            export_file = (
+                [str(f) for f in export_files] if formats is not None else str(export_files[0])
+            )
+            targets = _export_paths(export_file)
+            taken = next((target for target in targets if target in exporting), None)
+            if taken is not None:
+                error = ValueError(
+                    f"{sas7bdat_file} has the same export file as {exporting[taken]}: {taken}"
+                )
+                if not continue_on_error:
+                    raise error
+                if verbose:
+                    print(f"Error converting {sas7bdat_file}")  # noqa: T201
+                scanned.extend(
+                    _conversion_results(str(sas7bdat_file), export_file, "failed", error)
+                )
+                continue
+            exporting.update(dict.fromkeys(targets, sas7bdat_file))
+
+            if incremental and all(_is_up_to_date(sas7bdat_file, f) for f in export_files):
+                if verbose:
+                    targets = ", ".join(str(f) for f in export_files)
+                    is_are = "is" if len(export_files) == 1 else "are"
+                    print(f"Skipping {sas7bdat_file}, {targets} {is_are} up to date")  # noqa: T201
+                scanned.extend(_conversion_results(str(sas7bdat_file), export_file, "skipped"))
+                continue
+
+            if export_dir != Path():
+                export_files[0].parent.mkdir(parents=True, exist_ok=True)
+            yield file_type, str(sas7bdat_file), export_file, options
+
+    return scanned, tasks()
+
+
+def _discover_tasks(
+    tasks: Iterable[_Task],
+    discovered: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    try:
+        for i, task in enumerate(tasks):
+            if stop.is_set():
+                return
+            discovered.put((i, *_estimate_cost(task), task))
+    except BaseException as e:
+        discovered.put(e)
+        return
+
+    discovered.put(None)
+
+
+def _estimate_cost(task: _Task) -> tuple[int, int]:
+    """Returns the decompressed size of the file and an estimate of the memory needed to convert
+    it.
+    """
+    _, sas7bdat_file, _, options = task
+    try:
+        size = _data_size(sas7bdat_file)
+    except Exception:
+        return 0, 0
+
+    chunksize = options.get("chunksize")
+    if chunksize is None:
+        return size, size
+
+    try:
+        row_count = read_metadata(sas7bdat_file).row_count
+    except Exception:
+        return size, size
+
+    if row_count <= chunksize:
+        return size, size
+
+    return size, size * chunksize // row_count
+
+
+def _export_paths(export_file: str | list[str]) -> list[str]:
+    """Returns the export files of a task in a form that can be compared with other tasks."""
+    export_files = export_file if isinstance(export_file, list) else [export_file]
+    return [os.path.normcase(os.path.abspath(f)) for f in export_files]
+
+
+def _file_size(sas7bdat_file: str | Path) -> int:
+    """Returns the number of bytes that are read from disk for a sas7bdat file."""
+    zip_path = _split_zip_path(sas7bdat_file)
+    if zip_path is None:
+        return os.path.getsize(sas7bdat_file)
 
-    def row_to_xml(row: pd.DataFrame) -> str:
-        xml = [f"  <{first_node}>"]
-        for i, col_name in enumerate(row.index):
-            text = row.iloc[i]
-            if isinstance(text, str):
-                text = escape(text)
+    with zipfile.ZipFile(zip_path[0]) as archive:
+        return archive.getinfo(zip_path[1]).compress_size
 
-            xml.append(f"    <{col_name}>{text}</{col_name}>")
-        xml.append(f"  </{first_node}>")
-        return "\n".join(xml)
 
-    res = f'<?xml version="1.0" encoding="UTF-8"?>\n<{root_node}>\n'
-    res = res + "\n".join(df.apply(row_to_xml, axis=1)) + f"\n</{root_node}>"
+def _file_extension(export_file: str | Path) -> str:
+    """Returns the extension of a file including the compression extension, such as .csv.gz."""
+    path = Path(export_file)
+    if path.suffix in _COMPRESSION_EXTENSIONS:
+        return Path(path.stem).suffix + path.suffix
 
-    with open(export_file, "w") as f:
-        f.write(res)
+    return path.suffix
 
 
 def _file_extension_exception_message(conversion_type: str, valid_extensions: tuple[str]) -> str:
@@ -440,6 +2197,17 @@ def _file_extension_exception_message(conversion_type: str, valid_extensions: tu
     return f"sas7bdat conversion error - Valid {is_are[0]} for {conversion_type} conversion {is_are[1]}: {extensions}"  # noqa: E501
 
 
+def _infer_compression(export_file: str | Path, compression: str | None) -> str | None:
+    if compression == "infer":
+        if not _is_path(export_file):
+            return None
+        return _COMPRESSION_EXTENSIONS.get(Path(export_file).suffix)
+    if compression is not None and compression not in _COMPRESSION_EXTENSIONS.values():
+        raise ValueError(_compression_exception_message(compression))
+
+    return compression
+
+
 def _invalid_key_exception_message(
     required_keys: list[str], optional_keys: list[str] | None = None
 ) -> str:
@@ -452,12 +2220,316 @@ def _invalid_key_exception_message(
         return f"Invalid key provided, expected keys are: {required_keys_joined}"
 
 
-def _is_valid_extension(valid_extensions: tuple[str], file_extension: str) -> bool:
+def _is_path(file: Any) -> bool:
+    return isinstance(file, (str, os.PathLike))
+
+
+def _is_sas_file(name: str) -> bool:
+    path = Path(name.lower())
+    if path.suffix in _COMPRESSION_EXTENSIONS:
+        path = Path(path.stem)
+
+    return path.suffix in _SAS_EXTENSIONS
+
+
+def _is_up_to_date(sas7bdat_file: Path, export_file: Path) -> bool:
+    try:
+        export_mtime = export_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+    return export_mtime >= _source_stat(sas7bdat_file).st_mtime_ns
+
+
+def _is_valid_extension(
+    valid_extensions: tuple[str, ...], file_extension: str, allow_compression: bool = False
+) -> bool:
+    if allow_compression:
+        base_extension, compression_extension = os.path.splitext(file_extension)
+        if compression_extension in _COMPRESSION_EXTENSIONS:
+            file_extension = base_extension
+
     return file_extension in valid_extensions
 
 
-def _format_path(path: str | Path) -> str:
-    return str(path) if isinstance(path, Path) else path
+def _matches_patterns(relative_path: Path, patterns: list[str]) -> bool:
+    for pattern in patterns:
+        target = relative_path.as_posix() if "/" in pattern else relative_path.name
+        if fnmatch.fnmatch(target, pattern):
+            return True
+    return False
+
+
+def _filter_rows(df: pd.DataFrame, where: str | Callable[[pd.DataFrame], Any]) -> pd.DataFrame:
+    with _timed("transform"):
+        return df.query(where) if isinstance(where, str) else df.loc[where(df)]
+
+
+def _fingerprint(sas7bdat_file: str | Path) -> str:
+    # The whole file is hashed because a data set can be rewritten in place with the same size and
+    # header. sha256 runs on the SHA instructions of current CPUs, several times faster than
+    # pandas can parse the file.
+    digest = hashlib.blake2b(digest_size=16)
+    zip_path = _split_zip_path(sas7bdat_file)
+    if zip_path is not None:
+        # The zip directory already holds a checksum of the uncompressed member.
+        with zipfile.ZipFile(zip_path[0]) as archive:
+            info = archive.getinfo(zip_path[1])
+        digest.update(f"{pd.__version__}:{info.file_size}:{info.CRC}".encode())
+        return digest.hexdigest()
+
+    with open(sas7bdat_file, "rb") as f:
+        contents = hashlib.file_digest(f, "sha256")
+    digest.update(f"{pd.__version__}:{contents.hexdigest()}".encode())
+
+    return digest.hexdigest()
+
+
+def _format_path(path: str | Path | Any) -> str:
+    if isinstance(path, Path):
+        return str(path)
+    if isinstance(path, str):
+        return path
+
+    # A file object is named after its file if it has one, such as <stdin>.
+    name = getattr(path, "name", None)
+    return name if isinstance(name, str) else f"<{type(path).__name__}>"
+
+
+def _prepare_chunk(
+    df: pd.DataFrame,
+    sas7bdat_file: _SasSource,
+    columns: list[str] | None,
+    where: str | Callable[[pd.DataFrame], Any] | None,
+) -> pd.DataFrame:
+    if where is None:
+        if columns is not None:
+            df = _select_columns(df, columns, sas7bdat_file)
+        return _decode_strings(df)
+
+    # The filter can use any column so the whole chunk is decoded before the rows are selected.
+    df = _decode_strings(df)
+    df = _filter_rows(df, where)
+    if columns is not None:
+        df = _select_columns(df, columns, sas7bdat_file)
+
+    return df
+
+
+def _open_buffer(stack: contextlib.ExitStack, sas7bdat_file: Any) -> Any:
+    if isinstance(sas7bdat_file, (bytes, bytearray, memoryview)):
+        return stack.enter_context(_BufferFile(sas7bdat_file))
+    if not sas7bdat_file.seekable():
+        # The readers seek back to the start of the file, which a pipe such as stdin can not do,
+        # so it is copied to a temporary file first.
+        spool = stack.enter_context(tempfile.TemporaryFile())
+        shutil.copyfileobj(sas7bdat_file, spool)
+        spool.seek(0)
+        return spool
+
+    return sas7bdat_file
+
+
+def _open_export(
+    export_file: _ExportFile, mode: str, compression: str | None, **kwargs: Any
+) -> IO[Any]:
+    if not _is_path(export_file):
+        return _open_stream(export_file, mode, compression, **kwargs)
+    if compression is None:
+        return open(export_file, mode, **kwargs)
+
+    mode = mode if "b" in mode else f"{mode}t"
+    if compression == "gzip":
+        # Level 6 is the default of the gzip command, 9 is several times slower for little gain.
+        return gzip.open(export_file, mode, compresslevel=6, **kwargs)
+    if compression == "bz2":
+        return bz2.open(export_file, mode, **kwargs)
+    if compression == "xz":
+        return lzma.open(export_file, mode, **kwargs)
+
+    # zstd is the only codec that can compress one stream on several threads, one per CPU here.
+    zstandard = _zstandard()
+    compressor = zstandard.ZstdCompressor(threads=-1)
+    return zstandard.open(export_file, mode, cctx=compressor, **kwargs)
+
+
+def _open_stream(f: IO[Any], mode: str, compression: str | None, **kwargs: Any) -> IO[Any]:
+    """Opens a file object owned by the caller for writing, which is left open when it is closed.
+
+    Text can be written to a binary file object and bytes, which are utf-8 for the text formats,
+    can be written to a text file object.
+    """
+    if isinstance(f, io.TextIOBase) and compression is None:
+        if "b" not in mode:
+            return _BorrowedFile(f)
+        if getattr(f, "buffer", None) is None:
+            return _BorrowedFile(f, encoding="utf-8")
+
+    stream: IO[Any] = _BorrowedFile(_binary_stream(f))
+    if compression == "gzip":
+        stream = gzip.GzipFile(fileobj=stream, mode="wb", compresslevel=6)
+    elif compression == "bz2":
+        stream = bz2.BZ2File(stream, "wb")
+    elif compression == "xz":
+        stream = lzma.LZMAFile(stream, "wb")
+    elif compression == "zstd":
+        compressor = _zstandard().ZstdCompressor(threads=-1)
+        stream = compressor.stream_writer(stream)
+
+    if "b" in mode:
+        return stream
+
+    return io.TextIOWrapper(stream, **kwargs)
+
+
+@contextlib.contextmanager
+def _open_sas(sas7bdat_file: _SasSource, **kwargs: Any) -> Iterator[Any]:
+    with contextlib.ExitStack() as stack:
+        source = _open_source(stack, sas7bdat_file, kwargs)
+        with _timed("read"):
+            result = pd.read_sas(source, **kwargs)
+        if not isinstance(result, pd.DataFrame):
+            stack.enter_context(result)
+        elif _metrics_sink is not None:
+            _metrics_sink.count("rows_read", len(result))
+        yield result
+
+
+def _open_source(
+    stack: contextlib.ExitStack, sas7bdat_file: _SasSource, kwargs: dict[str, Any]
+) -> Any:
+    """Opens a sas7bdat or xpt file, which can be compressed, a zip member or a file object, for
+    pd.read_sas.
+
+    The format is added to kwargs when pandas can not work it out from the file name.
+    """
+    if not _is_path(sas7bdat_file):
+        source = _open_buffer(stack, sas7bdat_file)
+        kwargs["format"] = _sniff_sas_format(source)
+        return source
+
+    zip_path = _split_zip_path(sas7bdat_file)
+    if zip_path is not None:
+        archive = stack.enter_context(zipfile.ZipFile(zip_path[0]))
+        kwargs["format"] = _sas_format(zip_path[1])
+        return stack.enter_context(archive.open(zip_path[1]))
+
+    compression = _COMPRESSION_EXTENSIONS.get(Path(sas7bdat_file).suffix.lower())
+    if compression == "zstd" and _sas_format(sas7bdat_file) == "xport":
+        # The xport reader seeks from the end of the file, which a zstd stream can not do, so the
+        # file is decompressed to a temporary file first.
+        spool = stack.enter_context(tempfile.TemporaryFile())
+        with _zstandard().open(sas7bdat_file, "rb") as f:
+            shutil.copyfileobj(f, spool)
+        spool.seek(0)
+        kwargs["format"] = "xport"
+        return spool
+
+    return sas7bdat_file
+
+
+def _open_writer(export_file: str | Path, root_node: str, first_node: str) -> _Writer:
+    compression = _infer_compression(export_file, "infer")
+    file_extension = Path(export_file).suffix
+    if compression is not None:
+        file_extension = Path(Path(export_file).stem).suffix
+    if file_extension == ".csv":
+        return _CsvWriter(export_file, compression)
+    if file_extension == ".json":
+        return _JsonWriter(export_file, compression)
+    if file_extension in (".jsonl", ".ndjson"):
+        return _JsonLinesWriter(export_file, compression)
+    if file_extension == ".xlsx":
+        return _ExcelWriter(export_file)
+    if file_extension in (".feather", ".arrow"):
+        return _ArrowWriter(export_file, "feather")
+    if file_extension == ".parquet":
+        return _ArrowWriter(export_file, "parquet")
+
+    return _XmlWriter(export_file, root_node, first_node, compression)
+
+
+def _raise_if_cancelled() -> None:
+    event = getattr(_cancellation, "event", None)
+    if event is not None and event.is_set():
+        raise CancelledError
+
+
+def _raise_on_invalid_convert_extensions(export_files: list[str | Path]) -> None:
+    for export_file in export_files:
+        file_extension = _file_extension(export_file)
+        if not _is_valid_extension(_CONVERT_EXTENSIONS, file_extension) and not (
+            _is_valid_extension(_COMPRESSIBLE_EXTENSIONS, file_extension, allow_compression=True)
+        ):
+            error_message = _file_extension_exception_message("convert", _CONVERT_EXTENSIONS)
+            raise AttributeError(error_message)
+
+
+def _read_disk_cache(
+    disk_cache: _DiskCache,
+    sas7bdat_file: str | Path,
+    columns: list[str] | None,
+    where: str | None,
+) -> pd.DataFrame:
+    fingerprint = _fingerprint(sas7bdat_file)
+    df = disk_cache.get(fingerprint, columns if where is None else None)
+    if df is None:
+        df = to_dataframe(sas7bdat_file)
+        disk_cache.put(fingerprint, df)
+
+    if where is not None:
+        df = _filter_rows(df, where)
+    if columns is not None:
+        df = _select_columns(df, columns, sas7bdat_file)
+
+    return df
+
+
+def _read_chunks(
+    sas7bdat_file: _SasSource,
+    chunksize: int | None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+) -> Iterator[pd.DataFrame]:
+    if chunksize is None:
+        return iter([to_dataframe(sas7bdat_file, columns=columns, where=where)])
+
+    # Read the first chunk up front so an unreadable file raises before any export file is created.
+    chunks = iter_dataframes(sas7bdat_file, chunksize, columns=columns, where=where)
+    first = next(chunks, None)
+    if first is None:
+        return iter([])
+
+    return itertools.chain([first], chunks)
+
+
+def _remove_export(export_file: _ExportFile | None) -> None:
+    """Removes a partly written export file.
+
+    Otherwise the truncated file would look up to date to an incremental dir_ conversion. File
+    objects are left to the caller.
+    """
+    if export_file is not None and _is_path(export_file):
+        # A file that can not be removed, such as one still open on Windows, is left as is.
+        with contextlib.suppress(OSError):
+            os.remove(export_file)
+
+
+@contextlib.contextmanager
+def _remove_on_error(export_file: _ExportFile) -> Iterator[None]:
+    try:
+        yield
+    except BaseException:
+        _remove_export(export_file)
+        raise
+
+
+def _report_results(
+    results: list[ConversionResult], on_result: Callable[[ConversionResult], None] | None
+) -> None:
+    if on_result is not None:
+        for result in results:
+            on_result(result)
 
 
 def _rise_on_invalid_file_dict(file_dict: dict[str, str | Path]) -> None:
@@ -466,37 +2538,926 @@ def _rise_on_invalid_file_dict(file_dict: dict[str, str | Path]) -> None:
         raise KeyError(message)
 
 
+def _run_conversions(
+    tasks: Iterable[_Task],
+    continue_on_error: bool,
+    verbose: bool,
+    workers: int | None,
+    executor: Executor | None,
+    memory_budget: int | None = None,
+    on_result: Callable[[ConversionResult], None] | None = None,
+) -> list[ConversionResult]:
+    """Converts the files for the tasks, on a process pool when there is more than one worker.
+
+    on_result is called with each result as soon as its file is finished, in the order the files
+    finish in.
+    """
+    results: list[ConversionResult] = []
+    if executor is None and (workers is None or workers <= 1):
+        for file_type, sas7bdat_file, export_file, options in tasks:
+            try:
+                stats = _convert(file_type, sas7bdat_file, export_file, options)
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                if verbose:
+                    print(f"Error converting {sas7bdat_file}")  # noqa: T201
+                file_results = _conversion_results(sas7bdat_file, export_file, "failed", e)
+            else:
+                file_results = _conversion_results(
+                    sas7bdat_file, export_file, "converted", stats=stats
+                )
+            _report_results(file_results, on_result)
+            results.extend(file_results)
+
+        return results
+
+    pool = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+    slots = workers if workers is not None and workers > 1 else os.cpu_count() or 1
+    discovered: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    if isinstance(tasks, list):
+        _discover_tasks(tasks, discovered, stop)
+    else:
+        # Files are sized on a separate thread while the conversions run, so the work can start
+        # before a large directory has been completely scanned.
+        threading.Thread(
+            target=_discover_tasks, args=(tasks, discovered, stop), daemon=True
+        ).start()
+
+    discovering = True
+    task_by_index: dict[int, _Task] = {}
+    ready: list[tuple[int, int, int]] = []
+    running: dict[Future, tuple[int, int]] = {}
+    in_flight = 0
+    # The export files being written, so two conversions never write to the same file at once.
+    writing: set[str] = set()
+    completed: dict[int, list[ConversionResult]] = {}
+    try:
+        while True:
+            while discovering:
+                try:
+                    item = discovered.get(block=not (running or ready))
+                except queue.Empty:
+                    break
+                if item is None:
+                    discovering = False
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    i, size, cost, task = item
+                    task_by_index[i] = task
+                    heapq.heappush(ready, (-size, i, cost))
+
+            # Start the largest files first. A file that does not fit in the memory budget, or
+            # whose export file is still being written, waits for running conversions to finish
+            # while other files fill in around it.
+            deferred = []
+            while ready and len(running) < slots:
+                entry = heapq.heappop(ready)
+                _, i, cost = entry
+                export_paths = _export_paths(task_by_index[i][2])
+                if not writing.isdisjoint(export_paths) or (
+                    memory_budget is not None and running and in_flight + cost > memory_budget
+                ):
+                    deferred.append(entry)
+                    continue
+                running[pool.submit(_convert, *task_by_index[i])] = (i, cost)
+                in_flight += cost
+                writing.update(export_paths)
+            for entry in deferred:
+                heapq.heappush(ready, entry)
+
+            if not running:
+                if discovering or ready:
+                    continue
+                break
+
+            done, _ = wait(
+                running,
+                timeout=_DISCOVERY_POLL_SECONDS if discovering else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                i, cost = running.pop(future)
+                in_flight -= cost
+                _, sas7bdat_file, export_file, _ = task_by_index.pop(i)
+                writing.difference_update(_export_paths(export_file))
+                error = future.exception()
+                if error is None:
+                    completed[i] = _conversion_results(
+                        sas7bdat_file, export_file, "converted", stats=future.result()
+                    )
+                    _report_results(completed[i], on_result)
+                    continue
+
+                if not continue_on_error:
+                    raise error
+                if verbose:
+                    print(f"Error converting {sas7bdat_file}")  # noqa: T201
+                completed[i] = _conversion_results(sas7bdat_file, export_file, "failed", error)
+                _report_results(completed[i], on_result)
+    finally:
+        stop.set()
+        for future in running:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+    return [result for i in sorted(completed) for result in completed[i]]
+
+
+def _select_columns(
+    df: pd.DataFrame, columns: list[str], sas7bdat_file: _SasSource
+) -> pd.DataFrame:
+    missing = [col for col in columns if col not in df.columns]
+    if missing:
+        name = _format_path(sas7bdat_file)
+        raise KeyError(f"Columns not found in {name}: {', '.join(missing)}")
+
+    with _timed("transform"):
+        return df[columns]
+
+
+def _sniff_sas_format(f: IO[bytes]) -> str:
+    # A file object has no name to go by, so the format is taken from the start of the file.
+    position = f.tell()
+    f.seek(0)
+    header = f.read(len(_XPORT_HEADER))
+    f.seek(position)
+    return "xport" if header == _XPORT_HEADER else "sas7bdat"
+
+
+def _sas_stem(sas7bdat_file: str | Path) -> str:
+    """Returns the name of a sas7bdat file without the extension, or extensions if compressed."""
+    path = Path(sas7bdat_file)
+    if path.suffix.lower() in _COMPRESSION_EXTENSIONS:
+        path = Path(path.stem)
+
+    return path.stem
+
+
+def _sas_format(sas7bdat_file: str | Path) -> str:
+    # pandas can only work out the format from a file name, so do the same for zip members.
+    name = str(sas7bdat_file).lower()
+    if ".xpt" in name:
+        return "xport"
+    if ".sas7bdat" in name:
+        return "sas7bdat"
+
+    raise ValueError(f"Unable to determine the file format of {_format_path(sas7bdat_file)}")
+
+
+def _scan_dir(
+    path: Path, recursive: bool, on_error: Callable[[Path, Exception], None]
+) -> Iterator[Path]:
+    """Yields the sas7bdat files in a directory, including the ones in zip files.
+
+    on_error is called with each zip file that can not be read, which is otherwise skipped.
+    """
+    directories = [path]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        directories.append(Path(entry.path))
+                elif _is_sas_file(entry.name) and entry.is_file():
+                    yield Path(entry.path)
+                elif entry.name.lower().endswith(".zip") and entry.is_file():
+                    try:
+                        with zipfile.ZipFile(entry.path) as archive:
+                            members = [
+                                info.filename
+                                for info in archive.infolist()
+                                if not info.is_dir() and _is_sas_file(info.filename)
+                            ]
+                    except (zipfile.BadZipFile, OSError) as e:
+                        on_error(Path(entry.path), e)
+                        continue
+                    for member in members:
+                        yield Path(entry.path, member)
+
+
+def _source_stat(sas7bdat_file: str | Path) -> os.stat_result:
+    """Returns the stat of a sas7bdat file, or of the zip file for a zip member."""
+    zip_path = _split_zip_path(sas7bdat_file)
+    return os.stat(zip_path[0] if zip_path is not None else sas7bdat_file)
+
+
+def _split_zip_path(sas7bdat_file: str | Path) -> tuple[str, str] | None:
+    """Splits a path such as bundle.zip/file.sas7bdat into the zip file and the member name.
+
+    None is returned for any other path, including files that exist on disk.
+    """
+    path = os.fspath(sas7bdat_file)
+    if os.path.exists(path):
+        return None
+
+    for match in re.finditer(rf"\.zip(?=[/{re.escape(os.sep)}])", path, re.IGNORECASE):
+        archive = path[: match.end()]
+        if os.path.isfile(archive):
+            return archive, path[match.end() + 1 :].replace(os.sep, "/")
+
+    return None
+
+
+@contextlib.contextmanager
+def _timed(stage: str) -> Iterator[None]:
+    stats = getattr(_conversion_stats, "current", None)
+    sink = _metrics_sink
+    if stats is None and sink is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        if stats is not None:
+            name = f"{stage}_seconds"
+            setattr(stats, name, getattr(stats, name) + seconds)
+        if sink is not None:
+            sink.timing(stage, seconds)
+
+
+def _timed_chunks(reader: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    chunks = iter(reader)
+    while True:
+        with _timed("read"):
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        if _metrics_sink is not None:
+            _metrics_sink.count("rows_read", len(chunk))
+        yield chunk
+
+
+def _write_chunks(chunks: Iterator[pd.DataFrame], writers: list[_Writer]) -> None:
+    for df in chunks:
+        _count_rows(df)
+        with _timed("write"):
+            for writer in writers:
+                writer.write(df)
+
+
+def _write_xml_rows(f: TextIO, df: pd.DataFrame, first_node: str) -> None:
+    # The tags are built once per column and the values are pulled out as whole columns, then
+    # the rows are written a slice at a time so the xml text is never held in memory all at once.
+    open_tags = [f"\n    <{col}>" for col in df.columns]
+    close_tags = [f"</{col}>" for col in df.columns]
+    row_start = f"\n  <{first_node}>"
+    row_end = f"\n  </{first_node}>"
+
+    for start in range(0, len(df), _XML_WRITE_ROWS):
+        rows = df.iloc[start : start + _XML_WRITE_ROWS]
+        columns = []
+        for col, open_tag, close_tag in zip(rows.columns, open_tags, close_tags, strict=True):
+            values = rows[col].astype(object).to_numpy()
+            columns.append(
+                [
+                    f"{open_tag}{escape(value) if isinstance(value, str) else value}{close_tag}"
+                    for value in values
+                ]
+            )
+
+        f.writelines(
+            f"{row_start}{''.join(cells)}{row_end}" for cells in zip(*columns, strict=True)
+        )
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "The optional dependency zstandard is required in order to use zstd compression"
+        ) from e
+
+    return zstandard
+
+
+@dataclass
+class _ConversionStats:
+    bytes_read: int
+    rows: int = 0
+    columns: int = 0
+    read_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    transform_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+
+class _Writer:
+    """Writes dataframe chunks to an export file as they are read.
+
+    The export file is only finished when the writer exits without an error. If an error is raised
+    the writer is closed without writing anything more and the partly written file is removed.
+    """
+
+    # Set once the export file has been opened, so a file from an earlier conversion is not removed
+    # when an error is raised before anything was written to it.
+    _written_file: _ExportFile | None = None
+
+    def __enter__(self) -> _Writer:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: Any) -> None:
+        if exc_type is None:
+            try:
+                with _timed("write"):
+                    self.close()
+            except BaseException:
+                _remove_export(self._written_file)
+                raise
+        else:
+            self.abort()
+            _remove_export(self._written_file)
+
+    def write(self, df: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.abort()
+
+    def abort(self) -> None:
+        pass
+
+
+class _ArrowCsvWriter(_Writer):
+    """Writes the same csv file as _CsvWriter with the values formatted by pyarrow.
+
+    Each column is formatted and quoted with pyarrow compute functions and the rows are joined in
+    one call, instead of pandas handing every value to the csv module. A chunk with a column that
+    can not be formatted this way, such as an object column with mixed types, is written by pandas.
+    """
+
+    def __init__(self, export_file: _ExportFile, compression: str | None = None) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "The optional dependency pyarrow is required in order to use the pyarrow csv engine"
+            ) from e
+
+        self._pa = pa
+        self._pc = pc
+        self._f = _open_export(export_file, "wb", compression)
+        self._written_file = export_file
+        self._header = True
+
+    def write(self, df: pd.DataFrame) -> None:
+        columns = [self._format_column(df.iloc[:, i]) for i in range(len(df.columns))]
+        if not columns or any(column is None for column in columns):
+            text = df.to_csv(quoting=csv.QUOTE_NONNUMERIC, index=False, header=self._header)
+            self._f.write(text.encode("utf-8"))
+            self._header = False
+            return
+
+        if self._header:
+            header = io.StringIO()
+            csv.writer(header, quoting=csv.QUOTE_NONNUMERIC, lineterminator=os.linesep).writerow(
+                df.columns
+            )
+            self._f.write(header.getvalue().encode("utf-8"))
+            self._header = False
+
+        if len(df) == 0:
+            return
+
+        pc = self._pc
+        rows = pc.binary_join_element_wise(*columns, self._scalar(","))
+        rows = pc.binary_join_element_wise(rows, self._scalar(os.linesep), self._scalar(""))
+        # The rows are stored one after the other in the data buffer, so it is written as is.
+        _, offsets, data = rows.buffers()
+        start, end = np.frombuffer(offsets, dtype=np.int64)[[rows.offset, rows.offset + len(rows)]]
+        self._f.write(memoryview(data)[start:end])
+
+    def abort(self) -> None:
+        self._f.close()
+
+    def _format_column(self, series: pd.Series) -> Any:
+        pa = self._pa
+        if series.dtype == np.float64:
+            return self._format_floats(series.to_numpy())
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind == "M":
+            return self._format_datetimes(series.to_numpy())
+        if isinstance(series.dtype, pd.StringDtype):
+            return self._quote(pa.array(series.array, type=pa.large_string(), from_pandas=True))
+        if series.dtype == object and pd.api.types.infer_dtype(series) in ("string", "empty"):
+            return self._quote(
+                pa.array(series.to_numpy(), type=pa.large_string(), from_pandas=True)
+            )
+
+        return None
+
+    def _format_floats(self, values: Any) -> Any:
+        # pyarrow writes the same shortest round trip digits as repr, but without the ".0" on whole
+        # numbers and with a different range for scientific notation. Whole numbers are written from
+        # integers, and numbers outside the range where both use plain digits are written by repr.
+        pa, pc = self._pa, self._pc
+        nan = np.isnan(values)
+        finite = np.isfinite(values)
+        magnitude = np.abs(values)
+        whole = (
+            finite
+            & (values == np.trunc(values))
+            & (magnitude < 1e16)
+            & ~((values == 0) & np.signbit(values))
+        )
+        same = (finite & (magnitude >= 1e16)) | ((magnitude >= 1e-4) & (magnitude < 1e10))
+        text = pc.cast(pa.array(values), pa.large_string())
+        if whole.any():
+            integers = pc.cast(
+                pa.array(np.where(whole, values, 0).astype(np.int64)), pa.large_string()
+            )
+            integers = pc.binary_join_element_wise(integers, self._scalar(".0"), self._scalar(""))
+            text = pc.if_else(pa.array(whole), integers, text)
+        other = ~(whole | same | nan)
+        if other.any():
+            reprs = pa.array([repr(value) for value in values[other].tolist()], pa.large_string())
+            text = pc.replace_with_mask(text, pa.array(other), reprs)
+        if nan.any():
+            text = pc.if_else(pa.array(nan), self._scalar('""'), text)
+
+        return text
+
+    def _format_datetimes(self, values: Any) -> Any:
+        # pandas writes only the dates when none of the values have a time, otherwise the dates and
+        # times. Sub-second times and years pandas does not write with four digits are left to it.
+        pa, pc = self._pa, self._pc
+        valid = values[~np.isnat(values)]
+        days = valid.astype("datetime64[D]")
+        years = days.astype("datetime64[Y]").astype(np.int64) + 1970
+        if len(years) and (years.min() < 1000 or years.max() > 9999):
+            return None
+        if (days == valid).all():
+            values = values.astype("datetime64[D]")
+        elif (valid.astype("datetime64[s]") == valid).all():
+            values = values.astype("datetime64[s]")
+        else:
+            return None
+
+        return self._quote(pc.cast(pa.array(values, from_pandas=True), pa.large_string()))
+
+    def _quote(self, text: Any) -> Any:
+        pc = self._pc
+        text = pc.replace_substring(text, '"', '""')
+        quote = self._scalar('"')
+        text = pc.binary_join_element_wise(quote, text, quote, self._scalar(""))
+        return pc.fill_null(text, self._scalar('""'))
+
+    def _scalar(self, value: str) -> Any:
+        return self._pa.scalar(value, self._pa.large_string())
+
+
+class _ArrowWriter(_Writer):
+    def __init__(self, export_file: _ExportFile, file_format: str) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                f"The optional dependency pyarrow is required in order to convert to a "
+                f"{file_format} file"
+            ) from e
+
+        self._pa = pa
+        self._pq = pq
+        self._sink: str | IO[Any] = (
+            os.fspath(export_file)
+            if _is_path(export_file)
+            else _BorrowedFile(_binary_stream(export_file))
+        )
+        self._file_format = file_format
+        self._schema = None
+        self._writer = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        pa = self._pa
+        if self._writer is None:
+            schema = pa.Schema.from_pandas(df, preserve_index=False)
+            # A text column with no values in the first chunk is inferred as null, which would not
+            # match the strings in later chunks.
+            self._schema = pa.schema(
+                [
+                    field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                    for field in schema
+                ],
+                metadata=schema.metadata,
+            )
+            self._written_file = self._sink
+            if self._file_format == "parquet":
+                self._writer = self._pq.ParquetWriter(
+                    self._sink, self._schema, coerce_timestamps="us"
+                )
+            else:
+                self._writer = pa.ipc.new_file(self._sink, self._schema)
+
+        self._writer.write_table(
+            pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+        )
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if not isinstance(self._sink, str):
+            self._sink.close()
+
+
+class _CsvWriter(_Writer):
+    def __init__(self, export_file: _ExportFile, compression: str | None = None) -> None:
+        self._f = _open_export(export_file, "w", compression, newline="", encoding="utf-8")
+        self._written_file = export_file
+        self._header = True
+
+    def write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self._f, quoting=csv.QUOTE_NONNUMERIC, index=False, header=self._header)
+        self._header = False
+
+    def abort(self) -> None:
+        self._f.close()
+
+
+class _ExcelWriter(_Writer):
+    def __init__(self, export_file: _ExportFile) -> None:
+        try:
+            from openpyxl import Workbook
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "The optional dependency openpyxl is required in order to convert to an Excel file"
+            ) from e
+
+        # A write-only workbook streams rows out to disk as they are appended instead of keeping
+        # a cell object for every value in memory.
+        self._export_file = export_file
+        self._wb = Workbook(write_only=True)
+        self._ws = None
+        self._sheet_rows = 0
+        self._header: list[str] = []
+
+    def write(self, df: pd.DataFrame) -> None:
+        self._header = [str(col) for col in df.columns]
+        columns = [
+            df[col].astype(object).where(df[col].notna(), None).to_numpy() for col in df.columns
+        ]
+        for row in zip(*columns, strict=True):
+            if self._ws is None or self._sheet_rows == _EXCEL_MAX_ROWS:
+                self._ws = self._wb.create_sheet(f"Sheet{len(self._wb.worksheets) + 1}")
+                self._ws.append(self._header)
+                self._sheet_rows = 1
+            self._ws.append(row)
+            self._sheet_rows += 1
+
+    def close(self) -> None:
+        if self._ws is None:
+            ws = self._wb.create_sheet("Sheet1")
+            if self._header:
+                ws.append(self._header)
+
+        if _is_path(self._export_file):
+            self._written_file = self._export_file
+            self._wb.save(self._export_file)
+            return
+
+        with _BorrowedFile(_binary_stream(self._export_file)) as f:
+            self._wb.save(f)
+
+
+class _JsonLinesWriter(_Writer):
+    def __init__(self, export_file: _ExportFile, compression: str | None = None) -> None:
+        self._f = _open_export(export_file, "w", compression, encoding="utf-8")
+        self._written_file = export_file
+
+    def write(self, df: pd.DataFrame) -> None:
+        if len(df) > 0:
+            df.to_json(self._f, orient="records", lines=True, date_format="iso")
+
+    def abort(self) -> None:
+        self._f.close()
+
+
+class _JsonWriter(_Writer):
+    # The json is column oriented so every value for a column has to be written before the next
+    # column can start. Each chunk's column fragments are spooled to a temporary file and stitched
+    # together in column order once the whole file has been read.
+    def __init__(self, export_file: _ExportFile, compression: str | None = None) -> None:
+        self._export_file = export_file
+        self._compression = compression
+        self._spool = tempfile.TemporaryFile()
+        self._fragments: dict[str, list[tuple[int, int]]] = {}
+
+    def write(self, df: pd.DataFrame) -> None:
+        for col in df.columns:
+            fragment = df[col].to_json(date_format="iso")[1:-1].encode("utf-8")
+            col_fragments = self._fragments.setdefault(col, [])
+            if fragment:
+                col_fragments.append((self._spool.tell(), len(fragment)))
+                self._spool.write(fragment)
+
+    def close(self) -> None:
+        try:
+            self._written_file = self._export_file
+            with _open_export(self._export_file, "wb", self._compression) as f:
+                f.write(b"{")
+                for i, (col, col_fragments) in enumerate(self._fragments.items()):
+                    if i > 0:
+                        f.write(b",")
+                    key = pd.Series([str(col)]).to_json(orient="values")[1:-1]
+                    f.write(f"{key}:{{".encode())
+                    for j, (offset, length) in enumerate(col_fragments):
+                        if j > 0:
+                            f.write(b",")
+                        self._spool.seek(offset)
+                        f.write(self._spool.read(length))
+                    f.write(b"}")
+                f.write(b"}")
+        finally:
+            self._spool.close()
+
+    def abort(self) -> None:
+        self._spool.close()
+
+
+class _XmlWriter(_Writer):
+    def __init__(
+        self,
+        export_file: _ExportFile,
+        root_node: str,
+        first_node: str,
+        compression: str | None = None,
+    ) -> None:
+        self._f = _open_export(export_file, "w", compression, encoding="utf-8")
+        self._written_file = export_file
+        self._root_node = root_node
+        self._first_node = first_node
+        self._f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<{root_node}>')
+
+    def write(self, df: pd.DataFrame) -> None:
+        _write_xml_rows(self._f, df, self._first_node)
+
+    def close(self) -> None:
+        self._f.write(f"\n</{self._root_node}>")
+        self._f.close()
+
+    def abort(self) -> None:
+        self._f.close()
+
+
+class _DataFrameCache:
+    """A least recently used cache of dataframes that is limited by their memory use."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[tuple[Any, ...], tuple[pd.DataFrame, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> pd.DataFrame | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+
+            self._items.move_to_end(key)
+            return item[0]
+
+    def put(self, key: tuple[Any, ...], df: pd.DataFrame) -> None:
+        nbytes = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            # Entries for an older version of the same file can never be hit again.
+            for old_key in [k for k in self._items if k[0] == key[0] and k[1:3] != key[1:3]]:
+                self._size -= self._items.pop(old_key)[1]
+            if key in self._items:
+                self._size -= self._items.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return
+
+            self._items[key] = (df, nbytes)
+            self._size += nbytes
+            self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes:
+            _, (_, nbytes) = self._items.popitem(last=False)
+            self._size -= nbytes
+
+
+_dataframe_cache = _DataFrameCache(_DEFAULT_CACHE_BYTES)
+
+
+class _DiskCache:
+    """A directory of Arrow IPC copies of decoded files that is limited by its total size.
+
+    Files are named by a fingerprint of the sas7bdat file so copies of the same file share one
+    entry. The least recently used entries are removed first.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        import pyarrow as pa
+
+        self._pa = pa
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, fingerprint: str, columns: list[str] | None = None) -> pd.DataFrame | None:
+        path = self.cache_dir / f"{fingerprint}.arrow"
+        try:
+            # The file is memory mapped so only the columns that are used are read from disk.
+            with self._pa.memory_map(str(path)) as source:
+                table = self._pa.ipc.open_file(source).read_all()
+                if columns is not None and set(columns).issubset(table.column_names):
+                    table = table.select(columns)
+                df = table.to_pandas()
+        except FileNotFoundError:
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return df
+
+    def put(self, fingerprint: str, df: pd.DataFrame) -> None:
+        path = self.cache_dir / f"{fingerprint}.arrow"
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            with _ArrowWriter(temp_path, "feather") as writer:
+                writer.write(df)
+            os.replace(temp_path, path)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+
+        self._evict(path)
+
+    def _evict(self, newest: Path) -> None:
+        entries = []
+        for entry in self.cache_dir.glob("*.arrow"):
+            with contextlib.suppress(FileNotFoundError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        # The entry that was just written is removed last, and only if it is larger than the
+        # whole cache on its own.
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: (item[2] == newest, item[0])):
+            if total <= self.max_bytes:
+                break
+            # Another process may still have the file open, it will be tried again next time.
+            with contextlib.suppress(OSError):
+                entry.unlink()
+                total -= size
+
+
+class _BorrowedFile(io.IOBase):
+    """Writes to a file object owned by the caller, which is flushed but left open on close.
+
+    The position is counted from the first write so formats that need tell, such as parquet and
+    xlsx files, can be written to a pipe like sys.stdout.
+    """
+
+    def __init__(self, f: IO[Any], encoding: str | None = None) -> None:
+        super().__init__()
+        self._f = f
+        # Bytes written to a text file object, such as a StringIO, are decoded first.
+        self._decoder = codecs.getincrementaldecoder(encoding)() if encoding else None
+        self._position = 0
+
+    def flush(self) -> None:
+        super().flush()
+        self._f.flush()
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._f.write(data if self._decoder is None else self._decoder.decode(data))
+        size = len(data) if isinstance(data, str) else memoryview(data).nbytes
+        self._position += size
+        return size
+
+
+class _BufferFile:
+    """A read only binary file over the bytes of a file, such as a memoryview."""
+
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        self._buffer = memoryview(buffer).cast("B") if isinstance(buffer, memoryview) else buffer
+        self._position = 0
+
+    def __enter__(self) -> _BufferFile:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.readline, b"")
+
+    def close(self) -> None:
+        if isinstance(self._buffer, memoryview):
+            self._buffer.release()
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._position
+        end = (
+            len(self._buffer) if size is None or size < 0 else min(start + size, len(self._buffer))
+        )
+        self._position = max(start, end)
+        return bytes(self._buffer[start:end])
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self) -> bytes:
+        if isinstance(self._buffer, memoryview):
+            # A memoryview can not be searched, pandas does not read sas files by line in any case.
+            end = bytes(self._buffer[self._position :]).find(b"\n")
+            end = -1 if end == -1 else end + self._position
+        else:
+            end = self._buffer.find(b"\n", self._position)
+        return self.read(-1 if end == -1 else end + 1 - self._position)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self._buffer)
+        self._position = max(offset, 0)
+        return self._position
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+
+_disk_cache: _DiskCache | None = None
+
+# Holds the event of the async call running on the current thread, so a cancelled conversion stops
+# at the next chunk that is read.
+_cancellation = threading.local()
+
+# Holds the statistics of the batch conversion running on the current thread.
+_conversion_stats = threading.local()
+
+_metrics_sink: MetricsSink | None = None
+
+
 def _walk_dir(
     file_type: str,
     dir_path: str | Path,
     export_path: str | Path | None = None,
     continue_on_error: bool = False,
     verbose: bool = True,
-) -> None:
-    path = dir_path if isinstance(dir_path, Path) else Path(dir_path)
-    for file_name in path.iterdir():
-        if file_name.suffix in [".sas7bdat", ".xpt"]:
-            export_file = Path(f"{file_name.stem}.{file_type}")
-            if export_path:
-                export_file = Path(export_path).joinpath(export_file)
-            else:
-                export_file = path.joinpath(export_file)
-
-            sas7bdat_file = path.joinpath(file_name)
-
-            try:
-                if file_type == "csv":
-                    to_csv(str(sas7bdat_file), str(export_file))
-                elif file_type == "json":
-                    to_json(str(sas7bdat_file), str(export_file))
-                elif file_type == "xlsx":
-                    to_excel(str(sas7bdat_file), str(export_file))
-                elif file_type == "xml":
-                    to_xml(str(sas7bdat_file), str(export_file))
-            except:  # noqa: E722
-                if continue_on_error and verbose:
-                    print(f"Error converting {sas7bdat_file}")  # noqa: T201
-                elif continue_on_error:
-                    pass
-                else:
-                    raise
+    chunksize: int | None = None,
+    columns: list[str] | None = None,
+    where: str | Callable[[pd.DataFrame], Any] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    memory_budget: int | None = None,
+    incremental: bool = False,
+    recursive: bool = False,
+    include: str | list[str] | None = None,
+    exclude: str | list[str] | None = None,
+    formats: list[str] | None = None,
+    compression: str | None = None,
+    on_result: Callable[[ConversionResult], None] | None = None,
+) -> list[ConversionResult]:
+    options = {"chunksize": chunksize, "columns": columns, "where": where}
+    if compression is not None:
+        options["compression"] = compression
+    scanned, tasks = _dir_tasks(
+        file_type,
+        dir_path,
+        export_path,
+        continue_on_error,
+        verbose,
+        options,
+        incremental,
+        recursive,
+        include,
+        exclude,
+        formats,
+    )
+    results = _run_conversions(
+        tasks, continue_on_error, verbose, workers, executor, memory_budget, on_result
+    )
+    _report_results([result for result in scanned if result.status == "failed"], on_result)
+    return scanned + results
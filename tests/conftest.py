@@ -1,3 +1,4 @@
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -58,3 +59,13 @@ def bad_xpt_file():
 @pytest.fixture(scope="module")
 def xpt_expected_dir():
     return ASSETS_DIR / "expected_xpt"
+
+
+@pytest.fixture
+def sas_zip_file(tmp_path, sas_file_1, sas_file_2, xpt_file_1):
+    zip_file = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(zip_file, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.write(sas_file_1, "file1.sas7bdat")
+        archive.write(sas_file_2, "file2.sas7bdat")
+        archive.write(xpt_file_1, "xpt/file1.xpt")
+    return zip_file
@@ -0,0 +1,278 @@
+import asyncio
+import gzip
+import io
+import shutil
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import sas7bdat_converter.aio as aio
+import sas7bdat_converter.converter as converter
+
+
+@pytest.mark.parametrize("fixture_name", ["sas_file_1", "xpt_file_1"])
+def test_ato_dataframe(fixture_name, request):
+    sas_file = request.getfixturevalue(fixture_name)
+
+    df = asyncio.run(aio.ato_dataframe(sas_file))
+
+    pd.testing.assert_frame_equal(df, converter.to_dataframe(sas_file))
+
+
+def test_ato_csv_file_object(sas_file_1, expected_dir):
+    converted = io.StringIO()
+
+    asyncio.run(aio.ato_csv(sas_file_1.read_bytes(), converted, chunksize=2))
+
+    assert converted.getvalue() == (expected_dir / "file1.csv").read_text()
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_ato_csv(tmp_path, sas_file_1, expected_dir, chunksize):
+    converted_file = tmp_path.joinpath("file1.csv")
+
+    asyncio.run(aio.ato_csv(sas_file_1, converted_file, chunksize=chunksize))
+
+    assert converted_file.read_text() == (expected_dir / "file1.csv").read_text()
+
+
+def test_ato_csv_gather(tmp_path, sas_file_1, xpt_file_1):
+    async def convert_files():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            await asyncio.gather(
+                aio.ato_csv(sas_file_1, tmp_path / "file1.csv", executor=executor),
+                aio.ato_parquet(sas_file_1, tmp_path / "file1.parquet", executor=executor),
+                aio.ato_json(xpt_file_1, tmp_path / "xpt.json", executor=executor),
+            )
+
+    asyncio.run(convert_files())
+
+    assert {f.name for f in tmp_path.iterdir()} == {"file1.csv", "file1.parquet", "xpt.json"}
+
+
+def test_ato_csv_cancel(tmp_path, monkeypatch, sas_file_1):
+    started = threading.Event()
+    release = threading.Event()
+    chunks_read = []
+    prepare_chunk = converter._prepare_chunk
+
+    def blocking_prepare_chunk(*args):
+        chunks_read.append(args[0])
+        started.set()
+        release.wait(5)
+        return prepare_chunk(*args)
+
+    monkeypatch.setattr(converter, "_prepare_chunk", blocking_prepare_chunk)
+
+    async def cancel_conversion():
+        task = asyncio.ensure_future(aio.ato_csv(sas_file_1, tmp_path / "file1.csv", chunksize=1))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_conversion())
+
+    assert len(chunks_read) == 1
+
+
+def test_aiter_dataframes(sas_file_1):
+    async def read_chunks():
+        return [chunk async for chunk in aio.aiter_dataframes(sas_file_1, chunksize=2)]
+
+    chunks = asyncio.run(read_chunks())
+
+    expected = list(converter.iter_dataframes(sas_file_1, chunksize=2))
+    assert len(chunks) == len(expected)
+    for chunk, expected_chunk in zip(chunks, expected, strict=True):
+        pd.testing.assert_frame_equal(chunk, expected_chunk)
+
+
+def test_aiter_dataframes_break(sas_file_1):
+    async def read_first_chunk():
+        chunks = aio.aiter_dataframes(sas_file_1, chunksize=2, columns=["text_row"])
+        async for chunk in chunks:
+            await chunks.aclose()
+            return chunk
+
+    chunk = asyncio.run(read_first_chunk())
+
+    assert list(chunk.columns) == ["text_row"]
+    assert len(chunk) == 2
+
+
+def test_aiter_dataframes_process_pool(sas_file_1):
+    async def read_chunks():
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return [c async for c in aio.aiter_dataframes(sas_file_1, executor=executor)]
+
+    with pytest.raises(ValueError, match="process pool"):
+        asyncio.run(read_chunks())
+
+
+def test_aread_metadata(sas_file_1):
+    metadata = asyncio.run(aio.aread_metadata(sas_file_1))
+
+    assert metadata == converter.read_metadata(sas_file_1)
+
+
+def test_abatch_to_csv(tmp_path, sas_file_1, sas_file_2, expected_dir):
+    file_dicts = [
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path / "file1.csv"},
+        {"sas7bdat_file": sas_file_2, "export_file": tmp_path / "file2.csv"},
+    ]
+
+    results = asyncio.run(aio.abatch_to_csv(file_dicts, chunksize=2))
+
+    assert [result.status for result in results] == ["converted", "converted"]
+    assert [result.export_file for result in results] == [
+        str(tmp_path / "file1.csv"),
+        str(tmp_path / "file2.csv"),
+    ]
+    assert results[0].rows == len(converter.to_dataframe(sas_file_1))
+    assert results[0].bytes_written == (tmp_path / "file1.csv").stat().st_size
+    for name in ("file1.csv", "file2.csv"):
+        assert (tmp_path / name).read_text() == (expected_dir / name).read_text()
+
+
+def test_abatch_to_csv_limit(tmp_path, monkeypatch, sas_file_1):
+    running = 0
+    most_running = 0
+    lock = threading.Lock()
+
+    def slow_to_csv(sas7bdat_file, export_file, **kwargs):
+        nonlocal running, most_running
+        Path(export_file).write_text("")
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    monkeypatch.setattr(converter, "to_csv", slow_to_csv)
+    file_dicts = [
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path / f"file{i}.csv"} for i in range(6)
+    ]
+
+    results = asyncio.run(aio.abatch_to_csv(file_dicts, limit=2))
+
+    assert len(results) == 6
+    assert most_running == 2
+
+
+def test_abatch_to_csv_same_export_file(tmp_path, monkeypatch, sas_file_1, sas_file_2):
+    lock = threading.Lock()
+    writing = []
+    overlapped = []
+
+    def slow_to_csv(sas7bdat_file, export_file, **kwargs):
+        Path(export_file).write_text("")
+        with lock:
+            overlapped.extend(f for f in writing if f == export_file)
+            writing.append(export_file)
+        time.sleep(0.05)
+        with lock:
+            writing.remove(export_file)
+
+    monkeypatch.setattr(converter, "to_csv", slow_to_csv)
+    file_dicts = [
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path / "file.csv"},
+        {"sas7bdat_file": sas_file_2, "export_file": tmp_path / "file.csv"},
+    ]
+
+    results = asyncio.run(aio.abatch_to_csv(file_dicts, limit=2))
+
+    assert overlapped == []
+    assert [result.status for result in results] == ["converted"] * 2
+
+
+def test_abatch_to_csv_continue_on_error(tmp_path, sas_file_1, bad_sas_file):
+    file_dicts = [
+        {"sas7bdat_file": bad_sas_file, "export_file": tmp_path / "bad_file.csv"},
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path / "file1.csv"},
+    ]
+
+    results = asyncio.run(aio.abatch_to_csv(file_dicts, continue_on_error=True, verbose=False))
+
+    assert [result.status for result in results] == ["failed", "converted"]
+    assert results[0].error is not None
+
+    with pytest.raises(Exception):  # noqa: B017
+        asyncio.run(aio.abatch_to_csv(file_dicts))
+
+
+def test_abatch_to_csv_invalid_key(sas_file_1):
+    with pytest.raises(KeyError):
+        asyncio.run(aio.abatch_to_csv([{"sas7bdat_file": sas_file_1}]))
+
+
+def test_abatch_convert_process_pool(tmp_path, sas_file_1):
+    file_dicts = [
+        {
+            "sas7bdat_file": sas_file_1,
+            "export_files": [tmp_path / "file1.csv", tmp_path / "file1.parquet"],
+        }
+    ]
+
+    async def convert_files():
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return await aio.abatch_convert(file_dicts, executor=executor)
+
+    results = asyncio.run(convert_files())
+
+    assert [result.status for result in results] == ["converted", "converted"]
+    assert (tmp_path / "file1.csv").is_file()
+    assert (tmp_path / "file1.parquet").is_file()
+
+
+def test_adir_to_parquet(tmp_path, sas7bdat_dir, expected_dir):
+    for sas_file in sas7bdat_dir.iterdir():
+        shutil.copy(sas_file, tmp_path)
+
+    results = asyncio.run(aio.adir_to_parquet(tmp_path, limit=2, chunksize=2))
+
+    assert len(results) == len(list(sas7bdat_dir.iterdir()))
+    assert all(result.status == "converted" for result in results)
+    for sas_file in sas7bdat_dir.iterdir():
+        converted_file = tmp_path / f"{sas_file.stem}.parquet"
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(converted_file), pd.read_parquet(expected_dir / converted_file.name)
+        )
+
+    results = asyncio.run(aio.adir_to_parquet(tmp_path, incremental=True, verbose=False))
+
+    assert all(result.status == "skipped" for result in results)
+
+
+def test_adir_to_csv_bad_zip_file(tmp_path, sas_file_1):
+    shutil.copy(sas_file_1, tmp_path)
+    (tmp_path / "notes.zip").write_bytes(b"not a zip")
+
+    results = asyncio.run(aio.adir_to_csv(tmp_path, continue_on_error=True, verbose=False))
+
+    assert sorted((Path(r.sas7bdat_file).name, r.status) for r in results) == [
+        ("file1.sas7bdat", "converted"),
+        ("notes.zip", "failed"),
+    ]
+    with pytest.raises(zipfile.BadZipFile):
+        asyncio.run(aio.adir_to_csv(tmp_path, verbose=False))
+
+
+def test_adir_to_csv_compression(tmp_path, sas7bdat_dir, expected_dir):
+    results = asyncio.run(aio.adir_to_csv(sas7bdat_dir, tmp_path, compression="gzip"))
+
+    for result in results:
+        converted_file = Path(result.export_file)
+        assert converted_file.suffixes == [".csv", ".gz"]
+        with gzip.open(converted_file, "rt", newline="") as f:
+            assert f.read() == (expected_dir / converted_file.stem).read_text()
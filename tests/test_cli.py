@@ -0,0 +1,166 @@
+import gzip
+import io
+import json
+import shutil
+import sys
+
+import pandas as pd
+import pytest
+
+import sas7bdat_converter.converter as converter
+from sas7bdat_converter.cli import main
+
+
+def test_convert(tmp_path, capsys, sas_file_1, expected_dir):
+    csv_file = tmp_path / "file1.csv"
+    parquet_file = tmp_path / "file1.parquet"
+
+    assert main(["convert", str(sas_file_1), str(csv_file), str(parquet_file)]) == 0
+
+    assert csv_file.read_text() == (expected_dir / "file1.csv").read_text()
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(parquet_file), pd.read_parquet(expected_dir / "file1.parquet")
+    )
+    assert f"converted {sas_file_1} -> {csv_file}, {parquet_file}" in capsys.readouterr().err
+
+
+def test_convert_format_compression(tmp_path, sas_file_1, expected_dir):
+    export_file = tmp_path / "file1.csv"
+
+    args = ["convert", str(sas_file_1), str(export_file), "-f", "csv", "--compression", "gzip"]
+    assert main([*args, "--chunksize", "2", "-q"]) == 0
+
+    assert gzip.decompress(export_file.read_bytes()).decode() == (
+        (expected_dir / "file1.csv").read_text()
+    )
+
+
+def test_convert_stdin_stdout(monkeypatch, capsys, sas_file_1):
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(sas_file_1.read_bytes())))
+
+    assert main(["convert", "-", "-", "--format", "csv", "--columns", "integer_row,text_row"]) == 0
+
+    captured = capsys.readouterr()
+    expected = converter.to_dataframe(sas_file_1, columns=["integer_row", "text_row"])
+    pd.testing.assert_frame_equal(pd.read_csv(io.StringIO(captured.out)), expected)
+    assert captured.err == "converted - -> -\n"
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (["file1.sas7bdat", "-"], "--format is required"),
+        (["file1.sas7bdat", "a.csv", "b.csv", "-f", "csv"], "only one export file"),
+        (["file1.sas7bdat", "a.parquet", "-f", "parquet", "--compression", "xz"], "compressed"),
+    ],
+)
+def test_convert_invalid_arguments(capsys, args, message):
+    with pytest.raises(SystemExit) as execinfo:
+        main(["convert", *args])
+
+    assert execinfo.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+def test_convert_error(tmp_path, capsys, bad_sas_file):
+    assert main(["convert", str(bad_sas_file), str(tmp_path / "bad_file.csv")]) == 1
+    assert capsys.readouterr().err.startswith("error: ")
+
+
+@pytest.mark.parametrize("jobs", ["1", "2", "0"])
+def test_dir(tmp_path, capsys, sas7bdat_dir, expected_dir, jobs):
+    export_path = tmp_path / "export"
+    export_path.mkdir()
+
+    args = ["dir", str(sas7bdat_dir), str(export_path), "-f", "csv", "-f", "parquet"]
+    assert main([*args, "--compression", "gzip", "--jobs", jobs]) == 0
+
+    sas_files = sorted(sas7bdat_dir.glob("*.sas7bdat"))
+    for sas_file in sas_files:
+        with gzip.open(export_path / f"{sas_file.stem}.csv.gz", "rt", newline="") as f:
+            assert f.read() == (expected_dir / f"{sas_file.stem}.csv").read_text()
+        assert (export_path / f"{sas_file.stem}.parquet").is_file()
+    err = capsys.readouterr().err.splitlines()
+    assert len([line for line in err if "] converted " in line]) == 2 * len(sas_files)
+    assert err[-1].startswith(f"{2 * len(sas_files)} converted, 0 skipped, 0 failed in ")
+
+
+def test_dir_incremental(tmp_path, capsys, sas_file_1):
+    shutil.copy(sas_file_1, tmp_path)
+
+    assert main(["dir", str(tmp_path), "-f", "jsonl", "--incremental"]) == 0
+    assert main(["dir", str(tmp_path), "-f", "jsonl", "--incremental"]) == 0
+
+    assert (tmp_path / "file1.jsonl").is_file()
+    err = capsys.readouterr().err.splitlines()
+    assert f"skipped {tmp_path / 'file1.sas7bdat'} -> {tmp_path / 'file1.jsonl'}" in err
+    assert err[-1].startswith("0 converted, 1 skipped, 0 failed in ")
+
+
+def test_dir_bad_zip_file(tmp_path, capsys, sas_file_1):
+    shutil.copy(sas_file_1, tmp_path)
+    (tmp_path / "notes.zip").write_bytes(b"not a zip")
+
+    assert main(["dir", str(tmp_path), "-f", "csv", "-j", "2"]) == 1
+
+    assert (tmp_path / "file1.csv").is_file()
+    err = capsys.readouterr().err.splitlines()
+    assert f"failed {tmp_path / 'notes.zip'} -> {tmp_path}: BadZipFile: " in "\n".join(err)
+    assert err[-1].startswith("1 converted, 0 skipped, 1 failed in ")
+
+
+@pytest.mark.parametrize("manifest_type", ["csv", "json"])
+def test_batch(tmp_path, capsys, sas_file_1, sas_file_2, expected_dir, manifest_type):
+    files = [
+        {"sas7bdat_file": str(sas_file_1), "export_file": "file1.csv"},
+        {"sas7bdat_file": str(sas_file_2), "export_file": "file2.xml", "root_node": "rows"},
+    ]
+    manifest = tmp_path / f"manifest.{manifest_type}"
+    if manifest_type == "json":
+        manifest.write_text(json.dumps(files))
+    else:
+        rows = [f"{f['sas7bdat_file']},{f['export_file']},{f.get('root_node', '')}" for f in files]
+        manifest.write_text("\n".join(["sas7bdat_file,export_file,root_node", *rows]))
+
+    assert main(["batch", str(manifest), "-j", "2"]) == 0
+
+    assert (tmp_path / "file1.csv").read_text() == (expected_dir / "file1.csv").read_text()
+    assert (tmp_path / "file2.xml").read_text().splitlines()[1] == "<rows>"
+    err = capsys.readouterr().err.splitlines()
+    assert sorted(line[:6] for line in err[:2]) == ["[1/2] ", "[2/2] "]
+    assert err[-1].startswith("2 converted, 0 skipped, 0 failed in ")
+
+
+def test_batch_failed(tmp_path, capsys, sas_file_1, bad_sas_file):
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text(
+        f"sas7bdat_file,export_file\n{bad_sas_file},bad_file.csv\n{sas_file_1},file1.csv\n"
+    )
+
+    assert main(["batch", str(manifest), "--quiet"]) == 1
+
+    assert (tmp_path / "file1.csv").is_file()
+    assert capsys.readouterr().err.startswith(
+        f"[1/2] failed {bad_sas_file} -> {tmp_path / 'bad_file.csv'}: "
+    )
+
+
+def test_batch_fail_fast(tmp_path, capsys, sas_file_1, bad_sas_file):
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text(
+        f"sas7bdat_file,export_file\n{bad_sas_file},bad_file.csv\n{sas_file_1},file1.csv\n"
+    )
+
+    assert main(["batch", str(manifest), "--fail-fast"]) == 1
+
+    assert not (tmp_path / "file1.csv").exists()
+    assert capsys.readouterr().err.startswith("error: ")
+
+
+def test_batch_invalid_manifest(tmp_path, capsys, sas_file_1):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([{"sas7bdat_file": str(sas_file_1)}]))
+
+    assert main(["batch", str(manifest)]) == 1
+
+    assert "export_file is missing" in capsys.readouterr().err
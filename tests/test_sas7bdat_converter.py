@@ -1,15 +1,67 @@
+import bz2
+import gzip
+import importlib.util
+import io
 import json
+import lzma
+import os
 import shutil
+import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 import sas7bdat_converter.converter as converter
 
 current_dir = Path().absolute()
 
+# zstandard is optional so the zstd tests are skipped when it is not installed.
+requires_zstandard = pytest.mark.skipif(
+    importlib.util.find_spec("zstandard") is None, reason="zstandard is not installed"
+)
+ZST = pytest.param(".zst", marks=requires_zstandard)
+
+OPEN_COMPRESSED = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".zst": lambda *args, **kwargs: importlib.import_module("zstandard").open(*args, **kwargs),
+}
+
+
+def read_compressed(path):
+    with OPEN_COMPRESSED[Path(path).suffix](path, "rt", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def write_compressed(source, compressed_file):
+    with (
+        open(source, "rb") as f,
+        OPEN_COMPRESSED[Path(compressed_file).suffix](compressed_file, "wb") as compressed,
+    ):
+        shutil.copyfileobj(f, compressed)
+    return compressed_file
+
+
+class UnseekableFile(io.RawIOBase):
+    """A file that can only be read in order, like a pipe."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._data.readinto(buffer)
+
 
 def test_batch_to_csv_path_sas(tmp_path, sas_file_1, sas_file_2, sas_file_3):
     converted_file_1 = tmp_path.joinpath("file1.csv")
@@ -217,6 +269,314 @@ def test_batch_to_csv_invalid_key_xpt(file_dict):
     assert "Invalid key provided" in str(execinfo.value)
 
 
+def test_batch_to_csv_chunksize(tmp_path, sas_file_1, xpt_file_1, expected_dir, xpt_expected_dir):
+    converted_file_1 = tmp_path.joinpath("file1_sas.csv")
+    converted_file_2 = tmp_path.joinpath("file1_xpt.csv")
+
+    file_dict = [
+        {"sas7bdat_file": sas_file_1, "export_file": converted_file_1},
+        {"sas7bdat_file": xpt_file_1, "export_file": converted_file_2},
+    ]
+
+    converter.batch_to_csv(file_dict, chunksize=2)
+
+    assert (
+        converted_file_1.read_text().rstrip() == (expected_dir / "file1.csv").read_text().rstrip()
+    )
+    assert (
+        converted_file_2.read_text().rstrip()
+        == (xpt_expected_dir / "file1.csv").read_text().rstrip()
+    )
+
+
+def test_batch_to_csv_columns(tmp_path, sas_file_1, sas_file_2):
+    converted_file_1 = tmp_path.joinpath("file1.csv")
+    converted_file_2 = tmp_path.joinpath("file2.csv")
+
+    file_dict = [
+        {"sas7bdat_file": sas_file_1, "export_file": converted_file_1},
+        {"sas7bdat_file": sas_file_2, "export_file": converted_file_2},
+    ]
+
+    converter.batch_to_csv(file_dict, columns=["integer_row"])
+
+    assert list(pd.read_csv(converted_file_1).columns) == ["integer_row"]
+    assert list(pd.read_csv(converted_file_2).columns) == ["integer_row"]
+
+
+def test_batch_to_csv_where(tmp_path, sas_file_1, sas_file_2):
+    converted_file_1 = tmp_path.joinpath("file1.csv")
+    converted_file_2 = tmp_path.joinpath("file2.csv")
+
+    file_dict = [
+        {"sas7bdat_file": sas_file_1, "export_file": converted_file_1},
+        {"sas7bdat_file": sas_file_2, "export_file": converted_file_2},
+    ]
+
+    converter.batch_to_csv(file_dict, where="integer_row > 2", chunksize=2)
+
+    for sas_file, converted_file in [
+        (sas_file_1, converted_file_1),
+        (sas_file_2, converted_file_2),
+    ]:
+        df = converter.to_dataframe(sas_file)
+        assert len(pd.read_csv(converted_file)) == (df["integer_row"] > 2).sum()
+
+
+def test_batch_to_csv_results(tmp_path, sas_file_1, sas_file_2):
+    bad_sas_file = tmp_path.joinpath("bad_file.sas7bdat")
+    file_dict = [
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path.joinpath("file1.csv")},
+        {"sas7bdat_file": bad_sas_file, "export_file": tmp_path.joinpath("bad_file.csv")},
+        {"sas7bdat_file": sas_file_2, "export_file": tmp_path.joinpath("file2.csv")},
+    ]
+
+    results = converter.batch_to_csv(file_dict, continue_on_error=True, verbose=False)
+
+    assert [result.status for result in results] == ["converted", "failed", "converted"]
+    assert [result.sas7bdat_file for result in results] == [
+        str(x["sas7bdat_file"]) for x in file_dict
+    ]
+    assert results[0].error is None
+    assert results[1].error is not None
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+@pytest.mark.parametrize("workers", [None, 2])
+def test_batch_to_csv_result_stats(tmp_path, sas_file_1, bad_sas_file, chunksize, workers):
+    converted_file = tmp_path.joinpath("file1.csv")
+    file_dict = [
+        {"sas7bdat_file": sas_file_1, "export_file": converted_file},
+        {"sas7bdat_file": bad_sas_file, "export_file": tmp_path.joinpath("bad_file.csv")},
+    ]
+
+    results = converter.batch_to_csv(
+        file_dict,
+        chunksize=chunksize,
+        columns=["integer_row", "text_row"],
+        where="integer_row > 1",
+        workers=workers,
+        continue_on_error=True,
+        verbose=False,
+    )
+
+    df = converter.to_dataframe(sas_file_1)
+    result = results[0]
+    assert result.rows == (df["integer_row"] > 1).sum()
+    assert result.columns == 2
+    assert result.bytes_read == sas_file_1.stat().st_size
+    assert result.bytes_written == converted_file.stat().st_size
+    assert result.read_seconds > 0
+    assert result.decode_seconds > 0
+    assert result.transform_seconds > 0
+    assert result.write_seconds > 0
+    assert results[1].rows is None
+    assert results[1].read_seconds is None
+
+
+def test_batch_to_csv_zip_member_stats(tmp_path, sas_zip_file):
+    file_dicts = [
+        {"sas7bdat_file": sas_zip_file / "file1.sas7bdat", "export_file": tmp_path / "file1.csv"}
+    ]
+
+    results = converter.batch_to_csv(file_dicts)
+
+    with zipfile.ZipFile(sas_zip_file) as archive:
+        compressed_size = archive.getinfo("file1.sas7bdat").compress_size
+    assert results[0].status == "converted"
+    assert results[0].bytes_read == compressed_size
+
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_batch_to_csv_workers(tmp_path, workers, sas_file_1, sas_file_2, sas_file_3, expected_dir):
+    file_dict = [
+        {
+            "sas7bdat_file": sas_file,
+            "export_file": tmp_path.joinpath(sas_file.with_suffix(".csv").name),
+        }
+        for sas_file in (sas_file_1, sas_file_2, sas_file_3)
+    ]
+
+    results = converter.batch_to_csv(file_dict, workers=workers)
+
+    assert [result.status for result in results] == ["converted"] * 3
+    for converted_file in tmp_path.iterdir():
+        expected_file = expected_dir.joinpath(converted_file.name)
+        assert converted_file.read_text().rstrip() == expected_file.read_text().rstrip()
+
+
+def test_batch_to_csv_executor(tmp_path, sas_file_1, xpt_file_1):
+    file_dict = [
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path.joinpath("file1_sas.csv")},
+        {"sas7bdat_file": xpt_file_1, "export_file": tmp_path.joinpath("file1_xpt.csv")},
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = converter.batch_to_csv(file_dict, executor=executor)
+        # the executor is left open for the caller
+        assert executor.submit(lambda: True).result()
+
+    assert [result.status for result in results] == ["converted", "converted"]
+
+
+def test_batch_to_csv_largest_first(tmp_path, monkeypatch, sas_file_1, xpt_file_1, xpt_file_2):
+    converted = []
+    monkeypatch.setattr(
+        converter, "_convert", lambda _, sas7bdat_file, *args: converted.append(sas7bdat_file)
+    )
+    file_dict = [
+        {"sas7bdat_file": xpt_file_1, "export_file": tmp_path.joinpath("file1_xpt.csv")},
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path.joinpath("file1_sas.csv")},
+        {"sas7bdat_file": xpt_file_2, "export_file": tmp_path.joinpath("file2_xpt.csv")},
+    ]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = converter.batch_to_csv(file_dict, executor=executor, workers=2)
+
+    assert converted[0] == str(sas_file_1)
+    # results are still returned in the order the files were given
+    assert [result.sas7bdat_file for result in results] == [
+        str(xpt_file_1),
+        str(sas_file_1),
+        str(xpt_file_2),
+    ]
+
+
+def test_batch_to_csv_memory_budget(tmp_path, monkeypatch, sas_file_1, sas_file_2, sas_file_3):
+    lock = threading.Lock()
+    running = []
+    max_running = 0
+
+    def fake_convert(*args):
+        nonlocal max_running
+        with lock:
+            running.append(args)
+            max_running = max(max_running, len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(args)
+
+    monkeypatch.setattr(converter, "_convert", fake_convert)
+    file_dict = [
+        {"sas7bdat_file": sas_file, "export_file": tmp_path.joinpath(f"{sas_file.stem}.csv")}
+        for sas_file in (sas_file_1, sas_file_2, sas_file_3)
+    ]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = converter.batch_to_csv(
+            file_dict, executor=executor, workers=3, memory_budget=sas_file_1.stat().st_size
+        )
+
+    assert max_running == 1
+    assert [result.status for result in results] == ["converted"] * 3
+
+
+def test_batch_to_csv_same_export_file(tmp_path, monkeypatch, sas_file_1, sas_file_2):
+    lock = threading.Lock()
+    writing = []
+    overlapped = []
+
+    def fake_convert(file_type, sas7bdat_file, export_file, options):
+        with lock:
+            overlapped.extend(f for f in writing if f == export_file)
+            writing.append(export_file)
+        time.sleep(0.05)
+        with lock:
+            writing.remove(export_file)
+
+    monkeypatch.setattr(converter, "_convert", fake_convert)
+    file_dict = [
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path.joinpath("file.csv")},
+        {"sas7bdat_file": sas_file_2, "export_file": str(tmp_path.joinpath("file.csv"))},
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path.joinpath("file1.csv")},
+    ]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = converter.batch_to_csv(file_dict, executor=executor, workers=3)
+
+    assert overlapped == []
+    assert [result.status for result in results] == ["converted"] * 3
+
+
+def test_run_conversions_discovery_error(sas_file_1):
+    def tasks():
+        yield ("csv", str(sas_file_1), "file1.csv", {})
+        raise PermissionError("no access")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(PermissionError, match="no access"):
+            converter._run_conversions(tasks(), False, False, None, executor)
+
+
+@pytest.mark.parametrize(
+    "chunksize, expected_cost",
+    [(None, 131_072), (10, 131_072), (1, 131_072 // 5)],
+)
+def test_estimate_cost(sas_file_1, chunksize, expected_cost):
+    task = ("csv", str(sas_file_1), "file1.csv", {"chunksize": chunksize})
+
+    assert converter._estimate_cost(task) == (131_072, expected_cost)
+
+
+@pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz", ZST])
+def test_estimate_cost_compressed(tmp_path, sas_file_1, extension):
+    compressed_file = write_compressed(sas_file_1, tmp_path / f"file1.sas7bdat{extension}")
+    task = ("csv", str(compressed_file), "file1.csv", {"chunksize": None})
+
+    assert converter._estimate_cost(task) == (131_072, 131_072)
+
+
+@requires_zstandard
+def test_estimate_cost_zstd_content_size(tmp_path, sas_file_1):
+    zstandard = importlib.import_module("zstandard")
+    compressed_file = tmp_path / "file1.sas7bdat.zst"
+    compressed_file.write_bytes(zstandard.ZstdCompressor().compress(sas_file_1.read_bytes()))
+    task = ("csv", str(compressed_file), "file1.csv", {"chunksize": None})
+
+    assert converter._estimate_cost(task) == (131_072, 131_072)
+
+
+def test_estimate_cost_zip_member(tmp_path, sas_file_1):
+    with zipfile.ZipFile(tmp_path / "bundle.zip", "w", zipfile.ZIP_DEFLATED) as f:
+        f.write(sas_file_1, "file1.sas7bdat")
+    task = ("csv", str(tmp_path / "bundle.zip" / "file1.sas7bdat"), "file1.csv", {"chunksize": 1})
+
+    assert converter._estimate_cost(task) == (131_072, 131_072 // 5)
+
+
+def test_estimate_cost_missing_file(tmp_path):
+    task = ("csv", str(tmp_path / "missing.sas7bdat"), "missing.csv", {"chunksize": None})
+
+    assert converter._estimate_cost(task) == (0, 0)
+
+
+def test_batch_to_csv_workers_continue_verbose(tmp_path, capfd, sas_file_1):
+    bad_sas_file = tmp_path.joinpath("bad_file.sas7bdat")
+    converted_file = tmp_path.joinpath("file1.csv")
+    file_dict = [
+        {"sas7bdat_file": bad_sas_file, "export_file": tmp_path.joinpath("bad_file.csv")},
+        {"sas7bdat_file": sas_file_1, "export_file": converted_file},
+    ]
+
+    results = converter.batch_to_csv(file_dict, continue_on_error=True, workers=2)
+    out, _ = capfd.readouterr()
+
+    assert converted_file.is_file()
+    assert "Error converting" in out
+    assert [result.status for result in results] == ["failed", "converted"]
+
+
+def test_batch_to_csv_workers_no_continue(tmp_path, sas_file_1):
+    bad_sas_file = tmp_path.joinpath("bad_file.sas7bdat")
+    file_dict = [
+        {"sas7bdat_file": bad_sas_file, "export_file": tmp_path.joinpath("bad_file.csv")},
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path.joinpath("file1.csv")},
+    ]
+
+    with pytest.raises(Exception):  # noqa: B017
+        converter.batch_to_csv(file_dict, workers=2)
+
+
 def test_batch_to_excel_path_sas(tmp_path, sas_file_1, sas_file_2, sas_file_3):
     converted_file_1 = tmp_path.joinpath("file1.xlsx")
     converted_file_2 = tmp_path.joinpath("file2.xlsx")
@@ -419,6 +779,26 @@ def test_batch_to_excel_invalid_key_xpt(file_dict):
     assert "Invalid key provided" in str(execinfo.value)
 
 
+def test_batch_to_feather(tmp_path, sas_file_1, xpt_file_1):
+    converted_file_1 = tmp_path.joinpath("file1_sas.feather")
+    converted_file_2 = tmp_path.joinpath("file1_xpt.feather")
+
+    file_dict = [
+        {"sas7bdat_file": sas_file_1, "export_file": converted_file_1},
+        {"sas7bdat_file": xpt_file_1, "export_file": converted_file_2},
+    ]
+
+    results = converter.batch_to_feather(file_dict, chunksize=2)
+
+    assert [result.status for result in results] == ["converted", "converted"]
+    pd.testing.assert_frame_equal(
+        pd.read_feather(converted_file_1), converter.to_dataframe(sas_file_1)
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_feather(converted_file_2), converter.to_dataframe(xpt_file_1)
+    )
+
+
 def test_batch_to_json_path_sas(tmp_path, sas_file_1, sas_file_2, sas_file_3):
     converted_file_1 = tmp_path.joinpath("file1.json")
     converted_file_2 = tmp_path.joinpath("file2.json")
@@ -621,6 +1001,55 @@ def test_batch_to_json_invalid_key_xpt(file_dict):
     assert "Invalid key provided" in str(execinfo.value)
 
 
+def test_batch_to_json_compression(tmp_path, sas_file_1, sas_file_2, expected_dir):
+    file_dicts = [
+        {"sas7bdat_file": sas_file_1, "export_file": tmp_path / "file1.json.gz"},
+        {"sas7bdat_file": sas_file_2, "export_file": tmp_path / "file2.json"},
+    ]
+
+    converter.batch_to_json(file_dicts, chunksize=2)
+
+    assert json.loads(read_compressed(tmp_path / "file1.json.gz")) == json.loads(
+        (expected_dir / "file1.json").read_text()
+    )
+    assert json.loads((tmp_path / "file2.json").read_text()) == json.loads(
+        (expected_dir / "file2.json").read_text()
+    )
+
+
+def test_batch_to_json_lines(tmp_path, sas_file_1, xpt_file_1):
+    converted_file_1 = tmp_path.joinpath("file1_sas.jsonl")
+    converted_file_2 = tmp_path.joinpath("file1_xpt.jsonl")
+
+    file_dict = [
+        {"sas7bdat_file": sas_file_1, "export_file": converted_file_1},
+        {"sas7bdat_file": xpt_file_1, "export_file": converted_file_2},
+    ]
+
+    converter.batch_to_json(file_dict, lines=True)
+
+    assert len(converted_file_1.read_text().splitlines()) == 5
+    assert len(converted_file_2.read_text().splitlines()) == 2
+
+
+def test_batch_to_parquet(tmp_path, sas_file_1, sas_file_2, sas_file_3, expected_dir):
+    file_dict = [
+        {
+            "sas7bdat_file": sas_file,
+            "export_file": tmp_path.joinpath(sas_file.with_suffix(".parquet").name),
+        }
+        for sas_file in (sas_file_1, sas_file_2, sas_file_3)
+    ]
+
+    results = converter.batch_to_parquet(file_dict)
+
+    assert [result.status for result in results] == ["converted"] * 3
+    for converted_file in tmp_path.iterdir():
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(converted_file), pd.read_parquet(expected_dir / converted_file.name)
+        )
+
+
 optionals = [
     {},
     {"root_node": "root"},
@@ -1097,6 +1526,198 @@ def test_batch_to_xml_invalid_key_xpt(file_dict):
     assert "Invalid key provided" in str(execinfo.value)
 
 
+def test_batch_convert(tmp_path, sas_file_1, xpt_file_1, expected_dir, xpt_expected_dir):
+    file_dict = [
+        {
+            "sas7bdat_file": sas_file_1,
+            "export_files": [tmp_path / "file1_sas.csv", tmp_path / "file1_sas.parquet"],
+        },
+        {
+            "sas7bdat_file": xpt_file_1,
+            "export_files": [tmp_path / "file1_xpt.xml"],
+            "root_node": "data",
+        },
+    ]
+
+    results = converter.batch_convert(file_dict)
+
+    assert [(Path(result.export_file).name, result.status) for result in results] == [
+        ("file1_sas.csv", "converted"),
+        ("file1_sas.parquet", "converted"),
+        ("file1_xpt.xml", "converted"),
+    ]
+    assert (tmp_path / "file1_sas.csv").read_text() == (expected_dir / "file1.csv").read_text()
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "file1_sas.parquet"),
+        pd.read_parquet(expected_dir / "file1.parquet"),
+    )
+    assert (tmp_path / "file1_xpt.xml").read_text().endswith("</data>")
+
+
+def test_batch_convert_result_stats(tmp_path, sas_file_1):
+    file_dict = [
+        {
+            "sas7bdat_file": sas_file_1,
+            "export_files": [tmp_path / "file1.csv", tmp_path / "file1.parquet"],
+        },
+    ]
+
+    results = converter.batch_convert(file_dict, chunksize=2)
+
+    assert [result.rows for result in results] == [5, 5]
+    assert [result.bytes_written for result in results] == [
+        (tmp_path / "file1.csv").stat().st_size,
+        (tmp_path / "file1.parquet").stat().st_size,
+    ]
+    assert results[0].read_seconds == results[1].read_seconds
+
+
+def test_batch_convert_continue(tmp_path, bad_sas_file, sas_file_1):
+    file_dict = [
+        {
+            "sas7bdat_file": bad_sas_file,
+            "export_files": [tmp_path / "bad.csv", tmp_path / "bad.xml"],
+        },
+        {"sas7bdat_file": sas_file_1, "export_files": [tmp_path / "file1.csv"]},
+    ]
+
+    results = converter.batch_convert(file_dict, continue_on_error=True, verbose=False)
+
+    assert [result.status for result in results] == ["failed", "failed", "converted"]
+    assert isinstance(results[0].error, Exception)
+
+
+@pytest.mark.parametrize(
+    "file_dict",
+    [
+        [{"sas7bdat_file": "test.sas7bdat", "export_file": "test.csv"}],
+        [{"sas7bdat_file": "test.sas7bdat", "export_files": ["test.csv"], "bad": "test"}],
+    ],
+)
+def test_batch_convert_invalid_key(file_dict):
+    with pytest.raises(KeyError, match="Invalid key provided"):
+        converter.batch_convert(file_dict)
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_convert(tmp_path, sas_file_1, expected_dir, chunksize):
+    outputs = [tmp_path / f"file1.{ext}" for ext in ("csv", "json", "xml", "xlsx", "parquet")]
+    outputs.append(tmp_path / "file1.jsonl")
+
+    with patch.object(converter.pd, "read_sas", wraps=pd.read_sas) as read_sas:
+        converter.convert(sas_file_1, outputs, chunksize=chunksize)
+
+    read_sas.assert_called_once()
+    assert (tmp_path / "file1.csv").read_text() == (expected_dir / "file1.csv").read_text()
+    assert json.loads((tmp_path / "file1.json").read_text()) == json.loads(
+        (expected_dir / "file1.json").read_text()
+    )
+    assert (tmp_path / "file1.xml").read_text() == (expected_dir / "file1.xml").read_text().rstrip()
+    pd.testing.assert_frame_equal(
+        pd.read_excel(tmp_path / "file1.xlsx"), pd.read_excel(expected_dir / "file1.xlsx")
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "file1.parquet"),
+        pd.read_parquet(expected_dir / "file1.parquet"),
+    )
+    assert len((tmp_path / "file1.jsonl").read_text().splitlines()) == 5
+
+
+@requires_zstandard
+def test_convert_compression(tmp_path, sas_file_1, expected_dir):
+    outputs = [tmp_path / "file1.csv.gz", tmp_path / "file1.jsonl.zst", tmp_path / "file1.parquet"]
+
+    converter.convert(sas_file_1, outputs)
+
+    assert read_compressed(outputs[0]) == (expected_dir / "file1.csv").read_text()
+    assert len(read_compressed(outputs[1]).splitlines()) == 5
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(outputs[2]), pd.read_parquet(expected_dir / "file1.parquet")
+    )
+
+
+@pytest.mark.parametrize("export_file", ["file1.json", "file1.parquet", "file1.xml"])
+def test_convert_failed_write_removes_export_file(tmp_path, sas_file_1, export_file):
+    def fail(chunks, writers):
+        df = next(chunks)
+        for writer in writers:
+            writer.write(df)
+        raise OSError("No space left on device")
+
+    with patch.object(converter, "_write_chunks", fail), pytest.raises(OSError):
+        converter.convert(sas_file_1, [tmp_path / "file1.csv", tmp_path / export_file])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("output", ["file1.parquet.gz", "file1.gz"])
+def test_convert_invalid_compressed_extension(tmp_path, sas_file_1, output):
+    with pytest.raises(AttributeError, match="Valid extensions for convert conversion"):
+        converter.convert(sas_file_1, [tmp_path / output])
+
+
+def test_convert_invalid_extension(tmp_path, sas_file_1):
+    with pytest.raises(AttributeError, match="Valid extensions for convert conversion"):
+        converter.convert(sas_file_1, [tmp_path / "file1.csv", tmp_path / "file1.txt"])
+
+    assert not (tmp_path / "file1.csv").exists()
+
+
+def test_convert_bad_file(tmp_path, bad_sas_file):
+    with pytest.raises(Exception):  # noqa: B017
+        converter.convert(bad_sas_file, [tmp_path / "bad.csv", tmp_path / "bad.json"])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_dir_convert(tmp_path, sas7bdat_dir, expected_dir):
+    results = converter.dir_convert(sas7bdat_dir, ["csv", ".parquet"], tmp_path, verbose=False)
+
+    assert len(results) == 6
+    assert {result.status for result in results} == {"converted"}
+    for name in ("file1", "file2", "file3"):
+        assert (tmp_path / f"{name}.csv").read_text() == (expected_dir / f"{name}.csv").read_text()
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(tmp_path / f"{name}.parquet"),
+            pd.read_parquet(expected_dir / f"{name}.parquet"),
+        )
+
+
+def test_dir_convert_compression(tmp_path, sas7bdat_dir, expected_dir):
+    converter.dir_convert(sas7bdat_dir, ["csv.bz2", "parquet"], tmp_path, verbose=False)
+
+    for name in ("file1", "file2", "file3"):
+        assert (
+            read_compressed(tmp_path / f"{name}.csv.bz2")
+            == (expected_dir / f"{name}.csv").read_text()
+        )
+        assert (tmp_path / f"{name}.parquet").is_file()
+
+
+def test_dir_convert_incremental(tmp_path, sas7bdat_dir):
+    converter.dir_convert(sas7bdat_dir, ["csv", "jsonl"], tmp_path, verbose=False)
+    (tmp_path / "file1.jsonl").unlink()
+
+    results = converter.dir_convert(
+        sas7bdat_dir, ["csv", "jsonl"], tmp_path, incremental=True, verbose=False
+    )
+    statuses = {Path(result.export_file).name: result.status for result in results}
+
+    assert statuses == {
+        "file1.csv": "converted",
+        "file1.jsonl": "converted",
+        "file2.csv": "skipped",
+        "file2.jsonl": "skipped",
+        "file3.csv": "skipped",
+        "file3.jsonl": "skipped",
+    }
+
+
+def test_dir_convert_invalid_format(tmp_path, sas7bdat_dir):
+    with pytest.raises(AttributeError):
+        converter.dir_convert(sas7bdat_dir, ["csv", "txt"], tmp_path)
+
+
 def test_dir_to_csv_same_dir_path_sas(tmp_path, sas7bdat_dir):
     sas_files = [str(x) for x in sas7bdat_dir.iterdir()]
     for sas_file in sas_files:
@@ -1261,16 +1882,230 @@ def test_dir_to_csv_different_dir_str_xpt(tmpdir, xpt_dir):
     assert xpt_counter == convert_counter
 
 
-def test_dir_to_excel_same_dir_path_sas(tmp_path, sas7bdat_dir):
-    sas_files = [x for x in sas7bdat_dir.iterdir()]
-    for sas_file in sas_files:
-        shutil.copy(sas_file, str(tmp_path))
+def test_dir_to_csv_chunksize(tmp_path, sas7bdat_dir, expected_dir):
+    converter.dir_to_csv(sas7bdat_dir, tmp_path, chunksize=2)
 
-    converter.dir_to_excel(tmp_path)
-    sas_counter = len([name for name in tmp_path.iterdir() if name.suffix == ".sas7bdat"])
-    convert_counter = len([name for name in tmp_path.iterdir() if name.suffix == ".xlsx"])
+    for converted_file in tmp_path.iterdir():
+        expected_file = expected_dir.joinpath(converted_file.name)
+        assert converted_file.read_text().rstrip() == expected_file.read_text().rstrip()
 
-    assert sas_counter == convert_counter
+
+def test_dir_to_csv_workers(tmp_path, sas7bdat_dir, expected_dir):
+    results = converter.dir_to_csv(sas7bdat_dir, tmp_path, workers=2)
+
+    assert len(results) == 3
+    assert all(result.status == "converted" for result in results)
+    for converted_file in tmp_path.iterdir():
+        expected_file = expected_dir.joinpath(converted_file.name)
+        assert converted_file.read_text().rstrip() == expected_file.read_text().rstrip()
+
+
+@pytest.mark.parametrize("compression, extension", [("gzip", ".gz"), ("xz", ".xz")])
+def test_dir_to_csv_compression(tmp_path, sas7bdat_dir, expected_dir, compression, extension):
+    results = converter.dir_to_csv(sas7bdat_dir, tmp_path, compression=compression)
+
+    assert {Path(result.export_file).name for result in results} == {
+        f"file{i}.csv{extension}" for i in (1, 2, 3)
+    }
+    for result in results:
+        converted_file = Path(result.export_file)
+        expected_file = expected_dir / converted_file.stem
+        assert read_compressed(converted_file) == expected_file.read_text()
+
+
+def test_dir_to_csv_invalid_compression(tmp_path, sas7bdat_dir):
+    with pytest.raises(ValueError, match="compression"):
+        converter.dir_to_csv(sas7bdat_dir, tmp_path, compression="zip")
+
+
+def test_dir_to_csv_incremental(tmp_path, capfd, sas7bdat_dir):
+    for sas_file in sas7bdat_dir.iterdir():
+        shutil.copy(sas_file, tmp_path)
+    export_path = tmp_path / "export"
+    export_path.mkdir()
+
+    first = converter.dir_to_csv(tmp_path, export_path, incremental=True)
+    assert [result.status for result in first] == ["converted"] * 3
+
+    second = converter.dir_to_csv(tmp_path, export_path, incremental=True)
+    out, _ = capfd.readouterr()
+    assert [result.status for result in second] == ["skipped"] * 3
+    assert "is up to date" in out
+
+    changed_file = tmp_path / "file2.sas7bdat"
+    export_mtime = (export_path / "file2.csv").stat().st_mtime_ns
+    os.utime(changed_file, ns=(export_mtime + 1_000_000_000, export_mtime + 1_000_000_000))
+
+    third = converter.dir_to_csv(tmp_path, export_path, incremental=True, verbose=False)
+    statuses = {Path(result.sas7bdat_file).name: result.status for result in third}
+    assert statuses == {
+        "file1.sas7bdat": "skipped",
+        "file2.sas7bdat": "converted",
+        "file3.sas7bdat": "skipped",
+    }
+
+
+def test_dir_to_csv_incremental_after_failed_write(tmp_path, sas_file_1, expected_dir):
+    shutil.copy(sas_file_1, tmp_path)
+    write = converter._CsvWriter.write
+    chunks_written = []
+
+    def fail_on_second_chunk(self, df):
+        if chunks_written:
+            raise OSError("No space left on device")
+        write(self, df)
+        chunks_written.append(len(df))
+
+    with patch.object(converter._CsvWriter, "write", fail_on_second_chunk):
+        failed = converter.dir_to_csv(
+            tmp_path, chunksize=3, continue_on_error=True, incremental=True, verbose=False
+        )
+    assert [result.status for result in failed] == ["failed"]
+    assert not (tmp_path / "file1.csv").exists()
+
+    rerun = converter.dir_to_csv(tmp_path, chunksize=3, incremental=True, verbose=False)
+
+    assert [result.status for result in rerun] == ["converted"]
+    assert (tmp_path / "file1.csv").read_text() == (expected_dir / "file1.csv").read_text()
+
+
+def test_dir_to_csv_recursive(tmp_path, sas7bdat_dir):
+    source = tmp_path / "source"
+    nested = source / "a" / "b"
+    nested.mkdir(parents=True)
+    shutil.copy(sas7bdat_dir / "file1.sas7bdat", source)
+    shutil.copy(sas7bdat_dir / "file2.sas7bdat", source / "a" / "FILE2.SAS7BDAT")
+    shutil.copy(sas7bdat_dir / "file3.sas7bdat", nested)
+    export_path = tmp_path / "export"
+    export_path.mkdir()
+
+    results = converter.dir_to_csv(source, export_path, recursive=True, verbose=False)
+
+    assert {result.status for result in results} == {"converted"}
+    assert sorted(p.relative_to(export_path).as_posix() for p in export_path.rglob("*.csv")) == [
+        "a/FILE2.csv",
+        "a/b/file3.csv",
+        "file1.csv",
+    ]
+
+
+def test_dir_to_csv_not_recursive(tmp_path, sas7bdat_dir):
+    (tmp_path / "nested").mkdir()
+    shutil.copy(sas7bdat_dir / "file1.sas7bdat", tmp_path)
+    shutil.copy(sas7bdat_dir / "file2.sas7bdat", tmp_path / "nested")
+
+    results = converter.dir_to_csv(tmp_path, verbose=False)
+
+    assert [Path(result.export_file) for result in results] == [tmp_path / "file1.csv"]
+
+
+def test_dir_to_csv_compressed_and_zip_inputs(tmp_path, sas_file_3, sas_zip_file, expected_dir):
+    write_compressed(sas_file_3, tmp_path / "file3.sas7bdat.gz")
+    export_path = tmp_path / "export"
+    export_path.mkdir()
+
+    results = converter.dir_to_csv(tmp_path, export_path, verbose=False)
+
+    assert {result.sas7bdat_file for result in results} == {
+        str(tmp_path / "file3.sas7bdat.gz"),
+        str(sas_zip_file / "file1.sas7bdat"),
+        str(sas_zip_file / "file2.sas7bdat"),
+        str(sas_zip_file / "xpt" / "file1.xpt"),
+    }
+    for name in ("file1.csv", "file2.csv", "file3.csv"):
+        assert (export_path / name).read_text() == (expected_dir / name).read_text()
+    assert (export_path / "xpt" / "file1.csv").is_file()
+
+    results = converter.dir_to_csv(tmp_path, export_path, incremental=True, verbose=False)
+
+    assert {result.status for result in results} == {"skipped"}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_dir_to_csv_bad_zip_file(tmp_path, sas_file_1, workers):
+    shutil.copy(sas_file_1, tmp_path)
+    (tmp_path / "notes.zip").write_bytes(b"not a zip")
+
+    results = converter.dir_to_csv(tmp_path, continue_on_error=True, verbose=False, workers=workers)
+
+    statuses = {Path(result.sas7bdat_file).name: result.status for result in results}
+    assert statuses == {"notes.zip": "failed", "file1.sas7bdat": "converted"}
+    failed = next(result for result in results if result.status == "failed")
+    assert isinstance(failed.error, zipfile.BadZipFile)
+    assert failed.export_file == str(tmp_path)
+    assert (tmp_path / "file1.csv").is_file()
+
+    with pytest.raises(zipfile.BadZipFile):
+        converter.dir_to_csv(tmp_path, verbose=False, workers=workers)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_dir_to_csv_same_export_file(tmp_path, sas_file_1, expected_dir, workers):
+    shutil.copy(sas_file_1, tmp_path)
+    (tmp_path / "file1.sas7bdat.gz").write_bytes(gzip.compress(sas_file_1.read_bytes()))
+    for archive in ("a.zip", "b.zip"):
+        with zipfile.ZipFile(tmp_path / archive, "w") as f:
+            f.write(sas_file_1, "file1.sas7bdat")
+
+    results = converter.dir_to_csv(tmp_path, continue_on_error=True, verbose=False, workers=workers)
+
+    assert sorted(result.status for result in results) == [
+        "converted",
+        "failed",
+        "failed",
+        "failed",
+    ]
+    assert {result.export_file for result in results} == {str(tmp_path / "file1.csv")}
+    failed = [result for result in results if result.status == "failed"]
+    assert all("has the same export file as" in str(result.error) for result in failed)
+    assert (tmp_path / "file1.csv").read_text() == (expected_dir / "file1.csv").read_text()
+
+    with pytest.raises(ValueError, match="has the same export file as"):
+        converter.dir_to_csv(tmp_path, verbose=False, workers=workers)
+
+
+def test_dir_to_csv_include_exclude(tmp_path, sas7bdat_dir):
+    (tmp_path / "keep").mkdir()
+    shutil.copy(sas7bdat_dir / "file1.sas7bdat", tmp_path)
+    shutil.copy(sas7bdat_dir / "file2.sas7bdat", tmp_path / "keep")
+    shutil.copy(sas7bdat_dir / "file3.sas7bdat", tmp_path / "keep")
+
+    results = converter.dir_to_csv(
+        tmp_path,
+        recursive=True,
+        include="keep/*",
+        exclude=["file3.*"],
+        verbose=False,
+    )
+
+    assert [Path(result.export_file) for result in results] == [tmp_path / "keep" / "file2.csv"]
+
+
+@pytest.mark.parametrize(
+    "relative_path, patterns, expected",
+    [
+        ("file1.sas7bdat", ["*.sas7bdat"], True),
+        ("a/b/file1.sas7bdat", ["file1.*"], True),
+        ("a/b/file1.sas7bdat", ["a/*"], True),
+        ("a/b/file1.sas7bdat", ["b/*"], False),
+        ("a/file1.xpt", ["*.sas7bdat", "*.xpt"], True),
+        ("a/file1.xpt", ["file2.*"], False),
+    ],
+)
+def test_matches_patterns(relative_path, patterns, expected):
+    assert converter._matches_patterns(Path(relative_path), patterns) is expected
+
+
+def test_dir_to_excel_same_dir_path_sas(tmp_path, sas7bdat_dir):
+    sas_files = [x for x in sas7bdat_dir.iterdir()]
+    for sas_file in sas_files:
+        shutil.copy(sas_file, str(tmp_path))
+
+    converter.dir_to_excel(tmp_path)
+    sas_counter = len([name for name in tmp_path.iterdir() if name.suffix == ".sas7bdat"])
+    convert_counter = len([name for name in tmp_path.iterdir() if name.suffix == ".xlsx"])
+
+    assert sas_counter == convert_counter
 
 
 def test_dir_to_excel_same_dir_path_xpt(tmp_path, xpt_dir):
@@ -1425,6 +2260,13 @@ def test_dir_to_excel_no_continue_xpt(tmp_path, xpt_dir, bad_xpt_file):
         converter.dir_to_excel(tmp_path, continue_on_error=False)
 
 
+def test_dir_to_feather(tmp_path, xpt_dir):
+    converter.dir_to_feather(xpt_dir, tmp_path)
+
+    converted_files = sorted(x.name for x in tmp_path.iterdir())
+    assert converted_files == ["file1.feather", "file2.feather"]
+
+
 def test_dir_to_json_same_dir_path_sas(tmp_path, sas7bdat_dir):
     sas_files = [x for x in sas7bdat_dir.iterdir()]
     for sas_file in sas_files:
@@ -1589,6 +2431,44 @@ def test_dir_to_json_no_continue_xpt(tmp_path, xpt_dir, bad_xpt_file):
         converter.dir_to_json(tmp_path, continue_on_error=False)
 
 
+def test_dir_to_json_lines(tmp_path, sas7bdat_dir):
+    converter.dir_to_json(sas7bdat_dir, tmp_path, lines=True)
+
+    converted_files = sorted(x.name for x in tmp_path.iterdir())
+    assert converted_files == ["file1.jsonl", "file2.jsonl", "file3.jsonl"]
+    for converted_file in tmp_path.iterdir():
+        with open(converted_file) as f:
+            assert all(isinstance(json.loads(line), dict) for line in f)
+
+
+def test_dir_to_parquet(tmp_path, sas7bdat_dir, expected_dir):
+    converter.dir_to_parquet(sas7bdat_dir, tmp_path, chunksize=2)
+
+    for converted_file in tmp_path.iterdir():
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(converted_file), pd.read_parquet(expected_dir / converted_file.name)
+        )
+
+
+def test_dir_to_parquet_columns(tmp_path, sas7bdat_dir, expected_dir):
+    converter.dir_to_parquet(sas7bdat_dir, tmp_path, columns=["text_row", "date_row"])
+
+    for converted_file in tmp_path.iterdir():
+        expected = pd.read_parquet(expected_dir / converted_file.name)
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(converted_file), expected[["text_row", "date_row"]]
+        )
+
+
+def test_dir_to_parquet_where(tmp_path, sas7bdat_dir, expected_dir):
+    converter.dir_to_parquet(sas7bdat_dir, tmp_path, where="text_row.str.len() < 10")
+
+    for converted_file in tmp_path.iterdir():
+        expected = pd.read_parquet(expected_dir / converted_file.name)
+        expected = expected[expected["text_row"].str.len() < 10].reset_index(drop=True)
+        pd.testing.assert_frame_equal(pd.read_parquet(converted_file), expected)
+
+
 def test_dir_to_xml_same_dir_path_sas(tmp_path, sas7bdat_dir):
     sas_files = [x for x in sas7bdat_dir.iterdir()]
     for sas_file in sas_files:
@@ -1753,6 +2633,118 @@ def test_dir_to_xml_no_continue_xpt(tmp_path, xpt_dir, bad_xpt_file):
         converter.dir_to_xml(tmp_path, continue_on_error=False)
 
 
+@pytest.mark.parametrize("chunksize", [1, 2, 100])
+def test_iter_dataframes_sas(sas_file_1, chunksize):
+    chunks = list(converter.iter_dataframes(sas_file_1, chunksize=chunksize))
+
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks), converter.to_dataframe(sas_file_1))
+
+
+@pytest.mark.parametrize("chunksize", [1, 100])
+def test_iter_dataframes_xpt(xpt_file_1, chunksize):
+    chunks = list(converter.iter_dataframes(xpt_file_1, chunksize=chunksize))
+
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks), converter.to_dataframe(xpt_file_1))
+
+
+def test_iter_dataframes_bad_file(bad_sas_file):
+    with pytest.raises(Exception):  # noqa: B017
+        list(converter.iter_dataframes(bad_sas_file, chunksize=2))
+
+
+def test_iter_dataframes_columns(sas_file_1):
+    chunks = list(converter.iter_dataframes(sas_file_1, chunksize=2, columns=["text_row"]))
+
+    assert all(list(chunk.columns) == ["text_row"] for chunk in chunks)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks), converter.to_dataframe(sas_file_1)[["text_row"]]
+    )
+
+
+def test_iter_dataframes_where(sas_file_1):
+    chunks = list(
+        converter.iter_dataframes(
+            sas_file_1, chunksize=2, columns=["text_row"], where="integer_row >= 3"
+        )
+    )
+
+    expected = converter.to_dataframe(sas_file_1)
+    expected = expected.loc[expected["integer_row"] >= 3, ["text_row"]]
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_read_metadata_sas(sas_file_1):
+    metadata = converter.read_metadata(sas_file_1)
+
+    assert metadata == converter.FileMetadata(
+        sas7bdat_file=str(sas_file_1),
+        file_format="sas7bdat",
+        row_count=5,
+        column_names=["integer_row", "text_row", "float_row", "date_row"],
+        column_types=["numeric", "char", "numeric", "numeric"],
+        column_labels=["", "", "", ""],
+        column_formats=["BEST", "$", "BEST", "MMDDYY"],
+        encoding="cp1252",
+    )
+
+
+def test_read_metadata_xpt(xpt_file_1):
+    metadata = converter.read_metadata(xpt_file_1)
+
+    assert metadata == converter.FileMetadata(
+        sas7bdat_file=str(xpt_file_1),
+        file_format="xport",
+        row_count=2,
+        column_names=["irow", "trow", "frow"],
+        column_types=["numeric", "char", "numeric"],
+        column_labels=["", "", ""],
+        column_formats=["", "", ""],
+    )
+
+
+@pytest.mark.parametrize(
+    "fixture_name", ["sas_file_1", "sas_file_2", "sas_file_3", "xpt_file_1", "xpt_file_2"]
+)
+def test_read_metadata_matches_data(fixture_name, request):
+    sas_file = request.getfixturevalue(fixture_name)
+    metadata = converter.read_metadata(sas_file)
+    df = converter.to_dataframe(sas_file)
+
+    assert metadata.row_count == len(df)
+    assert metadata.column_names == list(df.columns)
+
+
+def test_read_metadata_zip_member(sas_zip_file, sas_file_1, xpt_file_1):
+    metadata = converter.read_metadata(sas_zip_file / "file1.sas7bdat")
+    xpt_metadata = converter.read_metadata(f"{sas_zip_file}/xpt/file1.xpt")
+
+    assert metadata.sas7bdat_file == str(sas_zip_file / "file1.sas7bdat")
+    assert metadata.column_names == converter.read_metadata(sas_file_1).column_names
+    assert xpt_metadata.row_count == converter.read_metadata(xpt_file_1).row_count
+
+
+@pytest.mark.parametrize("fixture_name", ["sas_file_1", "xpt_file_1"])
+def test_read_metadata_file_object(fixture_name, request):
+    sas_file = request.getfixturevalue(fixture_name)
+
+    with open(sas_file, "rb") as f:
+        metadata = converter.read_metadata(f)
+    bytes_metadata = converter.read_metadata(sas_file.read_bytes())
+
+    expected = converter.read_metadata(sas_file)
+    assert metadata.sas7bdat_file == str(sas_file)
+    assert bytes_metadata.sas7bdat_file == "<bytes>"
+    assert metadata.file_format == bytes_metadata.file_format == expected.file_format
+    assert metadata.column_names == bytes_metadata.column_names == expected.column_names
+
+
+def test_read_metadata_bad_file(bad_sas_file):
+    with pytest.raises(Exception):  # noqa: B017
+        converter.read_metadata(bad_sas_file)
+
+
 exception_data = [
     (
         "sas7bdat conversion error - Valid extension for to_csv conversion is: .csv",
@@ -1923,6 +2915,228 @@ def test_to_csv_str_xpt(tmpdir, fixture_name, expected_name, request, xpt_expect
     assert got == expected
 
 
+@pytest.mark.parametrize(
+    "fixture_name, expected_name",
+    [
+        ("sas_file_1", "file1.csv"),
+        ("sas_file_2", "file2.csv"),
+        ("sas_file_3", "file3.csv"),
+    ],
+)
+@pytest.mark.parametrize("chunksize", [1, 2, 100])
+def test_to_csv_chunksize(tmp_path, fixture_name, expected_name, chunksize, request, expected_dir):
+    sas_file = request.getfixturevalue(fixture_name)
+    converted_file = tmp_path.joinpath(expected_name)
+    expected_file = expected_dir.joinpath(expected_name)
+    converter.to_csv(sas_file, converted_file, chunksize=chunksize)
+
+    with open(expected_file) as f:
+        expected = f.read().rstrip()
+
+    with open(converted_file) as f:
+        got = f.read().rstrip()
+
+    assert got == expected
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_csv_columns(tmp_path, sas_file_1, expected_dir, chunksize):
+    converted_file = tmp_path.joinpath("file1.csv")
+    converter.to_csv(
+        sas_file_1, converted_file, chunksize=chunksize, columns=["text_row", "integer_row"]
+    )
+
+    expected = pd.read_csv(expected_dir / "file1.csv")[["text_row", "integer_row"]]
+    pd.testing.assert_frame_equal(pd.read_csv(converted_file), expected)
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_csv_where(tmp_path, sas_file_1, expected_dir, chunksize):
+    converted_file = tmp_path.joinpath("file1.csv")
+    converter.to_csv(sas_file_1, converted_file, chunksize=chunksize, where="float_row > 50")
+
+    expected = pd.read_csv(expected_dir / "file1.csv")
+    expected = expected[expected["float_row"] > 50].reset_index(drop=True)
+    pd.testing.assert_frame_equal(pd.read_csv(converted_file), expected)
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+@pytest.mark.parametrize(
+    "fixture_name, expected_name",
+    [("sas_file_1", "file1.csv"), ("sas_file_2", "file2.csv"), ("sas_file_3", "file3.csv")],
+)
+def test_to_csv_pyarrow_engine(
+    tmp_path, fixture_name, expected_name, chunksize, request, expected_dir
+):
+    sas_file = request.getfixturevalue(fixture_name)
+    converted_file = tmp_path.joinpath(expected_name)
+    converter.to_csv(sas_file, converted_file, chunksize=chunksize, engine="pyarrow")
+
+    assert converted_file.read_text() == (expected_dir / expected_name).read_text()
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_csv_pyarrow_engine_xpt(tmp_path, xpt_file_1, xpt_expected_dir, chunksize):
+    converted_file = tmp_path.joinpath("file1.csv")
+    converter.to_csv(xpt_file_1, converted_file, chunksize=chunksize, engine="pyarrow")
+
+    assert converted_file.read_text() == (xpt_expected_dir / "file1.csv").read_text()
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame(
+            {
+                "float": [
+                    1.0,
+                    -0.0,
+                    0.1,
+                    1e-5,
+                    1.5e-9,
+                    123456789012.0,
+                    1.25e15,
+                    1e16,
+                    3.3e20,
+                    float("inf"),
+                    float("-inf"),
+                    float("nan"),
+                ],
+                "text": ['a "b"', "c,d", "e\nf", "ü", None, "", "g", "h", "i", "j", "k", "l"],
+                "date": pd.to_datetime(["1960-01-01", None] + ["2020-02-29"] * 10),
+                "datetime": pd.to_datetime(
+                    ["2020-01-01 10:30:15", None] + ["0001-01-01 00:00:00"] * 10
+                ),
+            }
+        ),
+        pd.DataFrame(
+            {"ms": pd.to_datetime(["2020-01-01 10:30:15.123", "2020-01-01 00:00:00.000"])}
+        ),
+        pd.DataFrame({"mixed": ["a", 1], "float": [1.0, 2.0]}),
+        pd.DataFrame({"int": [1, 2], 3: ["a", "b"]}),
+        pd.DataFrame({"float": [], "text": []}),
+        pd.DataFrame(index=range(2)),
+    ],
+)
+def test_arrow_csv_writer_matches_pandas(tmp_path, df):
+    converted_file = tmp_path / "file.csv"
+    expected_file = tmp_path / "expected.csv"
+
+    with converter._ArrowCsvWriter(converted_file) as writer:
+        writer.write(df)
+        writer.write(df.iloc[1:])
+    with converter._CsvWriter(expected_file) as writer:
+        writer.write(df)
+        writer.write(df.iloc[1:])
+
+    assert converted_file.read_bytes() == expected_file.read_bytes()
+
+
+def test_to_csv_invalid_engine(tmp_path, sas_file_1):
+    with pytest.raises(ValueError, match="engine"):
+        converter.to_csv(sas_file_1, tmp_path / "file1.csv", engine="polars")
+
+
+def test_to_csv_pyarrow_engine_missing_pyarrow(tmp_path, sas_file_1):
+    with patch.dict(sys.modules, {"pyarrow": None}):
+        with pytest.raises(ModuleNotFoundError, match="pyarrow is required"):
+            converter.to_csv(sas_file_1, tmp_path / "file1.csv", engine="pyarrow")
+
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+@pytest.mark.parametrize("chunksize", [None, 2])
+@pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz", ZST])
+def test_to_csv_compression(tmp_path, sas_file_1, expected_dir, extension, chunksize, engine):
+    converted_file = tmp_path / f"file1.csv{extension}"
+    converter.to_csv(sas_file_1, converted_file, chunksize=chunksize, engine=engine)
+
+    assert read_compressed(converted_file) == (expected_dir / "file1.csv").read_text()
+
+
+def test_to_csv_compression_explicit(tmp_path, sas_file_1, expected_dir):
+    converter.to_csv(sas_file_1, tmp_path / "file1.csv", compression="gzip")
+    converter.to_csv(sas_file_1, tmp_path / "file2.csv.gz", compression=None)
+
+    assert (
+        gzip.decompress((tmp_path / "file1.csv").read_bytes()).decode()
+        == (expected_dir / "file1.csv").read_text()
+    )
+    assert (tmp_path / "file2.csv.gz").read_text() == (expected_dir / "file1.csv").read_text()
+
+
+def test_to_csv_invalid_compression(tmp_path, sas_file_1):
+    with pytest.raises(ValueError, match="compression"):
+        converter.to_csv(sas_file_1, tmp_path / "file1.csv", compression="zip")
+
+
+def test_to_csv_zstd_missing_zstandard(tmp_path, sas_file_1):
+    with patch.dict(sys.modules, {"zstandard": None}):
+        with pytest.raises(ModuleNotFoundError, match="zstandard is required"):
+            converter.to_csv(sas_file_1, tmp_path / "file1.csv.zst")
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_csv_zip_member(tmp_path, sas_zip_file, expected_dir, chunksize):
+    converted_file = tmp_path / "file2.csv"
+    converter.to_csv(str(sas_zip_file / "file2.sas7bdat"), converted_file, chunksize=chunksize)
+
+    assert converted_file.read_text() == (expected_dir / "file2.csv").read_text()
+
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_csv_file_object(sas_file_1, expected_dir, chunksize, engine):
+    binary = io.BytesIO()
+    text = io.StringIO()
+    converter.to_csv(sas_file_1, binary, chunksize=chunksize, engine=engine)
+    converter.to_csv(sas_file_1, text, chunksize=chunksize, engine=engine)
+
+    expected = (expected_dir / "file1.csv").read_bytes()
+    assert binary.getvalue() == expected
+    assert text.getvalue() == expected.decode()
+    assert not binary.closed
+    assert not text.closed
+
+
+@pytest.mark.parametrize(
+    "compression", ["gzip", "bz2", "xz", pytest.param("zstd", marks=requires_zstandard)]
+)
+def test_to_csv_file_object_compression(sas_file_1, expected_dir, compression):
+    decompress = {
+        "gzip": gzip.decompress,
+        "bz2": bz2.decompress,
+        "xz": lzma.decompress,
+        "zstd": lambda data: (
+            importlib.import_module("zstandard").ZstdDecompressor().decompressobj().decompress(data)
+        ),
+    }
+    converted = io.BytesIO()
+    inferred = io.BytesIO()
+    converter.to_csv(sas_file_1, converted, compression=compression)
+    converter.to_csv(sas_file_1, inferred)
+
+    expected = (expected_dir / "file1.csv").read_bytes()
+    assert decompress[compression](converted.getvalue()) == expected
+    assert inferred.getvalue() == expected
+
+
+def test_to_csv_pipe(sas_file_1, expected_dir):
+    unseekable = io.BufferedReader(UnseekableFile(sas_file_1.read_bytes()))
+    converted = io.BytesIO()
+    converter.to_csv(unseekable, converted, chunksize=2)
+
+    assert converted.getvalue() == (expected_dir / "file1.csv").read_bytes()
+
+
+def test_to_csv_chunksize_bad_file(tmp_path, bad_sas_file):
+    converted_file = tmp_path.joinpath("bad_file.csv")
+
+    with pytest.raises(Exception):  # noqa: B017
+        converter.to_csv(bad_sas_file, converted_file, chunksize=2)
+
+    assert not converted_file.exists()
+
+
 def test_to_csv_invalid_extension():
     with pytest.raises(AttributeError) as execinfo:
         converter.to_csv("test.sas7bdat", "test.bad")
@@ -1970,6 +3184,357 @@ def test_to_dataframe_sas(sas_file_1):
     pd.testing.assert_frame_equal(df, df_file)
 
 
+@pytest.mark.parametrize(
+    "fixture_name, columns",
+    [
+        ("sas_file_1", ["date_row", "text_row"]),
+        ("sas_file_2", ["text_row"]),
+        ("xpt_file_1", ["frow", "trow"]),
+    ],
+)
+@pytest.mark.parametrize("read_chunksize", [2, 100_000])
+def test_to_dataframe_columns(monkeypatch, fixture_name, columns, read_chunksize, request):
+    sas_file = request.getfixturevalue(fixture_name)
+    expected = converter.to_dataframe(sas_file)[columns]
+    monkeypatch.setattr(converter, "_DEFAULT_CHUNKSIZE", read_chunksize)
+
+    df = converter.to_dataframe(sas_file, columns=columns)
+
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_to_dataframe_missing_column(sas_file_1):
+    with pytest.raises(KeyError, match="bad_row"):
+        converter.to_dataframe(sas_file_1, columns=["text_row", "bad_row"])
+
+
+@pytest.mark.parametrize(
+    "where",
+    ["text_row.str.startswith('T')", lambda df: df["text_row"].str.startswith("T")],
+)
+@pytest.mark.parametrize("read_chunksize", [2, 100_000])
+def test_to_dataframe_where(monkeypatch, sas_file_1, where, read_chunksize):
+    full = converter.to_dataframe(sas_file_1)
+    expected = full[full["text_row"].str.startswith("T")]
+    monkeypatch.setattr(converter, "_DEFAULT_CHUNKSIZE", read_chunksize)
+
+    df = converter.to_dataframe(sas_file_1, where=where)
+
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_to_dataframe_where_no_rows(sas_file_1):
+    df = converter.to_dataframe(sas_file_1, where="integer_row > 100")
+
+    assert len(df) == 0
+    assert list(df.columns) == ["integer_row", "text_row", "float_row", "date_row"]
+
+
+@pytest.fixture
+def dataframe_cache(monkeypatch):
+    cache = converter._DataFrameCache(converter._DEFAULT_CACHE_BYTES)
+    monkeypatch.setattr(converter, "_dataframe_cache", cache)
+    return cache
+
+
+@pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz", ZST])
+@pytest.mark.parametrize("fixture_name", ["sas_file_1", "xpt_file_1"])
+def test_to_dataframe_compressed(tmp_path, fixture_name, extension, request):
+    sas_file = request.getfixturevalue(fixture_name)
+    compressed_file = write_compressed(sas_file, tmp_path / f"{sas_file.name}{extension}")
+
+    df = converter.to_dataframe(compressed_file)
+    chunks = list(converter.iter_dataframes(compressed_file, 1))
+
+    expected = converter.to_dataframe(sas_file)
+    pd.testing.assert_frame_equal(df, expected)
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+
+@pytest.mark.parametrize("source", ["file", "bytes", "bytearray", "memoryview"])
+@pytest.mark.parametrize("fixture_name", ["sas_file_1", "xpt_file_1"])
+def test_to_dataframe_file_object(fixture_name, source, request):
+    sas_file = request.getfixturevalue(fixture_name)
+    data = sas_file.read_bytes()
+    sources = {
+        "file": io.BytesIO(data),
+        "bytes": data,
+        "bytearray": bytearray(data),
+        "memoryview": memoryview(data),
+    }
+
+    expected = converter.to_dataframe(sas_file)
+    columns = list(expected.columns[:1])
+
+    df = converter.to_dataframe(sources[source])
+    chunks = list(converter.iter_dataframes(sources[source], 1, columns=columns))
+
+    pd.testing.assert_frame_equal(df, expected)
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected[columns])
+
+
+def test_to_dataframe_file_object_cache(dataframe_cache, sas_file_1):
+    with open(sas_file_1, "rb") as f:
+        df = converter.to_dataframe(f, cache=True)
+
+    pd.testing.assert_frame_equal(df, converter.to_dataframe(sas_file_1))
+    assert len(dataframe_cache._items) == 0
+
+
+@pytest.mark.parametrize("columns", [None, ["integer_row"]])
+def test_to_dataframe_zip_member(sas_zip_file, sas_file_1, columns):
+    df = converter.to_dataframe(sas_zip_file / "file1.sas7bdat", columns=columns)
+
+    pd.testing.assert_frame_equal(df, converter.to_dataframe(sas_file_1, columns=columns))
+
+
+def test_to_dataframe_zip_member_missing(sas_zip_file):
+    with pytest.raises(KeyError):
+        converter.to_dataframe(sas_zip_file / "file3.sas7bdat")
+
+
+def test_to_dataframe_zip_member_cache(dataframe_cache, disk_cache, sas_zip_file, sas_file_1):
+    zip_member = sas_zip_file / "file1.sas7bdat"
+
+    df = converter.to_dataframe(zip_member, cache=True)
+    converter.clear_cache()
+    cached = converter.to_dataframe(zip_member, cache=True)
+
+    pd.testing.assert_frame_equal(df, converter.to_dataframe(sas_file_1))
+    pd.testing.assert_frame_equal(cached, df)
+    assert len(list(disk_cache.glob("*.arrow"))) == 1
+
+
+def test_to_dataframe_cache(dataframe_cache, sas_file_1):
+    with patch.object(converter.pd, "read_sas", wraps=pd.read_sas) as read_sas:
+        first = converter.to_dataframe(sas_file_1, cache=True)
+        second = converter.to_dataframe(sas_file_1, cache=True)
+        converter.to_dataframe(sas_file_1, cache=True, columns=["text_row"])
+
+    assert read_sas.call_count == 2
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(first, converter.to_dataframe(sas_file_1))
+
+
+def test_to_dataframe_cache_copy_on_write(dataframe_cache, sas_file_1):
+    df = converter.to_dataframe(sas_file_1, cache=True)
+    df.loc[0, "integer_row"] = 100.0
+    df["new_row"] = 1
+
+    pd.testing.assert_frame_equal(
+        converter.to_dataframe(sas_file_1, cache=True), converter.to_dataframe(sas_file_1)
+    )
+
+
+def test_to_dataframe_cache_file_changed(dataframe_cache, tmp_path, sas_file_1, sas_file_2):
+    sas_file = tmp_path / "file.sas7bdat"
+    shutil.copy(sas_file_1, sas_file)
+    converter.to_dataframe(sas_file, cache=True)
+
+    shutil.copy(sas_file_2, sas_file)
+    os.utime(sas_file, ns=(time.time_ns() + 1_000_000_000,) * 2)
+
+    pd.testing.assert_frame_equal(
+        converter.to_dataframe(sas_file, cache=True), converter.to_dataframe(sas_file_2)
+    )
+    assert len(dataframe_cache._items) == 1
+
+
+def test_to_dataframe_cache_where_function(dataframe_cache, sas_file_1):
+    converter.to_dataframe(sas_file_1, cache=True, where=lambda df: df["integer_row"] > 2)
+
+    assert len(dataframe_cache._items) == 0
+
+
+@pytest.fixture
+def disk_cache(monkeypatch, tmp_path, dataframe_cache):
+    monkeypatch.setattr(converter, "_disk_cache", None)
+    cache_dir = tmp_path / "cache"
+    converter.set_disk_cache(cache_dir)
+    return cache_dir
+
+
+@pytest.mark.parametrize("fixture_name", ["sas_file_1", "sas_file_2", "xpt_file_1"])
+def test_to_dataframe_disk_cache(disk_cache, dataframe_cache, fixture_name, request):
+    sas_file = request.getfixturevalue(fixture_name)
+    expected = converter.to_dataframe(sas_file)
+    converter.to_dataframe(sas_file, cache=True)
+    dataframe_cache.clear()
+
+    with patch.object(converter.pd, "read_sas", wraps=pd.read_sas) as read_sas:
+        df = converter.to_dataframe(sas_file, cache=True)
+
+    read_sas.assert_not_called()
+    assert len(list(disk_cache.glob("*.arrow"))) == 1
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_to_dataframe_disk_cache_columns_where(disk_cache, dataframe_cache, sas_file_1):
+    converter.to_dataframe(sas_file_1, cache=True)
+    dataframe_cache.clear()
+    full = converter.to_dataframe(sas_file_1)
+
+    columns = converter.to_dataframe(sas_file_1, cache=True, columns=["text_row", "date_row"])
+    filtered = converter.to_dataframe(
+        sas_file_1, cache=True, columns=["text_row"], where="integer_row > 2"
+    )
+
+    pd.testing.assert_frame_equal(columns, full[["text_row", "date_row"]])
+    pd.testing.assert_frame_equal(filtered, full.loc[full["integer_row"] > 2, ["text_row"]])
+    with pytest.raises(KeyError, match="bad_row"):
+        converter.to_dataframe(sas_file_1, cache=True, columns=["bad_row"])
+
+
+def test_disk_cache_eviction(tmp_path):
+    cache = converter._DiskCache(tmp_path, 0)
+    df = pd.DataFrame({"a": range(10)})
+    cache.put("first", df)
+    assert list(tmp_path.iterdir()) == []
+
+    cache.max_bytes = 10**9
+    cache.put("first", df)
+    size = (tmp_path / "first.arrow").stat().st_size
+    os.utime(tmp_path / "first.arrow", ns=(1, 1))
+    cache.max_bytes = size * 2
+    cache.put("second", df)
+    cache.get("first")
+    cache.put("third", df)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["first.arrow", "third.arrow"]
+
+
+def test_fingerprint(tmp_path, sas_file_1):
+    sas_file = tmp_path / "file.sas7bdat"
+    shutil.copy(sas_file_1, sas_file)
+    fingerprint = converter._fingerprint(sas_file)
+
+    assert converter._fingerprint(sas_file_1) == fingerprint
+    with open(sas_file, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        f.write(b"\x01")
+    assert converter._fingerprint(sas_file) != fingerprint
+
+
+def test_fingerprint_middle_page(tmp_path, sas_file_1):
+    # Four 64 KiB pages, so the two in the middle are neither the first nor the last 64 KiB.
+    sas_file = tmp_path / "file.sas7bdat"
+    sas_file.write_bytes(sas_file_1.read_bytes() * 2)
+    fingerprint = converter._fingerprint(sas_file)
+
+    with open(sas_file, "r+b") as f:
+        f.seek(160_000)
+        middle = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([middle[0] ^ 0xFF]))
+    assert converter._fingerprint(sas_file) != fingerprint
+
+
+def test_set_disk_cache_off(disk_cache, dataframe_cache, sas_file_1):
+    converter.set_disk_cache(None)
+    converter.to_dataframe(sas_file_1, cache=True)
+
+    assert converter._disk_cache is None
+    assert list(disk_cache.glob("*.arrow")) == []
+
+
+def test_set_disk_cache_missing_pyarrow(monkeypatch, tmp_path):
+    monkeypatch.setattr(converter, "_disk_cache", None)
+    with patch.dict(sys.modules, {"pyarrow": None}):
+        with pytest.raises(ModuleNotFoundError, match="pyarrow is required"):
+            converter.set_disk_cache(tmp_path)
+
+
+def test_dataframe_cache_evicts_least_recently_used():
+    df = pd.DataFrame({"a": range(10)})
+    nbytes = int(df.memory_usage(deep=True).sum())
+    cache = converter._DataFrameCache(nbytes * 2)
+
+    cache.put(("a", 1, 1), df)
+    cache.put(("b", 1, 1), df)
+    assert cache.get(("a", 1, 1)) is df
+    cache.put(("c", 1, 1), df)
+
+    assert cache.get(("b", 1, 1)) is None
+    assert cache.get(("a", 1, 1)) is df
+    assert cache.get(("c", 1, 1)) is df
+
+    cache.resize(nbytes)
+    assert cache.get(("a", 1, 1)) is None
+    assert cache.get(("c", 1, 1)) is df
+
+    cache.put(("d", 1, 1), pd.DataFrame({"a": range(100)}))
+    assert cache.get(("d", 1, 1)) is None
+
+
+def test_set_cache_size_and_clear_cache(dataframe_cache, sas_file_1):
+    converter.to_dataframe(sas_file_1, cache=True)
+    assert len(dataframe_cache._items) == 1
+
+    converter.set_cache_size(0)
+    assert len(dataframe_cache._items) == 0
+    assert dataframe_cache.max_bytes == 0
+
+    converter.set_cache_size(converter._DEFAULT_CACHE_BYTES)
+    converter.to_dataframe(sas_file_1, cache=True)
+    converter.clear_cache()
+    assert len(dataframe_cache._items) == 0
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    collector = converter.MetricsCollector()
+    monkeypatch.setattr(converter, "_metrics_sink", None)
+    converter.set_metrics_sink(collector)
+    return collector
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_set_metrics_sink_to_csv(metrics, tmp_path, sas_file_1, chunksize):
+    converter.to_csv(sas_file_1, tmp_path.joinpath("file1.csv"), chunksize=chunksize)
+
+    assert set(metrics.timings) == {"read", "decode", "write"}
+    assert all(seconds > 0 for seconds in metrics.timings.values())
+    assert metrics.counts == {"rows_read": 5, "rows_written": 5}
+
+
+def test_set_metrics_sink_to_dataframe_where(metrics, sas_file_1):
+    df = converter.to_dataframe(sas_file_1, columns=["text_row"], where="integer_row > 2")
+
+    assert set(metrics.timings) == {"read", "decode", "transform"}
+    assert metrics.counts == {"rows_read": 5}
+    assert len(df) == 3
+
+
+def test_set_metrics_sink_custom(metrics, sas_file_1):
+    calls = []
+
+    class RecordingSink(converter.MetricsSink):
+        def timing(self, stage, seconds):
+            calls.append(stage)
+
+    converter.set_metrics_sink(RecordingSink())
+    converter.to_dataframe(sas_file_1)
+
+    assert calls == ["read", "decode"]
+
+    converter.set_metrics_sink(None)
+    converter.to_dataframe(sas_file_1)
+
+    assert calls == ["read", "decode"]
+    assert metrics.timings == {}
+
+
+def test_metrics_collector_reset(metrics, sas_file_1):
+    list(converter.iter_dataframes(sas_file_1, chunksize=2))
+
+    assert metrics.counts == {"rows_read": 5}
+
+    metrics.reset()
+
+    assert metrics.timings == {}
+    assert metrics.counts == {}
+
+
 def test_to_dataframe_xpt(xpt_file_1):
     d = {
         "irow": [
@@ -2069,6 +3634,48 @@ def test_to_excel_str_xpt(tmpdir, fixture_name, expected_name, request, xpt_expe
     pd.testing.assert_frame_equal(df_expected, df_converted)
 
 
+@pytest.mark.parametrize(
+    "fixture_name, expected_name, expected_dir_name",
+    [
+        ("sas_file_1", "file1.xlsx", "expected_dir"),
+        ("xpt_file_2", "file2.xlsx", "xpt_expected_dir"),
+    ],
+)
+def test_to_excel_chunksize(tmp_path, fixture_name, expected_name, expected_dir_name, request):
+    sas_file = request.getfixturevalue(fixture_name)
+    converted_file = tmp_path.joinpath(expected_name)
+    expected_file = request.getfixturevalue(expected_dir_name).joinpath(expected_name)
+    converter.to_excel(sas_file, converted_file, chunksize=1)
+
+    df_expected = pd.read_excel(expected_file, engine="openpyxl")
+    df_converted = pd.read_excel(converted_file, engine="openpyxl")
+
+    pd.testing.assert_frame_equal(df_expected, df_converted)
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_excel_split_sheets(tmp_path, monkeypatch, sas_file_1, chunksize):
+    monkeypatch.setattr(converter, "_EXCEL_MAX_ROWS", 3)
+    converted_file = tmp_path.joinpath("file1.xlsx")
+    converter.to_excel(sas_file_1, converted_file, chunksize=chunksize)
+
+    sheets = pd.read_excel(converted_file, sheet_name=None, engine="openpyxl")
+    df_expected = converter.to_dataframe(sas_file_1)
+
+    assert list(sheets) == ["Sheet1", "Sheet2", "Sheet3"]
+    assert [len(df) for df in sheets.values()] == [2, 2, 1]
+    df_converted = pd.concat(sheets.values(), ignore_index=True)
+    pd.testing.assert_frame_equal(df_converted, df_expected, check_dtype=False)
+
+
+def test_to_excel_chunksize_missing_openpyxl(tmp_path, sas_file_1):
+    with patch.dict(sys.modules, {"openpyxl": None}):
+        with pytest.raises(ModuleNotFoundError) as execinfo:
+            converter.to_excel(sas_file_1, tmp_path / "test.xlsx", chunksize=2)
+
+    assert "optional dependency openpyxl is required" in str(execinfo.value)
+
+
 def test_to_excel_missing_openpyxl(tmp_path, sas_file_1):
     with patch("pandas.DataFrame.to_excel", side_effect=ModuleNotFoundError):
         with pytest.raises(ModuleNotFoundError) as execinfo:
@@ -2077,6 +3684,17 @@ def test_to_excel_missing_openpyxl(tmp_path, sas_file_1):
     assert "optional dependency openpyxl is required" in str(execinfo.value)
 
 
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_excel_file_object(sas_file_1, expected_dir, chunksize):
+    converted = io.BytesIO()
+    converter.to_excel(sas_file_1, converted, chunksize=chunksize)
+
+    converted.seek(0)
+    pd.testing.assert_frame_equal(
+        pd.read_excel(converted), pd.read_excel(expected_dir / "file1.xlsx")
+    )
+
+
 def test_to_excel_invalid_extension():
     with pytest.raises(AttributeError) as execinfo:
         converter.to_excel("test.sas7bdat", "test.bad")
@@ -2084,6 +3702,41 @@ def test_to_excel_invalid_extension():
     assert "sas7bdat conversion error - Valid extension" in str(execinfo.value)
 
 
+@pytest.mark.parametrize("fixture_name", ["sas_file_1", "sas_file_2", "sas_file_3", "xpt_file_1"])
+@pytest.mark.parametrize("chunksize", [None, 1, 2])
+@pytest.mark.parametrize("extension", [".feather", ".arrow"])
+def test_to_feather(tmp_path, fixture_name, chunksize, extension, request):
+    sas_file = request.getfixturevalue(fixture_name)
+    converted_file = tmp_path.joinpath(f"converted{extension}")
+    converter.to_feather(sas_file, converted_file, chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(pd.read_feather(converted_file), converter.to_dataframe(sas_file))
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_feather_file_object(sas_file_1, chunksize):
+    converted = io.BytesIO()
+    converter.to_feather(sas_file_1.read_bytes(), converted, chunksize=chunksize)
+
+    converted.seek(0)
+    pd.testing.assert_frame_equal(pd.read_feather(converted), converter.to_dataframe(sas_file_1))
+
+
+def test_to_feather_invalid_extension():
+    with pytest.raises(AttributeError) as execinfo:
+        converter.to_feather("test.sas7bdat", "test.bad")
+
+    assert "sas7bdat conversion error - Valid extension" in str(execinfo.value)
+
+
+def test_to_feather_missing_pyarrow(tmp_path, sas_file_1):
+    with patch.dict(sys.modules, {"pyarrow": None}):
+        with pytest.raises(ModuleNotFoundError) as execinfo:
+            converter.to_feather(sas_file_1, tmp_path / "test.feather")
+
+    assert "optional dependency pyarrow is required" in str(execinfo.value)
+
+
 @pytest.mark.parametrize(
     "fixture_name, expected_name",
     [
@@ -2174,6 +3827,80 @@ def test_to_json_str_xpt(tmpdir, fixture_name, expected_name, request, xpt_expec
     assert got == expected
 
 
+@pytest.mark.parametrize(
+    "fixture_name, expected_name",
+    [
+        ("sas_file_1", "file1.json"),
+        ("sas_file_2", "file2.json"),
+        ("sas_file_3", "file3.json"),
+    ],
+)
+@pytest.mark.parametrize("chunksize", [1, 2, 100])
+def test_to_json_chunksize(tmp_path, fixture_name, expected_name, chunksize, request, expected_dir):
+    sas_file = request.getfixturevalue(fixture_name)
+    converted_file = tmp_path.joinpath(expected_name)
+    expected_file = expected_dir.joinpath(expected_name)
+    converter.to_json(sas_file, converted_file, chunksize=chunksize)
+
+    with open(expected_file) as f:
+        expected = json.load(f)
+
+    with open(converted_file) as f:
+        got = json.load(f)
+
+    assert got == expected
+
+
+@pytest.mark.parametrize(
+    "fixture_name, expected_name",
+    [
+        ("sas_file_1", "file1.json"),
+        ("sas_file_2", "file2.json"),
+        ("sas_file_3", "file3.json"),
+    ],
+)
+@pytest.mark.parametrize("chunksize", [None, 1, 2])
+@pytest.mark.parametrize("extension", [".json", ".jsonl", ".ndjson"])
+def test_to_json_lines(
+    tmp_path, fixture_name, expected_name, chunksize, extension, request, expected_dir
+):
+    sas_file = request.getfixturevalue(fixture_name)
+    converted_file = tmp_path.joinpath(expected_name).with_suffix(extension)
+    expected_file = expected_dir.joinpath(expected_name)
+    converter.to_json(sas_file, converted_file, chunksize=chunksize, lines=True)
+
+    with open(expected_file) as f:
+        expected_columns = json.load(f)
+    expected = [
+        {col: values[row] for col, values in expected_columns.items()}
+        for row in next(iter(expected_columns.values()))
+    ]
+
+    with open(converted_file) as f:
+        got = [json.loads(line) for line in f]
+
+    assert got == expected
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+@pytest.mark.parametrize("lines", [False, True])
+def test_to_json_compression(tmp_path, sas_file_1, chunksize, lines):
+    converter.to_json(sas_file_1, tmp_path / "file1.json", chunksize=chunksize, lines=lines)
+    converter.to_json(sas_file_1, tmp_path / "file1.json.gz", chunksize=chunksize, lines=lines)
+
+    assert read_compressed(tmp_path / "file1.json.gz") == (tmp_path / "file1.json").read_text()
+
+
+@pytest.mark.parametrize("lines", [False, True])
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_json_file_object(tmp_path, sas_file_1, chunksize, lines):
+    converted = io.StringIO()
+    converter.to_json(sas_file_1, converted, chunksize=chunksize, lines=lines)
+    converter.to_json(sas_file_1, tmp_path / "file1.json", chunksize=chunksize, lines=lines)
+
+    assert converted.getvalue() == (tmp_path / "file1.json").read_text()
+
+
 def test_to_json_invalid_extension():
     with pytest.raises(AttributeError) as execinfo:
         converter.to_json("test.sas7bdat", "test.bad")
@@ -2181,6 +3908,68 @@ def test_to_json_invalid_extension():
     assert "sas7bdat conversion error - Valid extension" in str(execinfo.value)
 
 
+@pytest.mark.parametrize(
+    "fixture_name, expected_name, expected_dir_name",
+    [
+        ("sas_file_1", "file1.parquet", "expected_dir"),
+        ("sas_file_2", "file2.parquet", "expected_dir"),
+        ("sas_file_3", "file3.parquet", "expected_dir"),
+        ("xpt_file_1", "file1.parquet", "xpt_expected_dir"),
+        ("xpt_file_2", "file2.parquet", "xpt_expected_dir"),
+    ],
+)
+@pytest.mark.parametrize("chunksize", [None, 1, 2])
+def test_to_parquet(tmp_path, fixture_name, expected_name, expected_dir_name, chunksize, request):
+    sas_file = request.getfixturevalue(fixture_name)
+    converted_file = tmp_path.joinpath(expected_name)
+    expected_file = request.getfixturevalue(expected_dir_name).joinpath(expected_name)
+    converter.to_parquet(sas_file, str(converted_file), chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(converted_file), pd.read_parquet(expected_file))
+
+
+def test_to_parquet_row_groups(tmp_path, sas_file_1):
+    converted_file = tmp_path.joinpath("file1.parquet")
+    converter.to_parquet(sas_file_1, converted_file, chunksize=2)
+
+    assert pq.ParquetFile(converted_file).num_row_groups == 3
+
+
+def test_to_parquet_pipe(sas_file_1, expected_dir):
+    # A pipe can not tell its position, which the parquet writer needs for the footer.
+    pipe = io.BytesIO()
+    pipe.tell = pipe.seek = None
+    converter.to_parquet(sas_file_1, pipe, chunksize=2)
+
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(io.BytesIO(pipe.getvalue())),
+        pd.read_parquet(expected_dir / "file1.parquet"),
+    )
+
+
+def test_to_parquet_text_file_object(sas_file_1, expected_dir):
+    # Like sys.stdout, the parquet file is written to the binary buffer of the text file.
+    stdout = io.TextIOWrapper(io.BytesIO())
+    stdout.write("text first\n")
+    converter.to_parquet(sas_file_1, stdout)
+
+    data = stdout.buffer.getvalue()
+    assert data.startswith(b"text first\n")
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(io.BytesIO(data[len("text first\n") :])),
+        pd.read_parquet(expected_dir / "file1.parquet"),
+    )
+    with pytest.raises(TypeError, match="binary file object"):
+        converter.to_parquet(sas_file_1, io.StringIO())
+
+
+def test_to_parquet_invalid_extension():
+    with pytest.raises(AttributeError) as execinfo:
+        converter.to_parquet("test.sas7bdat", "test.bad")
+
+    assert "sas7bdat conversion error - Valid extension" in str(execinfo.value)
+
+
 @pytest.mark.parametrize(
     "fixture_name, expected_name",
     [
@@ -2271,6 +4060,62 @@ def test_to_xml_str_xpt(tmpdir, fixture_name, expected_name, request, xpt_expect
     assert got == expected
 
 
+@pytest.mark.parametrize(
+    "fixture_name, expected_name",
+    [
+        ("sas_file_1", "file1.xml"),
+        ("sas_file_2", "file2.xml"),
+        ("sas_file_3", "file3.xml"),
+    ],
+)
+@pytest.mark.parametrize("chunksize", [1, 2, 100])
+def test_to_xml_chunksize(tmp_path, fixture_name, expected_name, chunksize, request, expected_dir):
+    sas_file = request.getfixturevalue(fixture_name)
+    converted_file = tmp_path.joinpath(expected_name)
+    expected_file = expected_dir.joinpath(expected_name)
+    converter.to_xml(sas_file, converted_file, chunksize=chunksize)
+
+    with open(expected_file) as f:
+        expected = f.read().rstrip()
+
+    with open(converted_file) as f:
+        got = f.read().rstrip()
+
+    assert got == expected
+
+
+@requires_zstandard
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_xml_compression(tmp_path, sas_file_1, expected_dir, chunksize):
+    converted_file = tmp_path / "file1.xml.zst"
+    converter.to_xml(sas_file_1, converted_file, chunksize=chunksize)
+
+    assert read_compressed(converted_file) == (expected_dir / "file1.xml").read_text().rstrip()
+
+
+def test_to_xml_file_object(sas_file_1, expected_dir):
+    converted = io.StringIO()
+    converter.to_xml(sas_file_1, converted, chunksize=2)
+
+    assert converted.getvalue() == (expected_dir / "file1.xml").read_text().rstrip()
+
+
+def test_to_xml_utf8_encoding(monkeypatch, tmp_path):
+    open_export = converter._open_export
+
+    def ascii_open_export(export_file, mode, compression, **kwargs):
+        # Stands in for a locale whose default encoding can not encode every value.
+        kwargs.setdefault("encoding", "ascii")
+        return open_export(export_file, mode, compression, **kwargs)
+
+    monkeypatch.setattr(converter, "_open_export", ascii_open_export)
+    converted_file = tmp_path / "file1.xml"
+    with converter._XmlWriter(converted_file, "root", "item") as writer:
+        writer.write(pd.DataFrame({"name": ["café"]}))
+
+    assert "<name>café</name>" in converted_file.read_text(encoding="utf-8")
+
+
 def test_to_xml_invalid_extension():
     with pytest.raises(AttributeError) as execinfo:
         converter.to_xml("test.sas7bdat", "test.bad")
@@ -2304,6 +4149,21 @@ def test_raise_on_invalid_file_dict_error(file_dict):
     assert "Invalid key" in str(execinfo.value)
 
 
+def test_decode_strings():
+    df = pd.DataFrame(
+        {
+            "text": [b"Some text", "été".encode(), None],
+            "number": [1.0, 2.0, 3.0],
+        }
+    )
+
+    got = converter._decode_strings(df)
+
+    assert got["text"].tolist()[:2] == ["Some text", "été"]
+    assert pd.isna(got["text"].iloc[2])
+    assert got["number"].tolist() == [1.0, 2.0, 3.0]
+
+
 @pytest.mark.parametrize(
     "path, expected", [(Path("test/path"), str(Path("test/path"))), ("test/path", "test/path")]
 )
@@ -2342,3 +4202,27 @@ def test_walk_dir_xpt(tmpdir, xpt_dir, file_type):
     )
 
     assert xpt_counter == convert_counter
+
+
+def test_write_xml_rows(monkeypatch):
+    monkeypatch.setattr(converter, "_XML_WRITE_ROWS", 2)
+    df = pd.DataFrame(
+        {
+            "number": [1.0, 2.5, float("nan")],
+            "text": ["a < b", "Tom & Jerry", "plain"],
+            "date": pd.to_datetime(["2018-01-02", "2018-02-05", None]),
+        }
+    )
+    f = io.StringIO()
+
+    converter._write_xml_rows(f, df, "row")
+
+    expected = "".join(
+        f"\n  <row>\n    <number>{number}</number>\n    <text>{text}</text>\n    <date>{date}</date>\n  </row>"  # noqa: E501
+        for number, text, date in [
+            ("1.0", "a &lt; b", "2018-01-02 00:00:00"),
+            ("2.5", "Tom &amp; Jerry", "2018-02-05 00:00:00"),
+            ("nan", "plain", "NaT"),
+        ]
+    )
+    assert f.getvalue() == expected